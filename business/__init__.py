@@ -5,4 +5,13 @@ from .business_exceptions import NoRemnantsError
 from .cutting import Cutting
 from .quick_cutting import QuickCutting
 from .middle_cutting import MiddleCutting
+from .column_cutting import ColumnCutting
+from .fast_cutting import FastCutting
+from .annealing_cutting import AnnealingCutting
 from .cut_scheme import CutScheme, WrongSchemeError
+from .remnant_inventory import RemnantInventory
+from .product_multiset import ProductMultiset
+from .local_search import LocalSearch
+from .portfolio_cutting import PortfolioCutting, PortfolioEntry
+from .presolve_cutting import PresolveCutting
+from .order import Order, OrderReport
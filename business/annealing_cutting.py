@@ -0,0 +1,444 @@
+"""Модуль, отвечающий за работу алгоритма AnnealingCutting"""
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional
+
+from business.cutting import Cutting
+from business.business_exceptions import NoRemnantsError
+from business.cut_scheme import CutScheme
+from business.capacity_tree import CapacityTree
+
+# Задача отжига в процессе-исполнителе (задается при запуске процесса)
+_worker_annealer: Optional['_Annealer'] = None
+
+
+def _init_worker(annealer: '_Annealer') -> None:
+    """
+    Функция запускается в каждом процессе-исполнителе и сохраняет задачу отжига
+    :param annealer: Задача отжига
+    :type annealer: _Annealer
+    :return: None
+    """
+    global _worker_annealer
+    _worker_annealer = annealer
+
+
+def _run_island(assignment: list[list[int]], seed: str, start: float, stop: float,
+                seconds: float) -> tuple[list[list[int]], float, list[list[int]], float]:
+    """
+    Функция выполняет одну эпоху отжига острова в процессе-исполнителе
+    :param assignment: Изделия (веса) в каждом профиле
+    :type assignment: list[list[int]]
+    :param seed: Зерно генератора случайных чисел
+    :type seed: str
+    :param start: Доля бюджета времени, прошедшая к началу эпохи
+    :type start: float
+    :param stop: Доля бюджета времени, которая пройдет к концу эпохи
+    :type stop: float
+    :param seconds: Длительность эпохи в секундах
+    :type seconds: float
+    :return: Текущее решение, его энергия, лучшее решение за эпоху и его энергия
+    :rtype: tuple[list[list[int]], float, list[list[int]], float]
+    """
+    return _worker_annealer.run(assignment, seed, start, stop, seconds)
+
+
+class _Annealer:
+    """
+    Имитация отжига над распределением изделий по профилям. Решение - список весов изделий для каждого профиля
+    (остатки и цельные профили по одному). Энергия профиля - отход (остаток короче минимального) плюс доля цены
+    профиля, поэтому лишние цельные профили не используются. Ход - перенос изделия в другой профиль или обмен
+    изделиями двух профилей; изменение энергии считается только по двум затронутым профилям
+    """
+    STOCK_WEIGHT: float = 0.05  # Какая доля цены профиля добавляется к энергии, если профиль используется
+    NEW_SLOT_PROBABILITY: float = 0.1  # Вероятность перенести изделие в случайный (возможно, пустой) профиль
+    TIME_CHECK: int = 256  # Время и температура пересчитываются раз в столько итераций
+
+    def __init__(self, capacities: list[int], costs: list[float], kerf: int, min_rest: int,
+                 initial_temperature: float, final_temperature: float) -> None:
+        self.capacities: list[int] = capacities
+        self.costs: list[float] = costs
+        self.kerf: int = kerf
+        self.min_rest: int = min_rest
+        self.initial_temperature: float = initial_temperature
+        self.final_temperature: float = final_temperature
+
+    def energy(self, slot: int, used: int, number: int) -> float:
+        """
+        Метод считает энергию профиля
+        :param slot: Номер профиля
+        :type slot: int
+        :param used: Суммарный вес изделий в профиле
+        :type used: int
+        :param number: Количество изделий в профиле
+        :type number: int
+        :return: Энергия профиля (неиспользованный профиль - 0)
+        :rtype: float
+        """
+        if number == 0:
+            return 0.0
+
+        leftover: int = self.capacities[slot] - used - self.kerf
+        return (leftover if leftover < self.min_rest else 0) + self.STOCK_WEIGHT * self.costs[slot]
+
+    def total_energy(self, assignment: list[list[int]]) -> float:
+        """
+        Метод считает энергию решения
+        :param assignment: Изделия (веса) в каждом профиле
+        :type assignment: list[list[int]]
+        :return: Энергия решения
+        :rtype: float
+        """
+        return sum(self.energy(slot, sum(pieces), len(pieces)) for slot, pieces in enumerate(assignment))
+
+    def run(self, assignment: list[list[int]], seed: str, start: float, stop: float,
+            seconds: float) -> tuple[list[list[int]], float, list[list[int]], float]:
+        """
+        Метод выполняет отжиг в течение seconds секунд. Температура убывает геометрически по доле
+        всего бюджета времени, поэтому эпохи разных островов охлаждаются одинаково
+        :param assignment: Изделия (веса) в каждом профиле
+        :type assignment: list[list[int]]
+        :param seed: Зерно генератора случайных чисел
+        :type seed: str
+        :param start: Доля бюджета времени, прошедшая к началу эпохи
+        :type start: float
+        :param stop: Доля бюджета времени, которая пройдет к концу эпохи
+        :type stop: float
+        :param seconds: Длительность эпохи в секундах
+        :type seconds: float
+        :return: Текущее решение, его энергия, лучшее решение за эпоху и его энергия
+        :rtype: tuple[list[list[int]], float, list[list[int]], float]
+        """
+        generator: random.Random = random.Random(seed)
+        pieces: list[list[int]] = [list(slot_pieces) for slot_pieces in assignment]
+        used: list[int] = [sum(slot_pieces) for slot_pieces in pieces]
+        scores: list[float] = [self.energy(slot, used[slot], len(pieces[slot])) for slot in range(len(pieces))]
+        energy: float = sum(scores)
+        best: list[list[int]] = [list(slot_pieces) for slot_pieces in pieces]
+        best_energy: float = energy
+
+        # Занятые профили - для выбора случайного занятого профиля за O(1)
+        busy: list[int] = [slot for slot in range(len(pieces)) if pieces[slot]]
+        positions: dict[int, int] = {slot: position for position, slot in enumerate(busy)}
+
+        begin: float = time.perf_counter()
+        temperature: float = self.initial_temperature
+        iteration: int = 0
+        while busy:
+            if iteration % self.TIME_CHECK == 0:
+                elapsed: float = time.perf_counter() - begin
+                if elapsed >= seconds:
+                    break
+                progress: float = start + (stop - start) * elapsed / seconds
+                temperature = self.initial_temperature * (
+                    self.final_temperature / self.initial_temperature) ** progress
+            iteration += 1
+
+            source: int = busy[generator.randrange(len(busy))]
+            index: int = generator.randrange(len(pieces[source]))
+            weight: int = pieces[source][index]
+            target: int = (generator.randrange(len(pieces)) if generator.random() < self.NEW_SLOT_PROBABILITY
+                           else busy[generator.randrange(len(busy))])
+            if target == source:
+                continue
+
+            if not pieces[target] or generator.random() < 0.5:
+                # Перенос изделия
+                if used[target] + weight > self.capacities[target]:
+                    continue
+                new_source: float = self.energy(source, used[source] - weight, len(pieces[source]) - 1)
+                new_target: float = self.energy(target, used[target] + weight, len(pieces[target]) + 1)
+                delta: float = new_source + new_target - scores[source] - scores[target]
+                if delta > 0 and generator.random() >= math.exp(-delta / temperature):
+                    continue
+
+                pieces[source][index] = pieces[source][-1]
+                pieces[source].pop()
+                if not pieces[target]:
+                    positions[target] = len(busy)
+                    busy.append(target)
+                pieces[target].append(weight)
+                if not pieces[source]:
+                    # Освободившийся профиль убирается из списка занятых перестановкой с последним
+                    position: int = positions.pop(source)
+                    last: int = busy.pop()
+                    if last != source:
+                        busy[position] = last
+                        positions[last] = position
+                used[source] -= weight
+                used[target] += weight
+            else:
+                # Обмен изделиями разного веса
+                other_index: int = generator.randrange(len(pieces[target]))
+                difference: int = pieces[target][other_index] - weight
+                if (difference == 0 or used[source] + difference > self.capacities[source]
+                        or used[target] - difference > self.capacities[target]):
+                    continue
+                new_source = self.energy(source, used[source] + difference, len(pieces[source]))
+                new_target = self.energy(target, used[target] - difference, len(pieces[target]))
+                delta = new_source + new_target - scores[source] - scores[target]
+                if delta > 0 and generator.random() >= math.exp(-delta / temperature):
+                    continue
+
+                pieces[source][index] = pieces[target][other_index]
+                pieces[target][other_index] = weight
+                used[source] += difference
+                used[target] -= difference
+
+            scores[source] = new_source
+            scores[target] = new_target
+            energy += delta
+            if energy < best_energy:
+                best_energy = energy
+                best = [list(slot_pieces) for slot_pieces in pieces]
+
+        return pieces, energy, best, best_energy
+
+
+class AnnealingCutting(Cutting):
+    """
+    Класс рассчитывает распил имитацией отжига для нарядов среднего размера, где точный перебор слишком долгий,
+    а жадный распил дает большой отход. Несколько островов (независимых отжигов) стартуют с разных распилов
+    "первый подходящий" и работают эпохами; после каждой эпохи остров получает лучшее решение соседа
+    по кольцу, если оно лучше его текущего. Весь расчет укладывается в time_budget секунд
+
+    Args:
+        islands (int) - Количество островов
+        workers (int) - Количество процессов для островов. Если меньше 2 - острова считаются по очереди
+        в одном процессе
+        migration_interval (float) - Длительность эпохи в секундах, после нее острова обмениваются решениями
+        seed (int) - Зерно генератора случайных чисел. Зерно задает начальные решения островов и случайные ходы,
+        но эпохи и температура зависят от времени, поэтому результат воспроизводится только до начала отжига
+        Остальные аргументы - как у Cutting. Если time_budget равен None, на расчет отводится DEFAULT_BUDGET секунд
+    """
+    __name__ = 'AnnealingCutting'
+    DEFAULT_BUDGET: float = 2.0
+    FINAL_TEMPERATURE: float = 0.5  # В единицах разрешения
+
+    def __init__(self, *, islands: int = 4, workers: int = 0, migration_interval: float = 0.5, seed: int = 0,
+                 **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.__islands: int = max(1, islands)
+        self.__workers: int = workers
+        self.__migration_interval: float = migration_interval
+        self.__seed: int = seed
+
+    @property
+    def islands(self) -> int:
+        """Геттер для self.__islands"""
+        return self.__islands
+
+    @property
+    def workers(self) -> int:
+        """Геттер для self.__workers"""
+        return self.__workers
+
+    @property
+    def seed(self) -> int:
+        """Геттер для self.__seed"""
+        return self.__seed
+
+    def __str__(self) -> str:
+        return ('Данный метод улучшает распил имитацией отжига: изделия переносятся между профилями и меняются '
+                'местами, несколько независимых расчетов обмениваются лучшими распилами')
+
+    def input_params(self) -> dict:
+        """
+        Метод возвращает входные данные расчета, включая параметры отжига, которые влияют на результат
+        :return: Словарь с входными данными
+        :rtype: dict
+        """
+        params: dict = super().input_params()
+        params.update(islands=self.__islands, migration_interval=self.__migration_interval, seed=self.__seed)
+        return params
+
+    def cut(self) -> CutScheme:
+        """
+        Метод для расчета распила имитацией отжига на нескольких островах
+        :raise NoRemnantError: Если распил "первый подходящий по убыванию" не помещает все изделия
+        :return: Распил. Имеет тип словаря, ключи - кортежи, где первый элемент - длина остатка,
+        второй - количество остатков данной длины. Значения словаря - список списков изделий для одного такого остатка
+        :rtype: dict[tuple[float, int], list[list[float]]]
+        """
+        self.reset_search()
+        begin: float = time.perf_counter()
+        budget: float = self.DEFAULT_BUDGET if self.time_budget is None else self.time_budget
+
+        # Профили по возрастанию длины, как в FastCutting: остатки бесплатны, цельные профили - по цене.
+        # Остатки и цельные профили одной длины попадают в схему под одним ключом, как в RemnantInventory
+        totals: dict[float, int] = {length: number for length, number in self.remnant_counts.items()
+                                    if self.min_product is not None and length >= self.min_product}
+        for length, number, _ in self.whole_profiles:
+            totals[length] = totals.get(length, 0) + number
+        slots: list[tuple[tuple[float, int], float]] = [
+            ((length, totals[length]), 0.0) for length, number in sorted(self.remnant_counts.items())
+            if self.min_product is not None and length >= self.min_product for _ in range(number)]
+        slots.extend(((length, totals[length]), price) for length, number, price in self.whole_profiles
+                     for _ in range(number))
+        slots.sort(key=lambda slot: slot[0][0])
+        capacities: list[int] = [self.to_units(key[0]) + self.int_cutting_width for key, _ in slots]
+        lengths: dict[int, float] = {self.to_units(product) + self.int_cutting_width: product
+                                     for product in self.product_counts}
+        weights: list[int] = sorted((self.to_units(product) + self.int_cutting_width
+                                     for product, number in self.product_counts.items() for _ in range(number)),
+                                    reverse=True)
+
+        # Первый остров стартует с "первого подходящего по убыванию", остальные - с перемешанных изделий
+        first_assignment: Optional[list[list[int]]] = self.__first_fit(capacities, weights)
+        if first_assignment is None:
+            raise NoRemnantsError(title='Не хватает остатков и цельных профилей',
+                                  cut_scheme=self.__make_scheme(slots, self.__partial_fit(capacities, weights),
+                                                                lengths))
+
+        currents: list[list[list[int]]] = [first_assignment]
+        for island in range(1, self.__islands):
+            shuffled: list[int] = list(weights)
+            random.Random(f'{self.__seed}:{island}').shuffle(shuffled)
+            assignment: Optional[list[list[int]]] = self.__first_fit(capacities, shuffled)
+            currents.append(assignment if assignment is not None else [list(pieces) for pieces in first_assignment])
+
+        annealer: _Annealer = _Annealer(
+            capacities=capacities, costs=[self.to_units(key[0]) * price for key, price in slots],
+            kerf=self.int_cutting_width, min_rest=self.int_min_rest_length,
+            initial_temperature=max(self.FINAL_TEMPERATURE, 0.1 * sum(weights) / max(1, len(weights))),
+            final_temperature=self.FINAL_TEMPERATURE)
+        bests: list[list[list[int]]] = [[list(pieces) for pieces in assignment] for assignment in currents]
+        best_energies: list[float] = [annealer.total_energy(assignment) for assignment in currents]
+
+        if self.__workers < 2:
+            self.__anneal(annealer, currents, bests, best_energies, begin, budget, executor=None)
+        else:
+            with ProcessPoolExecutor(max_workers=self.__workers, initializer=_init_worker,
+                                     initargs=(annealer,)) as executor:
+                self.__anneal(annealer, currents, bests, best_energies, begin, budget, executor=executor)
+
+        best_island: int = min(range(self.__islands), key=lambda island: best_energies[island])
+        return self.__make_scheme(slots, bests[best_island], lengths)
+
+    def __anneal(self, annealer: _Annealer, currents: list[list[list[int]]], bests: list[list[list[int]]],
+                 best_energies: list[float], begin: float, budget: float,
+                 executor: Optional[ProcessPoolExecutor]) -> None:
+        """
+        Метод выполняет эпохи отжига на всех островах до конца бюджета времени. Списки currents, bests
+        и best_energies обновляются на месте
+        :param annealer: Задача отжига
+        :type annealer: _Annealer
+        :param currents: Текущие решения островов
+        :type currents: list[list[list[int]]]
+        :param bests: Лучшие решения островов
+        :type bests: list[list[list[int]]]
+        :param best_energies: Энергии лучших решений островов
+        :type best_energies: list[float]
+        :param begin: Время начала расчета (time.perf_counter())
+        :type begin: float
+        :param budget: Бюджет времени в секундах
+        :type budget: float
+        :param executor: Пул процессов для островов или None, если острова считаются по очереди
+        :type executor: Optional[ProcessPoolExecutor]
+        :return: None
+        """
+        epoch: int = 0
+        while True:
+            elapsed: float = time.perf_counter() - begin
+            if elapsed >= budget:
+                break
+            duration: float = min(self.__migration_interval, budget - elapsed)
+            start: float = elapsed / budget
+            stop: float = min(1.0, (elapsed + duration) / budget)
+            seeds: list[str] = [f'{self.__seed}:{island}:{epoch}' for island in range(self.__islands)]
+
+            if executor is None:
+                # В одном процессе острова делят эпоху между собой
+                results = [annealer.run(current, seed, start, stop, duration / self.__islands)
+                           for current, seed in zip(currents, seeds)]
+            else:
+                results = list(executor.map(_run_island, currents, seeds, repeat(start), repeat(stop),
+                                            repeat(duration)))
+
+            current_energies: list[float] = list()
+            for island, (current, energy, best, best_energy) in enumerate(results):
+                currents[island] = current
+                current_energies.append(energy)
+                if best_energy < best_energies[island]:
+                    bests[island] = best
+                    best_energies[island] = best_energy
+
+            # Миграция по кольцу: остров получает лучшее решение соседа, если оно лучше его текущего
+            neighbours: list[tuple[list[list[int]], float]] = [
+                (bests[island - 1], best_energies[island - 1]) for island in range(self.__islands)]
+            for island, (best, best_energy) in enumerate(neighbours):
+                if best_energy < current_energies[island]:
+                    currents[island] = [list(pieces) for pieces in best]
+            epoch += 1
+
+    @classmethod
+    def __first_fit(cls, capacities: list[int], weights: list[int]) -> Optional[list[list[int]]]:
+        """
+        Метод раскладывает изделия по порядку в первый профиль, где для них хватает места
+        :param capacities: Вместимости профилей
+        :type capacities: list[int]
+        :param weights: Веса изделий в порядке раскладки
+        :type weights: list[int]
+        :return: Изделия (веса) в каждом профиле или None, если какое-то изделие не поместилось
+        :rtype: Optional[list[list[int]]]
+        """
+        tree: CapacityTree = CapacityTree(capacities)
+        assignment: list[list[int]] = [list() for _ in capacities]
+        for weight in weights:
+            slot: Optional[int] = tree.first_fit(weight)
+            if slot is None:
+                return None
+            tree.take(slot, weight)
+            assignment[slot].append(weight)
+        return assignment
+
+    @classmethod
+    def __partial_fit(cls, capacities: list[int], weights: list[int]) -> list[list[int]]:
+        """
+        Метод раскладывает изделия как __first_fit, но пропускает изделия, которые не поместились
+        :param capacities: Вместимости профилей
+        :type capacities: list[int]
+        :param weights: Веса изделий в порядке раскладки
+        :type weights: list[int]
+        :return: Изделия (веса) в каждом профиле
+        :rtype: list[list[int]]
+        """
+        tree: CapacityTree = CapacityTree(capacities)
+        assignment: list[list[int]] = [list() for _ in capacities]
+        for weight in weights:
+            slot: Optional[int] = tree.first_fit(weight)
+            if slot is not None:
+                tree.take(slot, weight)
+                assignment[slot].append(weight)
+        return assignment
+
+    def __make_scheme(self, slots: list[tuple[tuple[float, int], float]], assignment: list[list[int]],
+                      lengths: dict[int, float]) -> CutScheme:
+        """
+        Метод переводит распределение изделий по профилям в схему распила
+        :param slots: Ключ схемы и цена для каждого профиля
+        :type slots: list[tuple[tuple[float, int], float]]
+        :param assignment: Изделия (веса) в каждом профиле
+        :type assignment: list[list[int]]
+        :param lengths: Длина изделия для каждого веса
+        :type lengths: dict[int, float]
+        :return: Схема распила
+        :rtype: CutScheme
+        """
+        cutting_scheme: dict[tuple[float, int], list[list[float]]] = dict()
+        for (key, _), pieces in zip(slots, assignment):
+            if pieces:
+                cutting_scheme.setdefault(key, list()).append(
+                    sorted((lengths[weight] for weight in pieces), reverse=True))
+
+        # Отжиг не доказывает оптимальность, а результат зависит от времени расчета, поэтому схема
+        # не помечается как оптимальная (и не попадает в ResultCache)
+        beautiful_scheme: CutScheme = CutScheme(
+            cut_scheme=cutting_scheme, min_remnant=self.min_rest_length, cut_width=self.cutting_width,
+            products=self.product_counts, remnants=self.remnant_counts, resolution=self.resolution,
+            proven={key: [False] * len(cuttings) for key, cuttings in cutting_scheme.items()})
+        beautiful_scheme.restore_order()
+        return beautiful_scheme
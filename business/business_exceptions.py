@@ -25,3 +25,21 @@ class NoRemnantsError(Exception):
         return (f'Для данного списка изделий не хватает имеющихся остатков и цельных профилей!\n'
                 f'Список изделий: {self.cut_scheme.products}\nСписок остатков: {self.cut_scheme.remnants}\n'
                 f'Схема распила:\n{self.cut_scheme.__str__()}')
+
+
+class SearchTimeoutError(Exception):
+    """
+    Класс - исключение. Выбрасывается внутри поиска распила, когда истекло отведенное на расчет время.
+    Перехватывается в Cutting.calculate_min_waste, наружу не выходит
+    """
+    def __str__(self) -> str:
+        return 'Время на поиск распила истекло'
+
+
+class SearchMemoryError(Exception):
+    """
+    Класс - исключение. Выбрасывается внутри поиска распила, когда стек поиска превысил допустимый размер.
+    Перехватывается в Cutting.calculate_min_waste, наружу не выходит
+    """
+    def __str__(self) -> str:
+        return 'Превышен допустимый размер стека поиска распила'
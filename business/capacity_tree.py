@@ -0,0 +1,64 @@
+"""Модуль с деревом отрезков по свободной длине профилей"""
+from typing import Optional
+
+
+class CapacityTree:
+    """
+    Класс хранит свободную длину каждого профиля в дереве отрезков (в узле - максимум по поддереву).
+    Поиск первого профиля, в котором помещается изделие, и уменьшение свободной длины выполняются за O(log n)
+
+    Args:
+        capacities (list[int]) - Свободные длины профилей в единицах разрешения
+    """
+    def __init__(self, capacities: list[int]) -> None:
+        self.__size: int = 1
+        while self.__size < len(capacities):
+            self.__size <<= 1
+
+        # Листья лежат в конце массива, узел i - максимум по узлам 2i и 2i+1
+        self.__tree: list[int] = [-1] * (2 * self.__size)
+        self.__tree[self.__size:self.__size + len(capacities)] = capacities
+        for node in range(self.__size - 1, 0, -1):
+            self.__tree[node] = max(self.__tree[2 * node], self.__tree[2 * node + 1])
+
+    def capacity(self, slot: int) -> int:
+        """
+        Метод возвращает свободную длину профиля
+        :param slot: Номер профиля
+        :type slot: int
+        :return: Свободная длина
+        :rtype: int
+        """
+        return self.__tree[self.__size + slot]
+
+    def first_fit(self, weight: int) -> Optional[int]:
+        """
+        Метод ищет профиль с наименьшим номером, в котором свободная длина не меньше weight
+        :param weight: Необходимая длина
+        :type weight: int
+        :return: Номер профиля или None, если изделие не помещается ни в один профиль
+        :rtype: Optional[int]
+        """
+        if self.__tree[1] < weight:
+            return None
+
+        node: int = 1
+        while node < self.__size:
+            node = 2 * node if self.__tree[2 * node] >= weight else 2 * node + 1
+        return node - self.__size
+
+    def take(self, slot: int, weight: int) -> None:
+        """
+        Метод уменьшает свободную длину профиля
+        :param slot: Номер профиля
+        :type slot: int
+        :param weight: На сколько уменьшить
+        :type weight: int
+        :return: None
+        """
+        node: int = self.__size + slot
+        self.__tree[node] -= weight
+        node >>= 1
+        while node:
+            self.__tree[node] = max(self.__tree[2 * node], self.__tree[2 * node + 1])
+            node >>= 1
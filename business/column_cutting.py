@@ -0,0 +1,284 @@
+"""Модуль, отвечающий за работу алгоритма ColumnCutting"""
+import math
+from typing import Optional
+
+from business.cutting import Cutting
+from business.business_exceptions import NoRemnantsError
+from business.cut_scheme import CutScheme
+from business.simplex import Simplex
+from business.product_multiset import ProductMultiset
+
+
+class ColumnCutting(Cutting):
+    """
+    Класс рассчитывает распил всего наряда сразу методом генерации столбцов. Главная задача - линейная программа,
+    где переменные - количества распилов по каждой схеме, ограничения - потребность в изделиях и количество остатков.
+    Новые схемы распила находятся задачей о рюкзаке по двойственным оценкам изделий. Дробное решение округляется вниз,
+    а недостающие изделия распиливаются так же, как в MiddleCutting. Значение линейной программы - нижняя оценка
+    стоимости материала (длина, умноженная на цену за метр), которую нельзя улучшить никаким распилом
+    """
+    __name__ = 'ColumnCutting'
+    MAX_ITERATIONS: int = 500  # Максимальное количество итераций генерации столбцов
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.__lower_bound: Optional[float] = None
+
+    @property
+    def lower_bound(self) -> Optional[float]:
+        """
+        Нижняя оценка стоимости использованных остатков и целых профилей (длина в метрах, умноженная на цену
+        за метр; при цене 1 - суммарная длина), полученная в последнем расчете.
+        None, если расчет не проводился, генерация столбцов не завершилась (истекло время или количество итераций)
+        или остатков не хватает даже в дробном решении
+        """
+        return self.__lower_bound
+
+    def __str__(self) -> str:
+        return ('Данный метод рассчитывает распил всего наряда сразу: подбирает набор схем распила,'
+                ' при котором стоимость использованного материала минимальна')
+
+    def cut(self) -> CutScheme:
+        """
+        Метод для расчета распила. Данный метод решает задачу раскроя для всего наряда сразу методом генерации
+        столбцов, затем округляет решение и распиливает оставшиеся изделия
+        :raise NoRemnantError: Если остатков и целых профилей не хватит на изделия
+        :return: Распил. Имеет тип словаря, ключи - кортежи, где первый элемент - длина остатка,
+        второй - количество остатков данной длины. Значения словаря - список списков изделий для одного такого остатка
+        :rtype: dict[tuple[float, int], list[list[float]]]
+        """
+        self.reset_search()
+        self.__lower_bound = None
+
+        # Различные длины изделий (по убыванию) и виды материала: остатки и целые профили
+        lengths: dict[int, float] = {self.to_units(product): product for product in self.product_counts}
+        demand: list[tuple[int, int]] = sorted(
+            ((self.to_units(length), number) for length, number in self.product_counts.items()), reverse=True)
+        # Остатки и цельные профили одной длины - один вид материала с наименьшей ценой, как в RemnantInventory.
+        # Остаток стоит как самый дешевый цельный профиль, поэтому при одинаковых ценах минимизируется длина
+        remnant_price: float = min((price for _, _, price in self.whole_profiles), default=1.0)
+        totals: dict[float, tuple[int, float]] = {
+            length: (number, remnant_price) for length, number in self.remnant_counts.items()
+            if self.min_product is not None and length >= self.min_product}
+        for length, number, price in self.whole_profiles:
+            total, total_price = totals.get(length, (0, price))
+            totals[length] = (total + number, min(total_price, price))
+        stocks: list[tuple[float, int]] = sorted((length, number) for length, (number, _) in totals.items())
+        prices: list[float] = [totals[length][1] for length, _ in stocks]
+
+        # 1) Решим линейную программу и округлим решение вниз
+        bars: list[tuple[int, list[int]]] = self.__round_down(
+            demand, stocks, self.__solve_master(demand, stocks, prices))
+
+        # 2) Уберем лишние изделия, которые могли появиться из-за ограничений ">="
+        for index, (units, number) in enumerate(demand):
+            excess: int = sum(counts[index] for _, counts in bars) - number
+            for _, counts in reversed(bars):
+                if excess <= 0:
+                    break
+                removed: int = min(excess, counts[index])
+                counts[index] -= removed
+                excess -= removed
+
+        # 3) Переведем схемы в списки длин
+        cutting_scheme: dict[tuple[float, int], list[list[float]]] = dict()
+        proven_scheme: dict[tuple[float, int], list[bool]] = dict()
+        used: list[int] = [0 for _ in stocks]
+        residual: ProductMultiset = ProductMultiset.from_counts(self.product_counts)
+
+        for stock_index, counts in bars:
+            cutting: list[float] = list()
+            for (units, _), number in zip(demand, counts):
+                cutting.extend([lengths[units]] * number)
+            if cutting:
+                cutting_scheme.setdefault(stocks[stock_index], list()).append(cutting)
+                # Округление решения линейной программы не доказывает оптимальность распила
+                proven_scheme.setdefault(stocks[stock_index], list()).append(False)
+                used[stock_index] += 1
+                residual.remove(cutting)
+
+        # 4) Оставшиеся изделия распилим по очереди, выбирая материал с наименьшим отходом, а при равном
+        # отходе - с наименьшей ценой, как в MiddleCutting
+        while residual:
+            min_score: Optional[tuple[float, float]] = None
+            best_stock: Optional[int] = None
+            best_cutting: list[float] = list()
+            best_proven: bool = True
+
+            for stock_index, (length, number) in enumerate(stocks):
+                if used[stock_index] >= number or length < residual.minimum:
+                    continue
+                current_cutting: list[float] = self.calculate_min_waste(length, residual)
+                waste: float = length - sum(current_cutting) - len(current_cutting) * self.cutting_width
+                score: tuple[float, float] = (waste, length * prices[stock_index])
+                if current_cutting and (min_score is None or score < min_score):
+                    min_score = score
+                    best_stock = stock_index
+                    best_cutting = current_cutting
+                    best_proven = self.last_pattern_proven
+
+            if best_stock is None:
+                beautiful_scheme: CutScheme = CutScheme(
+                    cut_scheme=cutting_scheme, min_remnant=self.min_rest_length, cut_width=self.cutting_width,
+                    products=self.product_counts, remnants=self.remnant_counts, proven=proven_scheme,
+                    resolution=self.resolution)
+                beautiful_scheme.restore_order()
+                raise NoRemnantsError(title='Не хватает остатков и цельных профилей', cut_scheme=beautiful_scheme)
+
+            cutting_scheme.setdefault(stocks[best_stock], list()).append(best_cutting)
+            proven_scheme.setdefault(stocks[best_stock], list()).append(best_proven)
+            used[best_stock] += 1
+            residual.remove(best_cutting)
+
+        beautiful_scheme: CutScheme = CutScheme(
+            cut_scheme=cutting_scheme, min_remnant=self.min_rest_length, cut_width=self.cutting_width,
+            products=self.product_counts, remnants=self.remnant_counts, proven=proven_scheme,
+            resolution=self.resolution)
+        beautiful_scheme.restore_order()
+        return beautiful_scheme
+
+    def __solve_master(self, demand: list[tuple[int, int]], stocks: list[tuple[float, int]],
+                       prices: list[float]) -> list[tuple[int, tuple[int, ...], float]]:
+        """
+        Метод решает линейную программу раскроя методом генерации столбцов. Стоимость профиля - его длина
+        в единицах разрешения, умноженная на цену за метр
+        :param demand: Различные длины изделий в единицах разрешения и их количества
+        :type demand: list[tuple[int, int]]
+        :param stocks: Виды материала: длина и количество
+        :type stocks: list[tuple[float, int]]
+        :param prices: Цена за метр каждого вида материала
+        :type prices: list[float]
+        :return: Схемы распила с дробными количествами: номер вида материала, количества изделий, значение переменной
+        :rtype: list[tuple[int, tuple[int, ...], float]]
+        """
+        if not stocks or not demand:
+            return list()
+
+        weights: list[int] = [units + self.int_cutting_width for units, _ in demand]
+        capacities: list[int] = [self.to_units(length) + self.int_cutting_width for length, _ in stocks]
+        costs: list[float] = [self.to_units(length) * price for (length, _), price in zip(stocks, prices)]
+
+        simplex: Simplex = Simplex(
+            senses=['>='] * len(demand) + ['<='] * len(stocks),
+            rhs=[float(number) for _, number in demand] + [float(number) for _, number in stocks])
+        columns: list[tuple[int, tuple[int, ...]]] = list()
+
+        def add_column(stock_index: int, counts: tuple[int, ...]) -> None:
+            stock_part: list[float] = [1.0 if index == stock_index else 0.0 for index in range(len(stocks))]
+            simplex.add_column(float(costs[stock_index]), [float(count) for count in counts] + stock_part)
+            columns.append((stock_index, counts))
+
+        # Начальные столбцы - однородные схемы на самом длинном материале
+        longest: int = max(range(len(stocks)), key=lambda index: capacities[index])
+        for index, (weight, (_, number)) in enumerate(zip(weights, demand)):
+            if weight <= capacities[longest]:
+                add_column(longest, tuple(min(number, capacities[longest] // weight) if item == index else 0
+                                          for item in range(len(demand))))
+
+        converged: bool = False  # True, если новых схем с отрицательной приведенной стоимостью нет
+        for _ in range(self.MAX_ITERATIONS):
+            simplex.solve()
+            if self.time_is_up():
+                break
+
+            duals: list[float] = simplex.duals()
+            added: bool = False
+            for stock_index, (value, counts) in enumerate(
+                    self.__price(weights, [number for _, number in demand], duals[:len(demand)], capacities)):
+                reduced_cost: float = costs[stock_index] - value - duals[len(demand) + stock_index]
+                if reduced_cost < -1e-6 and (stock_index, counts) not in columns:
+                    add_column(stock_index, counts)
+                    added = True
+            if not added:
+                converged = True
+                break
+
+        # Значение главной задачи - нижняя оценка, только если генерация столбцов завершилась
+        if converged and simplex.feasible:
+            self.__lower_bound = self.from_units(math.ceil(simplex.objective - 1e-6))
+
+        # Если время истекло раньше, чем главная задача стала допустимой, то в решении остаются искусственные
+        # переменные, и его округление может занять весь материал. Тогда все изделия распилятся по очереди
+        if not simplex.feasible:
+            return list()
+
+        return [(stock_index, counts, value) for (stock_index, counts), value in zip(columns, simplex.values())]
+
+    @classmethod
+    def __price(cls, weights: list[int], numbers: list[int], duals: list[float],
+                capacities: list[int]) -> list[tuple[float, tuple[int, ...]]]:
+        """
+        Метод решает задачу о рюкзаке для поиска новых схем распила: ценность изделия - его двойственная оценка.
+        Задача решается один раз для наибольшей вместимости, а ответы для остальных вместимостей
+        берутся из той же таблицы
+        :param weights: Веса изделий (длина плюс ширина реза)
+        :type weights: list[int]
+        :param numbers: Максимальные количества изделий
+        :type numbers: list[int]
+        :param duals: Двойственные оценки изделий
+        :type duals: list[float]
+        :param capacities: Вместимости видов материала
+        :type capacities: list[int]
+        :return: Для каждой вместимости - ценность лучшей схемы и количества изделий в ней
+        :rtype: list[tuple[float, tuple[int, ...]]]
+        """
+        max_capacity: int = max(capacities)
+        tables: list[list[float]] = [[0.0] * (max_capacity + 1)]
+        chunks: list[tuple[int, int]] = list()
+
+        # Изделия одной длины разбиваются на группы 1, 2, 4, ... штук
+        for index, (weight, number, dual) in enumerate(zip(weights, numbers, duals)):
+            if dual <= 1e-9 or weight > max_capacity:
+                continue
+            number = min(number, max_capacity // weight)
+            chunk: int = 1
+            while number > 0:
+                take: int = min(chunk, number)
+                shift: int = weight * take
+                value: float = dual * take
+                previous: list[float] = tables[-1]
+                tables.append(previous[:shift] + [
+                    moved + value if moved + value > current else current
+                    for current, moved in zip(previous[shift:], previous)])
+                chunks.append((index, take))
+                number -= take
+                chunk <<= 1
+
+        result: list[tuple[float, tuple[int, ...]]] = list()
+        for capacity in capacities:
+            counts: list[int] = [0 for _ in weights]
+            current_capacity: int = capacity
+            for step in range(len(chunks), 0, -1):
+                if tables[step][current_capacity] != tables[step - 1][current_capacity]:
+                    index, take = chunks[step - 1]
+                    counts[index] += take
+                    current_capacity -= weights[index] * take
+            result.append((tables[-1][capacity], tuple(counts)))
+
+        return result
+
+    @classmethod
+    def __round_down(cls, demand: list[tuple[int, int]], stocks: list[tuple[float, int]],
+                     solution: list[tuple[int, tuple[int, ...], float]]) -> list[tuple[int, list[int]]]:
+        """
+        Метод округляет дробное решение вниз, не превышая количество имеющегося материала
+        :param demand: Различные длины изделий и их количества
+        :type demand: list[tuple[int, int]]
+        :param stocks: Виды материала: длина и количество
+        :type stocks: list[tuple[float, int]]
+        :param solution: Схемы распила с дробными количествами
+        :type solution: list[tuple[int, tuple[int, ...], float]]
+        :return: Список распилов: номер вида материала и количества изделий
+        :rtype: list[tuple[int, list[int]]]
+        """
+        bars: list[tuple[int, list[int]]] = list()
+        used: list[int] = [0 for _ in stocks]
+
+        # Сначала берем схемы с наибольшим значением - они ближе всего к целому решению
+        for stock_index, counts, value in sorted(solution, key=lambda column: column[2], reverse=True):
+            copies: int = min(int(math.floor(value + 1e-9)), stocks[stock_index][1] - used[stock_index])
+            for _ in range(copies):
+                bars.append((stock_index, list(counts[:len(demand)])))
+            used[stock_index] += max(copies, 0)
+
+        return bars
@@ -1,39 +1,162 @@
 """Модуль отвечает за обработку схемы распила"""
+from typing import Optional, Iterable, Union
+from array import array
+
+from business.pattern_scoring import PatternScorer
+
+
+class CutPattern:
+    """
+    Класс хранит один вариант распила профиля и количество профилей, распиленных так же
+
+    Args:
+        lengths (Iterable[float]) - Длины изделий в распиле
+        count (int) - Количество одинаковых распилов
+        proven (bool) - True, если распил доказанно оптимален для своего остатка
+    """
+    __slots__ = ('__lengths', '__count', '__proven')
+
+    def __init__(self, lengths: Iterable[float], count: int = 1, proven: bool = True) -> None:
+        self.__lengths: array = array('d', lengths)
+        self.__count: int = count
+        self.__proven: bool = proven
+
+    @property
+    def lengths(self) -> array:
+        """Геттер для self.__lengths"""
+        return self.__lengths
+
+    @property
+    def count(self) -> int:
+        """Геттер для self.__count"""
+        return self.__count
+
+    @property
+    def proven(self) -> bool:
+        """Геттер для self.__proven"""
+        return self.__proven
+
+    def repeat(self, number: int = 1) -> None:
+        """
+        Метод увеличивает количество одинаковых распилов
+        :param number: На сколько увеличить количество
+        :type number: int
+        :return: None
+        """
+        self.__count += number
 
 
 class CutScheme:
     """
-    Класс для обработки схемы распила
+    Класс для обработки схемы распила. Внутри каждый различный распил остатка хранится один раз
+    вместе с количеством повторений, поэтому память и время вывода зависят от количества различных распилов,
+    а не от количества профилей
 
     Args:
         cut_scheme (dict[tuple[float, int], list[list[float]]]) - Схема распила
         min_remnant (float) - Минимальная длина остатка
         cut_width (float) - Поправка к ширине изделия
+        proven (Optional[dict[tuple[float, int], list[bool]]]) - Для каждого распила из схемы: True, если он
+        доказанно оптимален для своего остатка. Если None - все распилы считаются оптимальными
+        resolution (float) - Разрешение длин, с которым считался распил. Остаток уходит в отход, если
+        в единицах разрешения он короче минимального остатка - так же, как при расчете
     """
-    def __init__(self, products: list[float], remnants: list[float],
+    __slots__ = ('__products', '__remnants', '__patterns', '__index', '__min_remnant', '__cut_width', '__resolution')
+
+    def __init__(self, products: Union[list[float], dict[float, int]], remnants: Union[list[float], dict[float, int]],
                  cut_scheme: dict[tuple[float, int], list[list[float]]],
-                 min_remnant: float, cut_width: float) -> None:
-        self.__products: list[float] = products
-        self.__remnants: list[float] = remnants
-        self.__cut_scheme: dict[tuple[float, int], list[list[float]]] = cut_scheme
+                 min_remnant: float, cut_width: float,
+                 proven: Optional[dict[tuple[float, int], list[bool]]] = None, resolution: float = 0.001) -> None:
+        self.__products: Union[list[float], dict[float, int]] = products
+        self.__remnants: Union[list[float], dict[float, int]] = remnants
         self.__min_remnant: float = min_remnant
         self.__cut_width: float = cut_width
+        self.__resolution: float = resolution
+        self.__patterns: dict[tuple[float, int], list[CutPattern]] = dict()
+        # Для каждого остатка: распил (длины и признак оптимальности) -> его объект в self.__patterns
+        self.__index: dict[tuple[float, int], dict[tuple[tuple[float, ...], bool], CutPattern]] = dict()
+
+        if proven is None:
+            proven = dict()
+        for remnant, cuttings in cut_scheme.items():
+            self.__patterns[remnant] = list()
+            for cutting, cutting_proven in zip(cuttings, proven.get(remnant, [True] * len(cuttings))):
+                self.add(remnant, cutting, cutting_proven)
+
+    @property
+    def patterns(self) -> dict[tuple[float, int], list[CutPattern]]:
+        """Геттер для self.__patterns - схемы распила, где одинаковые распилы хранятся один раз"""
+        return self.__patterns
 
     @property
     def cut_scheme(self) -> dict[tuple[float, int], list[list[float]]]:
-        """Геттер для self.__cut_scheme"""
-        return self.__cut_scheme
+        """Схема распила, где каждый распил записан отдельным списком (по одному на профиль)"""
+        return {remnant: [list(pattern.lengths) for pattern in patterns for _ in range(pattern.count)]
+                for remnant, patterns in self.__patterns.items()}
+
+    @property
+    def proven(self) -> dict[tuple[float, int], list[bool]]:
+        """Для каждого распила из cut_scheme: True, если он доказанно оптимален для своего остатка"""
+        return {remnant: [pattern.proven for pattern in patterns for _ in range(pattern.count)]
+                for remnant, patterns in self.__patterns.items()}
+
+    @property
+    def all_proven(self) -> bool:
+        """True, если оптимальность доказана для распила каждого остатка"""
+        return all(pattern.proven for patterns in self.__patterns.values() for pattern in patterns)
+
+    @property
+    def min_remnant(self) -> float:
+        """Геттер для self.__min_remnant"""
+        return self.__min_remnant
+
+    @property
+    def cut_width(self) -> float:
+        """Геттер для self.__cut_width"""
+        return self.__cut_width
 
     @property
-    def products(self) -> list[float]:
-        """Геттер для self.__products"""
+    def resolution(self) -> float:
+        """Геттер для self.__resolution"""
+        return self.__resolution
+
+    @property
+    def products(self) -> Union[list[float], dict[float, int]]:
+        """Геттер для self.__products - список изделий или словарь {длина: количество}"""
         return self.__products
 
     @property
-    def remnants(self) -> list[float]:
-        """Геттер для self.__remnants"""
+    def remnants(self) -> Union[list[float], dict[float, int]]:
+        """Геттер для self.__remnants - список остатков или словарь {длина: количество}"""
         return self.__remnants
 
+    def add(self, remnant: tuple[float, int], cutting: Iterable[float], proven: bool = True,
+            number: int = 1) -> None:
+        """
+        Метод добавляет распил остатка в схему. Если такой распил уже есть - увеличивается его количество
+        :param remnant: Ключ остатка (длина, количество)
+        :type remnant: tuple[float, int]
+        :param cutting: Длины изделий в распиле
+        :type cutting: Iterable[float]
+        :param proven: True, если распил доказанно оптимален
+        :type proven: bool
+        :param number: Количество таких распилов
+        :type number: int
+        :return: None
+        """
+        lengths: tuple[float, ...] = tuple(cutting)
+        patterns: list[CutPattern] = self.__patterns.setdefault(remnant, list())
+        index: dict[tuple[tuple[float, ...], bool], CutPattern] = self.__index.setdefault(remnant, dict())
+
+        pattern: Optional[CutPattern] = index.get((lengths, proven))
+        if pattern is not None:
+            pattern.repeat(number)
+            return
+
+        pattern = CutPattern(lengths, count=number, proven=proven)
+        patterns.append(pattern)
+        index[(lengths, proven)] = pattern
+
     def __str__(self) -> str:
         """
         Функция преобразует схему распила в удобно читаемый текст
@@ -42,11 +165,17 @@ class CutScheme:
         """
         result_string: str = ''
 
-        for remnant, opt_products in self.__cut_scheme.items():
+        for remnant, patterns in self.__patterns.items():
             result_string += f'{remnant}:\n'
-            for opt_product in opt_products:
+            for pattern in patterns:
+                opt_product: list[float] = list(pattern.lengths)
                 result_string += (f'\t{opt_product} = {round(sum(opt_product), 3)} '
-                                  f'({remnant[0]}, ост: {round(remnant[0] - sum(opt_product), 3)})\n')
+                                  f'({remnant[0]}, ост: {round(remnant[0] - sum(opt_product), 3)})'
+                                  f'{f" - {pattern.count} шт" if pattern.count > 1 else ""}'
+                                  f'{"" if pattern.proven else " *"}\n')
+
+        if not self.all_proven:
+            result_string += '* - оптимальность распила не доказана (истекло время расчета или распил эвристический)\n'
 
         return result_string
 
@@ -59,39 +188,92 @@ class CutScheme:
         остатка
         :return: None
         """
-        remnants: set[tuple[float, int]] = set(self.__cut_scheme.keys())
+        remnants: set[tuple[float, int]] = set(self.__patterns.keys())
 
         for remnant in remnants:
+            number_cuttings: int = sum(pattern.count for pattern in self.__patterns[remnant])
             # Если добавился пустой распил - удалим его
-            if len(self.__cut_scheme[remnant]) == 0:
-                self.__cut_scheme.pop(remnant)
-            elif remnant[1] > len(self.__cut_scheme[remnant]):
-                new_key: tuple[float, int] = (remnant[0], len(self.__cut_scheme[remnant]))
-                self.__cut_scheme[new_key] = self.__cut_scheme.pop(remnant)
-            elif remnant[1] < len(self.__cut_scheme[remnant]):
+            if number_cuttings == 0:
+                self.__patterns.pop(remnant)
+                self.__index.pop(remnant, None)
+            elif remnant[1] > number_cuttings:
+                new_key: tuple[float, int] = (remnant[0], number_cuttings)
+                self.__patterns[new_key] = self.__patterns.pop(remnant)
+                self.__index[new_key] = self.__index.pop(remnant, dict())
+            elif remnant[1] < number_cuttings:
                 raise WrongSchemeError(
                     title='Неправильный расчет распила', cut_scheme=self)
 
+    def to_dict(self) -> dict:
+        """
+        Метод преобразует схему распила в словарь из простых типов (для сохранения в JSON).
+        Списки изделий и остатков не сохраняются - они известны из входных данных расчета
+        :return: Словарь со схемой распила
+        :rtype: dict
+        """
+        return {
+            'min_remnant': self.__min_remnant,
+            'cut_width': self.__cut_width,
+            'resolution': self.__resolution,
+            'patterns': [[remnant[0], remnant[1],
+                          [[list(pattern.lengths), pattern.count, pattern.proven] for pattern in patterns]]
+                         for remnant, patterns in self.__patterns.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, products: Union[list[float], dict[float, int]],
+                  remnants: Union[list[float], dict[float, int]]) -> 'CutScheme':
+        """
+        Метод восстанавливает схему распила из словаря, полученного методом to_dict
+        :param data: Словарь со схемой распила
+        :type data: dict
+        :param products: Список изделий или словарь {длина: количество}
+        :type products: Union[list[float], dict[float, int]]
+        :param remnants: Список остатков или словарь {длина: количество}
+        :type remnants: Union[list[float], dict[float, int]]
+        :return: Схема распила
+        :rtype: CutScheme
+        """
+        result: CutScheme = cls(products=products, remnants=remnants, cut_scheme=dict(),
+                                min_remnant=data['min_remnant'], cut_width=data['cut_width'],
+                                resolution=data.get('resolution', 0.001))
+
+        for length, number, patterns in data.get('patterns', list()):
+            for lengths, count, proven in patterns:
+                result.add((length, number), lengths, proven, number=count)
+
+        # Прежний формат: каждый распил записан отдельно
+        for length, number, cuttings, flags in data.get('cut_scheme', list()):
+            for cutting, proven in zip(cuttings, flags):
+                result.add((length, number), cutting, proven)
+
+        return result
+
     def waste(self) -> tuple[float, float]:
         """
         Метод производит расчет отхода в данной схеме распила
         :return: Абсолютный и относительный отходы
         :rtype: tuple[float, float]
         """
-        total_waste: float = 0.0
+        bars: list[float] = list()
+        patterns: list[array] = list()
+        repeats: list[int] = list()
         total_remnant: float = 0.0
 
-        for remnant, cuttings in self.__cut_scheme.items():
+        for remnant, remnant_patterns in self.__patterns.items():
             total_remnant += remnant[0] * remnant[1]
+            for pattern in remnant_patterns:
+                bars.append(remnant[0])
+                patterns.append(pattern.lengths)
+                repeats.append(pattern.count)
 
-            for cut in cuttings:
-                total_waste += self.__cut_width * len(cut)  # Учет стружки
-                waste: float = remnant[0] - sum(cut) - self.__cut_width * len(cut)
-                # Если остаток меньше, чем минимальная длина остатка - в отход
-                if waste < self.__min_remnant:
-                    total_waste += waste
+        # Стружка от всех резов и остатки короче минимальной длины считаются для всех распилов сразу
+        shavings, short_leftovers = PatternScorer.scheme_waste(
+            bars, patterns, self.__cut_width, self.__min_remnant, repeats, self.__resolution)
+        total_waste: float = shavings + short_leftovers
 
-        waste_percent: float = round((total_waste * 100 / total_remnant), 3)
+        # Пустая схема (например, для пустого списка изделий) отхода не дает
+        waste_percent: float = round((total_waste * 100 / total_remnant), 3) if total_remnant > 0 else 0.0
 
         return round(total_waste, 3), waste_percent
 
@@ -1,8 +1,34 @@
 """Модуль с абстрактным классом, от которого наследуются все классы - алгоритмы расчета распила"""
-from copy import deepcopy
 from abc import ABC, abstractmethod
+from inspect import isabstract
+from typing import Optional, Type, Union
+from collections import Counter
+import time
 
 from business.cut_scheme import CutScheme
+from business.business_exceptions import SearchTimeoutError, SearchMemoryError
+from business.pattern_cache import PatternCache
+from business.pattern_table import PatternTable
+from business.product_multiset import ProductMultiset
+from business.subset_sum import SubsetSumEngine
+
+
+class _SearchFrame:
+    """
+    Узел стека поиска распила: подзадача (вместимость, номер длины), перебираемое количество изделий
+    этой длины и лучший результат среди уже рассмотренных количеств
+    """
+    __slots__ = ('capacity', 'index', 'key', 'weight', 'quantity', 'rest_total', 'best_fill', 'best_quantities')
+
+    def __init__(self, capacity: int, index: int, key: tuple, weight: int, number: int, rest_total: int) -> None:
+        self.capacity: int = capacity
+        self.index: int = index
+        self.key: tuple = key
+        self.weight: int = weight
+        self.quantity: int = number  # Количество перебирается от наибольшего к нулю
+        self.rest_total: int = rest_total  # Суммарный вес изделий следующих длин
+        self.best_fill: int = -1
+        self.best_quantities: tuple[tuple[int, int], ...] = tuple()
 
 
 class Cutting(ABC):
@@ -10,34 +36,143 @@ class Cutting(ABC):
     Базовый класс для расчета распила
 
     Args:
-        remnants (list[float]) - список остатков
-        in_products (list[float]) - список изделий (как указано в наряде)
+        remnants (Union[list[float], dict[float, int]]) - список остатков или словарь {длина: количество}
+        in_products (Union[list[float], dict[float, int]]) - список изделий (как указано в наряде)
+        или словарь {длина: количество}. Внутри изделия и остатки хранятся как количества по длинам,
+        поэтому память и время зависят от количества различных длин, а не от количества изделий
         number_whole_profiles (int) - количество цельных профилей
         correction (float) - Поправка к ширине изделий
         cutting_width (float) - ширина реза
         whole_profile_length (float) - длина цельного профиля
         min_rest_length (float) - Минимальная длина остатка. Остатки меньше - отход
+        cache_size (int) - Максимальное количество распилов в кэше поиска. Если 0 - кэш отключен
+        resolution (float) - Разрешение длин (по умолчанию 1 мм). Внутри все длины хранятся
+        как целое количество таких единиц
+        engine (str) - Способ поиска распила одного остатка: 'search' - перебор,
+        'subset_sum' - задача о сумме подмножеств на целых длинах
+        time_budget (Optional[float]) - Время на расчет распила (с). Когда оно истекает, поиск возвращает
+        лучший найденный распил, а оставшиеся остатки распиливаются жадно. Если None - без ограничения
+        max_stack_size (int) - Максимальное количество узлов в стеке поиска распила одного остатка.
+        Поиск идет без рекурсии, поэтому глубина не ограничена sys.getrecursionlimit(). Если стек больше -
+        возвращается лучший найденный распил, как при истечении времени
+        whole_profiles (Optional[list[tuple]]) - Несколько видов цельных профилей: кортежи (длина, количество)
+        или (длина, количество, цена за метр). Цена по умолчанию - 1. Если задано, то whole_profile_length -
+        длина самого длинного вида, а number_whole_profiles - общее количество цельных профилей
+        pattern_table_size (int) - Максимальное количество распилов в таблице максимальных распилов цельного
+        профиля (PatternTable). Таблица строится один раз за расчет для каждой длины цельного профиля, и распил
+        цельного профиля берется из нее вместо поиска. Если распилов больше - используется поиск. Если 0 - таблицы
+        не строятся
     """
-    def __init__(self, *, remnants: list[float], in_products: list[float], number_whole_profiles: int,
+    ENGINES: tuple[str, ...] = ('search', 'subset_sum')
+    PATTERN_TABLE_TRIGGER: int = 20_000  # После скольких узлов поиска распилов цельного профиля строится таблица
+    __algorithms: dict[str, Type['Cutting']] = dict()  # Зарегистрированные алгоритмы: имя -> класс
+
+    def __init_subclass__(cls, register: bool = True, **kwargs) -> None:
+        """
+        Каждый класс-наследник регистрируется как алгоритм, если не указано class X(Cutting, register=False)
+        :param register: Если False - класс не попадает в список алгоритмов
+        :type register: bool
+        :return: None
+        """
+        super().__init_subclass__(**kwargs)
+        if register:
+            Cutting.__algorithms[cls.__name__] = cls
+
+    @classmethod
+    def algorithms(cls) -> dict[str, Type['Cutting']]:
+        """
+        Метод возвращает все зарегистрированные алгоритмы (неабстрактные наследники Cutting) в порядке импорта
+        :return: Словарь {имя алгоритма: класс}
+        :rtype: dict[str, Type[Cutting]]
+        """
+        return {name: algorithm for name, algorithm in Cutting.__algorithms.items() if not isabstract(algorithm)}
+
+    def __init__(self, *, remnants: Union[list[float], dict[float, int]],
+                 in_products: Union[list[float], dict[float, int]], number_whole_profiles: int = 0,
                  correction: float, cutting_width: float = 0.003, whole_profile_length: float = 6.0,
-                 min_rest_length: float = 1.0) -> None:
-        self.__remnants: list[float] = remnants
-        self.__in_products: list[float] = in_products
-        self.__products: list[float] = [round(product - correction, 3) for product in in_products]
+                 min_rest_length: float = 1.0, cache_size: int = 100_000, resolution: float = 0.001,
+                 engine: str = 'search', time_budget: Optional[float] = None,
+                 max_stack_size: int = 100_000, whole_profiles: Optional[list[tuple]] = None,
+                 pattern_table_size: int = 5_000) -> None:
+        if engine not in self.ENGINES:
+            raise ValueError(f'Неизвестный способ поиска распила: {engine}')
+
+        # Виды цельных профилей (длина, количество, цена за метр) по возрастанию длины
+        if whole_profiles is None:
+            whole_profiles = [(whole_profile_length, number_whole_profiles)]
+        self.__whole_profiles: list[tuple[float, int, float]] = sorted(
+            (profile[0], profile[1], profile[2] if len(profile) > 2 else 1.0)
+            for profile in whole_profiles if profile[1] > 0)
+        if self.__whole_profiles:
+            whole_profile_length = self.__whole_profiles[-1][0]
+        number_whole_profiles = sum(number for _, number, _ in self.__whole_profiles)
+
+        self.__scale: int = round(1 / resolution)
         self.__number_whole_profiles: int = number_whole_profiles
         self.__cutting_width: float = cutting_width
         self.__whole_profile_length: float = whole_profile_length
         self.__min_rest_length: float = min_rest_length
+        self.__pattern_cache: PatternCache = PatternCache(max_size=cache_size)
+        self.__engine: str = engine
+        self.__search_nodes: int = 0
+        self.__time_budget: Optional[float] = time_budget
+        self.__max_stack_size: int = max_stack_size
+        self.__pattern_table_size: int = pattern_table_size
+        # Таблицы максимальных распилов по вместимости цельного профиля (None - таблица не построилась)
+        self.__pattern_tables: dict[int, Optional[PatternTable]] = dict()
+        self.__whole_search_nodes: dict[int, int] = dict()  # Узлы поиска, потраченные на цельные профили
+        self.__deadline: Optional[float] = None
+        self.__last_proven: bool = True
+        # Лучшее полное заполнение, найденное в текущем поиске, и путь от корня до текущего узла
+        self.__incumbent: tuple[int, tuple[tuple[int, int], ...]] = (0, tuple())
+        self.__path: list[int] = list()  # Позиции в векторе спроса, по которым идет текущая ветвь
+        self.__path_fill: int = 0
+        # Вектор спроса текущего поиска: веса и количества хранятся в списках и не копируются в узлах дерева.
+        # Количество изделий в текущей ветви записывается на место, а при возврате перезаписывается
+        self.__weights: list[int] = list()
+        self.__numbers: list[int] = list()
+        self.__quantities: list[int] = list()
+        self.__suffixes: list[Optional[tuple[tuple[int, int], ...]]] = list()
+
+        # Количества изделий и остатков по длинам. Длины изделий - с учетом поправки и с точностью до разрешения
+        self.__remnant_counts: dict[float, int] = self.to_counts(remnants)
+        self.__int_product_counts: dict[int, int] = dict()
+        for product, number in self.to_counts(in_products).items():
+            units: int = self.to_units(product - correction)
+            self.__int_product_counts[units] = self.__int_product_counts.get(units, 0) + number
+        self.__product_counts: dict[float, int] = {
+            self.from_units(units): number for units, number in self.__int_product_counts.items()}
+        self.__min_product: Optional[float] = min(self.__product_counts) if self.__product_counts else None
+
+        # Целочисленное представление длин (в единицах разрешения)
+        self.__int_cutting_width: int = self.to_units(cutting_width)
+        self.__int_whole_profile_length: int = self.to_units(whole_profile_length)
+        self.__int_min_rest_length: int = self.to_units(min_rest_length)
 
     @property
     def remnants(self) -> list[float]:
-        """Геттер для self.__remnants"""
-        return self.__remnants
+        """Список остатков (по одному элементу на остаток)"""
+        return [length for length, number in self.__remnant_counts.items() for _ in range(number)]
 
     @property
     def products(self) -> list[float]:
-        """Геттер для self.__products"""
-        return self.__products
+        """Список изделий с учетом поправки (по одному элементу на изделие)"""
+        return [length for length, number in self.__product_counts.items() for _ in range(number)]
+
+    @property
+    def remnant_counts(self) -> dict[float, int]:
+        """Геттер для self.__remnant_counts - количества остатков по длинам"""
+        return self.__remnant_counts
+
+    @property
+    def product_counts(self) -> dict[float, int]:
+        """Геттер для self.__product_counts - количества изделий по длинам (с учетом поправки)"""
+        return self.__product_counts
+
+    @property
+    def min_product(self) -> Optional[float]:
+        """Длина самого короткого изделия или None, если изделий нет"""
+        return self.__min_product
 
     @property
     def cutting_width(self) -> float:
@@ -59,40 +194,412 @@ class Cutting(ABC):
         """Геттер для self.__number_whole_profiles"""
         return self.__number_whole_profiles
 
-    def calculate_min_waste(self, remnant: float, products: list[float]) -> list[float]:
+    @property
+    def whole_profiles(self) -> list[tuple[float, int, float]]:
+        """Виды цельных профилей: длина, количество и цена за метр (по возрастанию длины)"""
+        return self.__whole_profiles
+
+    @property
+    def engine(self) -> str:
+        """Геттер для self.__engine"""
+        return self.__engine
+
+    @property
+    def scale(self) -> int:
+        """Количество единиц разрешения в одном метре"""
+        return self.__scale
+
+    @property
+    def resolution(self) -> float:
+        """Разрешение длин (м)"""
+        return 1 / self.__scale
+
+    @property
+    def int_products(self) -> list[int]:
+        """Список изделий в единицах разрешения"""
+        return [units for units, number in self.__int_product_counts.items() for _ in range(number)]
+
+    @property
+    def int_remnants(self) -> list[int]:
+        """Список остатков в единицах разрешения"""
+        return [self.to_units(length) for length, number in self.__remnant_counts.items() for _ in range(number)]
+
+    @property
+    def int_cutting_width(self) -> int:
+        """Геттер для self.__int_cutting_width"""
+        return self.__int_cutting_width
+
+    @property
+    def int_whole_profile_length(self) -> int:
+        """Геттер для self.__int_whole_profile_length"""
+        return self.__int_whole_profile_length
+
+    @property
+    def int_min_rest_length(self) -> int:
+        """Геттер для self.__int_min_rest_length"""
+        return self.__int_min_rest_length
+
+    def to_units(self, length: float) -> int:
+        """
+        Метод переводит длину в метрах в целое количество единиц разрешения
+        :param length: Длина (м)
+        :type length: float
+        :return: Длина в единицах разрешения
+        :rtype: int
+        """
+        return round(length * self.__scale)
+
+    def from_units(self, units: int) -> float:
+        """
+        Метод переводит длину в единицах разрешения обратно в метры
+        :param units: Длина в единицах разрешения
+        :type units: int
+        :return: Длина (м)
+        :rtype: float
+        """
+        return units / self.__scale
+
+    @property
+    def pattern_cache(self) -> PatternCache:
+        """Геттер для self.__pattern_cache"""
+        return self.__pattern_cache
+
+    @property
+    def search_nodes(self) -> int:
+        """Количество узлов дерева поиска, рассмотренных с начала расчета"""
+        return self.__search_nodes
+
+    @property
+    def time_budget(self) -> Optional[float]:
+        """Геттер для self.__time_budget"""
+        return self.__time_budget
+
+    @property
+    def max_stack_size(self) -> int:
+        """Геттер для self.__max_stack_size"""
+        return self.__max_stack_size
+
+    @property
+    def last_pattern_proven(self) -> bool:
+        """True, если последний распил, найденный calculate_min_waste, доказанно оптимален"""
+        return self.__last_proven
+
+    def time_is_up(self) -> bool:
+        """
+        Метод проверяет, истекло ли время, отведенное на расчет
+        :return: True, если время истекло
+        :rtype: bool
+        """
+        return self.__deadline is not None and time.perf_counter() > self.__deadline
+
+    def input_params(self) -> dict:
+        """
+        Метод возвращает входные данные расчета в каноническом виде: изделия и остатки - отсортированные пары
+        [длина в единицах разрешения, количество], так как порядок изделий и остатков на результат не влияет
+        :return: Словарь с входными данными
+        :rtype: dict
+        """
+        remnant_counts: dict[int, int] = dict()
+        for length, number in self.__remnant_counts.items():
+            remnant_counts[self.to_units(length)] = remnant_counts.get(self.to_units(length), 0) + number
+
+        return {
+            'products': sorted([units, number] for units, number in self.__int_product_counts.items()),
+            'remnants': sorted([units, number] for units, number in remnant_counts.items()),
+            'number_whole_profiles': self.__number_whole_profiles,
+            'cutting_width': self.__int_cutting_width,
+            'whole_profile_length': self.__int_whole_profile_length,
+            'whole_profiles': [[self.to_units(length), number, cost] for length, number, cost in self.__whole_profiles],
+            'min_rest_length': self.__int_min_rest_length,
+            'scale': self.__scale,
+            'engine': self.__engine,
+            'time_budget': self.__time_budget,
+            'max_stack_size': self.__max_stack_size,
+            'pattern_table_size': self.__pattern_table_size
+        }
+
+    def reset_search(self) -> None:
+        """
+        Метод сбрасывает состояние поиска. Вызывается в начале каждого расчета распила,
+        чтобы кэш распилов был общим только в пределах одного вызова cut(). Здесь же запускается
+        отсчет времени, отведенного на расчет
+        :return: None
+        """
+        self.__pattern_cache.clear()
+        self.__pattern_tables = dict()
+        self.__whole_search_nodes = dict()
+        self.__search_nodes = 0
+        self.__deadline = None if self.__time_budget is None else time.perf_counter() + self.__time_budget
+
+    def calculate_min_waste(self, remnant: float, products: Union[list[float], ProductMultiset]) -> list[float]:
         """
         Метод ищет оптимальный распил для данного остатка на данный список изделий
         :param remnant: Длина остатка
         :param remnant: float
         :param products: Список изделий, на которые можно пустить остаток
-        :type products: list[float]
+        :type products: Union[list[float], ProductMultiset]
         :return: Распил данного остатка
         :rtype: list[float]
         """
-        # 1) Удалим все изделия, длиннее остатка
-        current_products: list[float] = [product for product in products if product <= remnant]
+        # 1) Удалим все изделия, длиннее остатка, и сгруппируем одинаковые изделия
+        lengths, demand = self.__demand_vector(remnant, products)
+        capacity: int = self.to_units(remnant) + self.__int_cutting_width
 
-        # 2) Пробежимся по всем остаткам и рекурсивно найдем лучший рез
-        min_waste: float = self.whole_profile_length
-        result_cutting: list[float] = list()
+        # 2) Найдем количество изделий каждой длины в лучшем распиле. Для цельного профиля - по таблице,
+        # если поиск распилов этого профиля уже занял больше PATTERN_TABLE_TRIGGER узлов
+        self.__last_proven = True
+        search_nodes: int = self.__search_nodes
+        whole: bool = self.__pattern_table_size > 0 and remnant in self.__whole_lengths()
+        table_result: Optional[tuple[int, tuple[tuple[int, int], ...]]] = None
+        if whole and self.__whole_search_nodes.get(capacity, 0) >= self.PATTERN_TABLE_TRIGGER:
+            table: Optional[PatternTable] = self.__pattern_table(capacity, remnant)
+            if table is not None:
+                table_result = table.best_fill(demand)
 
-        for product in current_products:
-            current_cutting: list[float] = [product]
-            copy_current_products = deepcopy(current_products)
-            copy_current_products.remove(product)
+        if table_result is not None:
+            quantities: tuple[tuple[int, int], ...] = table_result[1]
+        elif self.__engine == 'subset_sum':
+            try:
+                if self.time_is_up():
+                    raise SearchTimeoutError()
+                _, chosen = SubsetSumEngine.best_fill(capacity, list(demand), deadline=self.__deadline)
+                quantities = tuple(
+                    (weight, number) for (weight, _), number in zip(demand, chosen) if number > 0)
+            except SearchTimeoutError:
+                # Как и в переборе, после истечения времени остаток заполняется жадно
+                _, quantities = self.__greedy_fill(capacity, demand)
+                self.__last_proven = False
+        else:
+            # Жадное заполнение - начальный рекорд, который вернется, если время закончится
+            self.__incumbent = self.__greedy_fill(capacity, demand)
+            self.__path = list()
+            self.__path_fill = 0
+            self.__weights = [weight for weight, _ in demand if weight > 0]
+            self.__numbers = [number for weight, number in demand if weight > 0]
+            self.__quantities = [0 for _ in self.__weights]
+            self.__suffixes = [None for _ in self.__weights]
+            try:
+                if self.time_is_up():
+                    raise SearchTimeoutError()
+                _, quantities = self.__search(capacity, 0)
+            except (SearchTimeoutError, SearchMemoryError):
+                _, quantities = self.__incumbent
+                self.__last_proven = False
 
-            current_cutting.extend(self.calculate_min_waste(
-                remnant=remnant - product - self.cutting_width,
-                products=copy_current_products
-            ))
+        if whole and table_result is None:
+            self.__whole_search_nodes[capacity] = (self.__whole_search_nodes.get(capacity, 0)
+                                                   + self.__search_nodes - search_nodes)
 
-            waste = remnant - sum(current_cutting) - len(current_cutting) * self.cutting_width
-            if waste < min_waste:
-                result_cutting = current_cutting
-                min_waste = waste
+        # 3) Переведем найденные количества обратно в список длин
+        result_cutting: list[float] = list()
+        for weight, number in quantities:
+            result_cutting.extend([lengths[weight]] * number)
 
         return result_cutting
 
+    def __whole_lengths(self) -> set[float]:
+        """
+        Метод возвращает длины видов цельных профилей
+        :return: Множество длин
+        :rtype: set[float]
+        """
+        return {length for length, _, _ in self.__whole_profiles}
+
+    def __pattern_table(self, capacity: int, length: float) -> Optional[PatternTable]:
+        """
+        Метод возвращает таблицу максимальных распилов цельного профиля. Таблица строится при первом обращении
+        в текущем расчете по всем изделиям наряда
+        :param capacity: Вместимость профиля в единицах разрешения
+        :type capacity: int
+        :param length: Длина профиля
+        :type length: float
+        :return: Таблица или None, если распилов слишком много или истекло время
+        :rtype: Optional[PatternTable]
+        """
+        if capacity not in self.__pattern_tables:
+            _, demand = self.__demand_vector(length, ProductMultiset.from_counts(self.__product_counts))
+            table: PatternTable = PatternTable(capacity, demand, max_patterns=self.__pattern_table_size,
+                                               deadline=self.__deadline)
+            self.__pattern_tables[capacity] = table if table.complete else None
+        return self.__pattern_tables[capacity]
+
+    def __demand_vector(self, remnant: float, products: Union[list[float], ProductMultiset]
+                        ) -> tuple[dict[int, float], tuple[tuple[int, int], ...]]:
+        """
+        Метод строит вектор спроса: различные длины изделий, которые помещаются в остаток, и их количества.
+        Длины переводятся в веса - целую длину изделия плюс ширину реза
+        :param remnant: Длина остатка
+        :param remnant: float
+        :param products: Список изделий
+        :type products: Union[list[float], ProductMultiset]
+        :return: Соответствие веса исходной длине изделия и вектор спроса (вес, количество),
+        отсортированный по убыванию длины
+        :rtype: tuple[dict[int, float], tuple[tuple[int, int], ...]]
+        """
+        lengths: dict[int, float] = dict()
+        counts: dict[int, int] = dict()
+        max_units: int = self.to_units(remnant)
+
+        if not isinstance(products, ProductMultiset):
+            products = ProductMultiset(products)
+
+        for product, number in products.items():
+            units: int = self.to_units(product)
+            if units > max_units:
+                continue
+            weight: int = units + self.__int_cutting_width
+            lengths.setdefault(weight, product)
+            counts[weight] = counts.get(weight, 0) + number
+
+        demand: tuple[tuple[int, int], ...] = tuple(
+            (weight, counts[weight]) for weight in sorted(counts, reverse=True))
+        return lengths, demand
+
+    def __search(self, capacity: int, index: int) -> tuple[int, tuple[tuple[int, int], ...]]:
+        """
+        Метод ищет лучшее заполнение остатка обходом дерева в глубину с явным стеком. Ветвление идет
+        не по каждому изделию, а по различным длинам: для длины с номером index перебирается количество изделий,
+        следующие длины образуют подзадачу. Так одинаковые изделия не порождают одинаковых ветвей.
+        Ветви, которые даже при использовании всех оставшихся изделий не улучшат найденное заполнение,
+        отсекаются, а при идеальном заполнении (отход равен минус ширине реза) поиск прекращается.
+        Узлы не создают копий вектора спроса: подзадача задается оставшейся вместимостью и номером длины
+        :param capacity: Вместимость остатка (длина плюс ширина одного реза) в единицах разрешения
+        :type capacity: int
+        :param index: Номер первой длины в векторе спроса (веса отсортированы по убыванию)
+        :type index: int
+        :raise SearchTimeoutError: Если истекло время на расчет
+        :raise SearchMemoryError: Если стек поиска больше max_stack_size
+        :return: Суммарный вес лучшего заполнения и количества изделий каждого веса в нем
+        :rtype: tuple[int, tuple[tuple[int, int], ...]]
+        """
+        sub_result, frame = self.__open_node(capacity, index)
+        if frame is None:
+            return sub_result
+
+        stack: list[_SearchFrame] = [frame]
+        self.__path.append(frame.index)
+
+        while True:
+            frame = stack[-1]
+
+            # Подзадача для текущего количества решена - учтем ее результат
+            if sub_result is not None:
+                sub_fill, sub_quantities = sub_result
+                sub_result = None
+                step: int = frame.quantity * frame.weight
+                self.__path_fill -= step
+
+                # Путь от корня плюс найденное заполнение подзадачи - полный распил. Запомним, если он лучше рекорда
+                if self.__path_fill + step + sub_fill > self.__incumbent[0]:
+                    self.__incumbent = (self.__path_fill + step + sub_fill, tuple(
+                        (self.__weights[position], self.__quantities[position]) for position in self.__path
+                        if self.__quantities[position] > 0) + sub_quantities)
+
+                if step + sub_fill > frame.best_fill:
+                    frame.best_fill = step + sub_fill
+                    frame.best_quantities = (((frame.weight, frame.quantity),) + sub_quantities
+                                             if frame.quantity > 0 else sub_quantities)
+
+                # Идеальное заполнение - дальше искать нечего
+                frame.quantity = -1 if frame.best_fill == frame.capacity else frame.quantity - 1
+
+            # Верхняя оценка заполнения ветви. С уменьшением quantity она только убывает,
+            # поэтому если ветвь не может улучшить результат - не смогут и следующие
+            if frame.quantity >= 0 and min(frame.capacity,
+                                           frame.quantity * frame.weight + frame.rest_total) > frame.best_fill:
+                self.__quantities[frame.index] = frame.quantity
+                self.__path_fill += frame.quantity * frame.weight
+                sub_result, child = self.__open_node(frame.capacity - frame.quantity * frame.weight, frame.index + 1)
+                if child is not None:
+                    if len(stack) >= self.__max_stack_size:
+                        raise SearchMemoryError()
+                    stack.append(child)
+                    self.__path.append(child.index)
+                continue
+
+            # Все количества рассмотрены - вернем результат узла родителю
+            stack.pop()
+            self.__path.pop()
+            sub_result = (frame.best_fill, frame.best_quantities)
+            self.__pattern_cache.put(frame.key, sub_result)
+            if not stack:
+                return sub_result
+
+    def __open_node(self, capacity: int, index: int
+                    ) -> tuple[Optional[tuple[int, tuple[tuple[int, int], ...]]], Optional['_SearchFrame']]:
+        """
+        Метод начинает обработку узла дерева поиска. Если результат узла известен сразу (ничего не помещается,
+        помещается все или узел есть в кэше), он возвращается без создания узла в стеке
+        :param capacity: Оставшаяся вместимость остатка в единицах разрешения
+        :type capacity: int
+        :param index: Номер первой длины подзадачи в векторе спроса
+        :type index: int
+        :raise SearchTimeoutError: Если истекло время на расчет
+        :return: Результат узла и None или None и новый узел для стека
+        :rtype: tuple[Optional[tuple[int, tuple[tuple[int, int], ...]]], Optional[_SearchFrame]]
+        """
+        weights: list[int] = self.__weights
+        numbers: list[int] = self.__numbers
+        size: int = len(weights)
+
+        # Веса отсортированы по убыванию, поэтому изделия, которые не помещаются, идут подряд в начале
+        while index < size and weights[index] > capacity:
+            index += 1
+        if index == size:
+            return (0, tuple()), None
+
+        self.__search_nodes += 1
+        # Время проверяем не в каждом узле, чтобы не замедлять поиск
+        if self.__search_nodes & 255 == 0 and self.time_is_up():
+            raise SearchTimeoutError()
+
+        # Если все изделия помещаются - лучше заполнения быть не может
+        total: int = 0
+        for position in range(index, size):
+            total += weights[position] * min(numbers[position], capacity // weights[position])
+        if total <= capacity:
+            return (total, tuple((weights[position], min(numbers[position], capacity // weights[position]))
+                                 for position in range(index, size))), None
+
+        # Если такое состояние уже встречалось - возьмем результат из кэша
+        suffix: Optional[tuple[tuple[int, int], ...]] = self.__suffixes[index]
+        if suffix is None:
+            suffix = tuple(zip(weights[index:], numbers[index:]))
+            self.__suffixes[index] = suffix
+        key: tuple[int, tuple[tuple[int, int], ...]] = (capacity, suffix)
+        cached: Optional[tuple[int, tuple[tuple[int, int], ...]]] = self.__pattern_cache.get(key)
+        if cached is not None:
+            return cached, None
+
+        number: int = min(numbers[index], capacity // weights[index])
+        return None, _SearchFrame(capacity, index, key, weights[index], number,
+                                  total - weights[index] * number)
+
+    @classmethod
+    def __greedy_fill(cls, capacity: int,
+                      demand: tuple[tuple[int, int], ...]) -> tuple[int, tuple[tuple[int, int], ...]]:
+        """
+        Метод жадно заполняет остаток: берет как можно больше самых длинных изделий, затем следующих
+        :param capacity: Вместимость остатка в единицах разрешения
+        :type capacity: int
+        :param demand: Вектор спроса (вес изделия, количество), отсортированный по убыванию
+        :type demand: tuple[tuple[int, int], ...]
+        :return: Суммарный вес заполнения и количества изделий каждого веса в нем
+        :rtype: tuple[int, tuple[tuple[int, int], ...]]
+        """
+        fill: int = 0
+        quantities: list[tuple[int, int]] = list()
+
+        for weight, number in demand:
+            if weight <= 0:
+                continue
+            quantity: int = min(number, (capacity - fill) // weight)
+            if quantity > 0:
+                fill += quantity * weight
+                quantities.append((weight, quantity))
+
+        return fill, tuple(quantities)
+
     @abstractmethod
     def cut(self) -> CutScheme:
         """
@@ -115,26 +622,20 @@ class Cutting(ABC):
         :return: Хистограмму элементов в списке
         :rtype: set[tuple[float, int]]
         """
-        set_array: set[float] = set(array)
-        return {(elem, array.count(elem)) for elem in set_array if elem >= min_value}
+        return {(elem, number) for elem, number in Counter(array).items() if elem >= min_value}
 
     @classmethod
-    def remove_list_from_array(cls, init_array: list, removed_list: list) -> list:
+    def to_counts(cls, values: Union[list[float], dict[float, int]]) -> dict[float, int]:
         """
-        Метод удаляет все элементы removed_array из init_array
-        :param init_array: Начальный список
-        :type init_array: list
-        :param removed_list: Удаляемый список
-        :type removed_list: list
-        :return: Отредактированный начальный список
-        :rtype: list
+        Метод переводит список длин или словарь {длина: количество} в словарь количеств
+        :param values: Список длин или словарь количеств
+        :type values: Union[list[float], dict[float, int]]
+        :return: Словарь {длина: количество} без нулевых количеств
+        :rtype: dict[float, int]
         """
-        result_array: list[float] = deepcopy(init_array)
-
-        for elem in removed_list:
-            result_array.remove(elem)
-
-        return result_array
+        if isinstance(values, dict):
+            return {length: number for length, number in values.items() if number > 0}
+        return dict(Counter(values))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,76 @@
+"""Модуль, отвечающий за работу алгоритма FastCutting"""
+from typing import Optional
+
+from business.cutting import Cutting
+from business.business_exceptions import NoRemnantsError
+from business.cut_scheme import CutScheme
+from business.capacity_tree import CapacityTree
+
+
+class FastCutting(Cutting):
+    """
+    Класс рассчитывает распил методом "первый подходящий по убыванию" для очень больших нарядов.
+    Все остатки и цельные профили выстраиваются по возрастанию длины, изделия берутся по убыванию длины,
+    и каждое изделие кладется в первый профиль, где для него хватает места. Свободная длина профилей хранится
+    в дереве отрезков, поэтому расчет занимает O(n log m), где n - количество изделий, m - количество профилей.
+    Так как профили упорядочены по длине, сначала заполняются короткие остатки, а новый цельный профиль
+    начинается, только когда изделие не помещается ни в более короткие профили, ни в уже начатые профили той же длины
+    """
+    __name__ = 'FastCutting'
+
+    def __str__(self) -> str:
+        return ('Данный метод распиливает изделия по убыванию длины, кладя каждое изделие в самый короткий'
+                ' профиль, в котором для него хватает места. Подходит для нарядов из тысяч изделий')
+
+    def cut(self) -> CutScheme:
+        """
+        Метод для расчета распила. Изделия по убыванию длины кладутся в первый подходящий профиль
+        из списка остатков и цельных профилей, упорядоченного по возрастанию длины
+        :raise NoRemnantError: Если какое-то изделие не помещается ни в один профиль
+        :return: Распил. Имеет тип словаря, ключи - кортежи, где первый элемент - длина остатка,
+        второй - количество остатков данной длины. Значения словаря - список списков изделий для одного такого остатка
+        :rtype: dict[tuple[float, int], list[list[float]]]
+        """
+        self.reset_search()
+
+        # Профили по возрастанию длины: ключ схемы для каждого профиля и его вместимость.
+        # Если изделий нет, то min_product равен None, и остатки не нужны. Остатки и цельные профили
+        # одной длины попадают в схему под одним ключом, как в RemnantInventory
+        totals: dict[float, int] = {length: number for length, number in self.remnant_counts.items()
+                                    if self.min_product is not None and length >= self.min_product}
+        for length, number, _ in self.whole_profiles:
+            totals[length] = totals.get(length, 0) + number
+        slots: list[tuple[float, int]] = [(length, number) for length, number in sorted(totals.items())
+                                          for _ in range(number)]
+        tree: CapacityTree = CapacityTree(
+            [self.to_units(length) + self.int_cutting_width for length, _ in slots])
+        cuttings: list[list[float]] = [list() for _ in slots]
+
+        unplaced: bool = False
+        for product, number in sorted(self.product_counts.items(), reverse=True):
+            weight: int = self.to_units(product) + self.int_cutting_width
+            for _ in range(number):
+                slot: Optional[int] = tree.first_fit(weight)
+                if slot is None:
+                    unplaced = True
+                    break
+                tree.take(slot, weight)
+                cuttings[slot].append(product)
+
+        cutting_scheme: dict[tuple[float, int], list[list[float]]] = dict()
+        for key, cutting in zip(slots, cuttings):
+            if cutting:
+                cutting_scheme.setdefault(key, list()).append(cutting)
+
+        # Раскладка "первый подходящий" - эвристика, поэтому оптимальность распилов не доказана
+        beautiful_scheme: CutScheme = CutScheme(
+            cut_scheme=cutting_scheme, min_remnant=self.min_rest_length, cut_width=self.cutting_width,
+            products=self.product_counts, remnants=self.remnant_counts, resolution=self.resolution,
+            proven={key: [False] * len(cuttings) for key, cuttings in cutting_scheme.items()})
+        beautiful_scheme.restore_order()
+
+        # Если изделие не поместилось ни в один профиль, то выбросим исключение
+        if unplaced:
+            raise NoRemnantsError(title='Не хватает остатков и цельных профилей', cut_scheme=beautiful_scheme)
+
+        return beautiful_scheme
@@ -0,0 +1,388 @@
+"""Модуль с локальным поиском, который улучшает уже рассчитанную схему распила"""
+import random
+import time
+from typing import Optional
+
+from business.cut_scheme import CutScheme
+
+
+class _Bar:
+    """
+    Один распиленный профиль: ключ остатка в схеме, вместимость и изделия (вес в единицах разрешения и длина).
+    Вес изделия и вместимость профиля включают ширину реза, как в Cutting
+    """
+    __slots__ = ('key', 'capacity', 'pieces', 'used', 'proven')
+
+    def __init__(self, key: tuple[float, int], capacity: int, pieces: list[tuple[int, float]], proven: bool) -> None:
+        self.key: tuple[float, int] = key
+        self.capacity: int = capacity
+        self.pieces: list[tuple[int, float]] = pieces
+        self.used: int = sum(weight for weight, _ in pieces)  # Суммарный вес изделий
+        self.proven: bool = proven
+
+
+class LocalSearch:
+    """
+    Класс улучшает готовую схему распила локальным поиском: перекладывает изделие из одного профиля в другой,
+    меняет изделия двух профилей местами, переупаковывает изделия пары профилей и освобождает профили целиком.
+    Подходит для схемы любого алгоритма: LocalSearch().improve(algorithm.cut()).
+    Качество схемы - пара (отход, суммарная длина использованных профилей), сравниваемая лексикографически.
+    Вклад каждого профиля в качество зависит только от его заполнения, поэтому изменение качества после хода
+    считается по двум затронутым профилям, а не пересчетом CutScheme.waste() по всей схеме
+
+    Args:
+        time_limit (float) - Время на улучшение одной схемы в секундах. Длины переводятся в целые единицы
+        с разрешением самой схемы (CutScheme.resolution)
+        max_repack_pieces (int) - Пара профилей переупаковывается, только если в ней не больше изделий
+        max_partners (int) - Сколько профилей проверяется в паре с каждым профилем, где есть отход
+        seed (Optional[int]) - Зерно генератора случайных чисел для выбора пар в больших схемах
+    """
+    def __init__(self, time_limit: float = 1.0, max_repack_pieces: int = 24, max_partners: int = 200,
+                 seed: Optional[int] = None) -> None:
+        self.__time_limit: float = time_limit
+        self.__max_repack_pieces: int = max_repack_pieces
+        self.__max_partners: int = max_partners
+        self.__seed: Optional[int] = seed
+
+        # Параметры текущей схемы
+        self.__scale: int = 1000
+        self.__kerf: int = 0
+        self.__min_rest: int = 0
+        self.__deadline: float = 0.0
+        self.__moves: int = 0
+
+    @property
+    def time_limit(self) -> float:
+        """Геттер для self.__time_limit"""
+        return self.__time_limit
+
+    @property
+    def moves(self) -> int:
+        """Количество ходов, принятых при последнем вызове improve()"""
+        return self.__moves
+
+    def to_units(self, length: float) -> int:
+        """
+        Метод переводит длину в метрах в целое число единиц разрешения текущей схемы
+        :param length: Длина в метрах
+        :type length: float
+        :return: Длина в единицах разрешения
+        :rtype: int
+        """
+        return round(length * self.__scale)
+
+    def improve(self, cut_scheme: CutScheme) -> CutScheme:
+        """
+        Метод улучшает схему распила, пока есть улучшающие ходы и не истекло время.
+        Исходная схема не меняется. Профили, распил которых изменился, помечаются как не доказанно оптимальные,
+        у остальных признак сохраняется. Если схему не удалось строго улучшить, то возвращается исходная схема
+        :param cut_scheme: Схема распила
+        :type cut_scheme: CutScheme
+        :return: Улучшенная схема распила
+        :rtype: CutScheme
+        """
+        self.__deadline = time.perf_counter() + self.__time_limit
+        self.__scale = round(1 / cut_scheme.resolution)
+        self.__kerf = self.to_units(cut_scheme.cut_width)
+        self.__min_rest = self.to_units(cut_scheme.min_remnant)
+        self.__moves = 0
+        generator: random.Random = random.Random(self.__seed)
+        bars: list[_Bar] = self.__expand(cut_scheme)
+
+        improved: bool = True
+        while improved and not self.__time_is_up():
+            improved = False
+
+            # 1) Попробуем освободить профили, начиная с наименее заполненных. В большой схеме изделия
+            # перекладываются только в профили с наибольшим свободным местом
+            targets: list[_Bar] = bars if len(bars) <= self.__max_partners else sorted(
+                bars, key=lambda item: item.used - item.capacity)[:self.__max_partners]
+            for bar in sorted(bars, key=lambda item: item.used):
+                if self.__time_is_up():
+                    break
+                if bar.pieces and self.__empty_bar(bar, targets):
+                    improved = True
+            bars = [bar for bar in bars if bar.pieces]
+
+            # 2) Профили с отходом попробуем улучшить в паре с другими профилями
+            for bar in [bar for bar in bars if self.__score(bar.capacity, bar.used, len(bar.pieces))[0] > 0]:
+                if self.__time_is_up():
+                    break
+                partners: list[_Bar] = bars if len(bars) <= self.__max_partners else generator.sample(
+                    bars, self.__max_partners)
+                for partner in partners:
+                    if self.__time_is_up() or not bar.pieces:
+                        break
+                    if partner is bar or not partner.pieces:
+                        continue
+                    if self.__improve_pair(bar, partner):
+                        improved = True
+                        if bar.pieces and self.__score(bar.capacity, bar.used, len(bar.pieces))[0] == 0:
+                            break
+            bars = [bar for bar in bars if bar.pieces]
+
+        # Ходы оцениваются в целых единицах разрешения. Если итоговая схема по CutScheme.waste() не лучше
+        # исходной, то вернем исходную схему
+        result: CutScheme = self.__collect(cut_scheme, bars)
+        if self.__quality(result) >= self.__quality(cut_scheme):
+            self.__moves = 0
+            return cut_scheme
+        return result
+
+    def __time_is_up(self) -> bool:
+        """
+        Метод проверяет, истекло ли время на улучшение схемы
+        :return: True, если время истекло
+        :rtype: bool
+        """
+        return time.perf_counter() > self.__deadline
+
+    def __expand(self, cut_scheme: CutScheme) -> list[_Bar]:
+        """
+        Метод разворачивает схему распила в список профилей (одинаковые распилы - отдельными профилями)
+        :param cut_scheme: Схема распила
+        :type cut_scheme: CutScheme
+        :return: Список профилей
+        :rtype: list[_Bar]
+        """
+        bars: list[_Bar] = list()
+        for remnant, patterns in cut_scheme.patterns.items():
+            capacity: int = self.to_units(remnant[0]) + self.__kerf
+            for pattern in patterns:
+                for _ in range(pattern.count):
+                    pieces: list[tuple[int, float]] = [
+                        (self.to_units(length) + self.__kerf, length) for length in pattern.lengths]
+                    bars.append(_Bar(remnant, capacity, pieces, pattern.proven))
+        return bars
+
+    @classmethod
+    def __collect(cls, cut_scheme: CutScheme, bars: list[_Bar]) -> CutScheme:
+        """
+        Метод собирает схему распила из списка профилей
+        :param cut_scheme: Исходная схема распила (из нее берутся изделия, остатки и параметры)
+        :type cut_scheme: CutScheme
+        :param bars: Список профилей
+        :type bars: list[_Bar]
+        :return: Схема распила
+        :rtype: CutScheme
+        """
+        result: CutScheme = CutScheme(
+            products=cut_scheme.products, remnants=cut_scheme.remnants, cut_scheme=dict(),
+            min_remnant=cut_scheme.min_remnant, cut_width=cut_scheme.cut_width, resolution=cut_scheme.resolution)
+        for bar in bars:
+            if bar.pieces:
+                result.add(bar.key, sorted((length for _, length in bar.pieces), reverse=True), bar.proven)
+
+        # Освобожденные профили уменьшают количество в ключах схемы
+        result.restore_order()
+        return result
+
+    @classmethod
+    def __quality(cls, cut_scheme: CutScheme) -> tuple[float, float]:
+        """
+        Метод считает качество схемы распила: отход по CutScheme.waste() и суммарную длину использованных профилей
+        :param cut_scheme: Схема распила
+        :type cut_scheme: CutScheme
+        :return: Отход и суммарная длина профилей
+        :rtype: tuple[float, float]
+        """
+        total_length: float = sum(remnant[0] * sum(pattern.count for pattern in patterns)
+                                  for remnant, patterns in cut_scheme.patterns.items())
+        return cut_scheme.waste()[0], round(total_length, 3)
+
+    def __score(self, capacity: int, used: int, number: int) -> tuple[int, int]:
+        """
+        Метод считает вклад профиля в качество схемы: отход и длину профиля (неиспользованный профиль ничего не дает)
+        :param capacity: Вместимость профиля
+        :type capacity: int
+        :param used: Суммарный вес изделий
+        :type used: int
+        :param number: Количество изделий
+        :type number: int
+        :return: Отход и вместимость профиля в единицах разрешения
+        :rtype: tuple[int, int]
+        """
+        if number == 0:
+            return 0, 0
+
+        # Остаток после распила с учетом всех резов, как в CutScheme.waste()
+        leftover: int = capacity - used - self.__kerf
+        return (leftover if leftover < self.__min_rest else 0), capacity
+
+    def __delta(self, first: _Bar, first_used: int, first_number: int,
+                second: _Bar, second_used: int, second_number: int) -> tuple[int, int]:
+        """
+        Метод считает изменение качества схемы, если у двух профилей поменяется заполнение
+        :param first: Первый профиль
+        :type first: _Bar
+        :param first_used: Новый суммарный вес изделий первого профиля
+        :type first_used: int
+        :param first_number: Новое количество изделий первого профиля
+        :type first_number: int
+        :param second: Второй профиль
+        :type second: _Bar
+        :param second_used: Новый суммарный вес изделий второго профиля
+        :type second_used: int
+        :param second_number: Новое количество изделий второго профиля
+        :type second_number: int
+        :return: Изменение отхода и изменение суммарной длины профилей
+        :rtype: tuple[int, int]
+        """
+        old_first: tuple[int, int] = self.__score(first.capacity, first.used, len(first.pieces))
+        old_second: tuple[int, int] = self.__score(second.capacity, second.used, len(second.pieces))
+        new_first: tuple[int, int] = self.__score(first.capacity, first_used, first_number)
+        new_second: tuple[int, int] = self.__score(second.capacity, second_used, second_number)
+        return (new_first[0] + new_second[0] - old_first[0] - old_second[0],
+                new_first[1] + new_second[1] - old_first[1] - old_second[1])
+
+    def __empty_bar(self, bar: _Bar, targets: list[_Bar]) -> bool:
+        """
+        Метод пытается разложить все изделия профиля по другим профилям. Каждое изделие (по убыванию веса)
+        кладется в профиль, где отход растет меньше всего, при равенстве - в наиболее заполненный
+        :param bar: Освобождаемый профиль
+        :type bar: _Bar
+        :param targets: Профили, в которые можно переложить изделия
+        :type targets: list[_Bar]
+        :return: True, если профиль освобожден
+        :rtype: bool
+        """
+        extra: dict[int, int] = dict()  # Номер профиля -> добавленный вес
+        added: dict[int, int] = dict()  # Номер профиля -> количество добавленных изделий
+        placement: list[tuple[int, tuple[int, float]]] = list()
+        delta_waste: int = -self.__score(bar.capacity, bar.used, len(bar.pieces))[0]
+
+        for piece in sorted(bar.pieces, reverse=True):
+            best: Optional[tuple[int, int, int]] = None  # (рост отхода, свободное место после, номер профиля)
+            for number, target in enumerate(targets):
+                if target is bar or not target.pieces:
+                    continue
+                used: int = target.used + extra.get(number, 0)
+                if used + piece[0] > target.capacity:
+                    continue
+                pieces: int = len(target.pieces) + added.get(number, 0)
+                growth: int = (self.__score(target.capacity, used + piece[0], pieces + 1)[0]
+                               - self.__score(target.capacity, used, pieces)[0])
+                candidate: tuple[int, int, int] = (growth, target.capacity - used - piece[0], number)
+                if best is None or candidate < best:
+                    best = candidate
+            if best is None:
+                return False
+            delta_waste += best[0]
+            extra[best[2]] = extra.get(best[2], 0) + piece[0]
+            added[best[2]] = added.get(best[2], 0) + 1
+            placement.append((best[2], piece))
+
+        # Профиль освобождается, поэтому суммарная длина профилей уменьшается - достаточно не увеличить отход
+        if delta_waste > 0:
+            return False
+
+        for number, piece in placement:
+            targets[number].pieces.append(piece)
+            targets[number].used += piece[0]
+            targets[number].proven = False
+        bar.pieces = list()
+        bar.used = 0
+        self.__moves += 1
+        return True
+
+    def __improve_pair(self, first: _Bar, second: _Bar) -> bool:
+        """
+        Метод ищет лучший ход для пары профилей: перекладывание изделия, обмен изделиями или переупаковку,
+        и выполняет его, если он улучшает схему
+        :param first: Первый профиль
+        :type first: _Bar
+        :param second: Второй профиль
+        :type second: _Bar
+        :return: True, если схема улучшилась
+        :rtype: bool
+        """
+        best_delta: tuple[int, int] = (0, 0)
+        best_pieces: Optional[tuple[list[tuple[int, float]], list[tuple[int, float]]]] = None
+
+        # Перекладывание одного изделия в другой профиль
+        for source, target in ((first, second), (second, first)):
+            for index, piece in enumerate(source.pieces):
+                if target.used + piece[0] > target.capacity:
+                    continue
+                delta: tuple[int, int] = self.__delta(
+                    source, source.used - piece[0], len(source.pieces) - 1,
+                    target, target.used + piece[0], len(target.pieces) + 1)
+                if delta < best_delta:
+                    best_delta = delta
+                    moved: list[tuple[int, float]] = source.pieces[:index] + source.pieces[index + 1:]
+                    best_pieces = ((moved, target.pieces + [piece]) if source is first
+                                   else (target.pieces + [piece], moved))
+
+        # Обмен изделиями разного веса
+        for first_index, first_piece in enumerate(first.pieces):
+            for second_index, second_piece in enumerate(second.pieces):
+                difference: int = second_piece[0] - first_piece[0]
+                if (difference == 0 or first.used + difference > first.capacity
+                        or second.used - difference > second.capacity):
+                    continue
+                delta = self.__delta(first, first.used + difference, len(first.pieces),
+                                     second, second.used - difference, len(second.pieces))
+                if delta < best_delta:
+                    best_delta = delta
+                    best_pieces = (first.pieces[:first_index] + [second_piece] + first.pieces[first_index + 1:],
+                                   second.pieces[:second_index] + [first_piece] + second.pieces[second_index + 1:])
+
+        # Переупаковка - только если простые ходы не помогли
+        if best_pieces is None and len(first.pieces) + len(second.pieces) <= self.__max_repack_pieces:
+            best_delta, best_pieces = self.__repack(first, second)
+
+        if best_pieces is None:
+            return False
+
+        first.pieces, second.pieces = best_pieces
+        first.proven = second.proven = False
+        first.used = sum(weight for weight, _ in first.pieces)
+        second.used = sum(weight for weight, _ in second.pieces)
+        self.__moves += 1
+        return True
+
+    def __repack(self, first: _Bar, second: _Bar
+                 ) -> tuple[tuple[int, int], Optional[tuple[list[tuple[int, float]], list[tuple[int, float]]]]]:
+        """
+        Метод перебирает все разбиения изделий двух профилей (через достижимые суммы весов первого профиля)
+        и выбирает лучшее
+        :param first: Первый профиль
+        :type first: _Bar
+        :param second: Второй профиль
+        :type second: _Bar
+        :return: Изменение качества и новые списки изделий профилей (None, если улучшения нет)
+        :rtype: tuple[tuple[int, int], Optional[tuple[list[tuple[int, float]], list[tuple[int, float]]]]]
+        """
+        pieces: list[tuple[int, float]] = first.pieces + second.pieces
+        total: int = first.used + second.used
+
+        # Достижимая сумма весов в первом профиле -> (предыдущая сумма, номер добавленного изделия)
+        reachable: dict[int, tuple[int, int]] = {0: (-1, -1)}
+        for index, piece in enumerate(pieces):
+            for current in list(reachable):
+                new_sum: int = current + piece[0]
+                if new_sum <= first.capacity and new_sum not in reachable:
+                    reachable[new_sum] = (current, index)
+
+        # Количество изделий в разбиении влияет только на пустоту профиля, поэтому считаем его при восстановлении
+        best_delta: tuple[int, int] = (0, 0)
+        best_sum: Optional[int] = None
+        for current in reachable:
+            if total - current > second.capacity:
+                continue
+            delta: tuple[int, int] = self.__delta(
+                first, current, 1 if current else 0, second, total - current, 1 if total - current else 0)
+            if delta < best_delta:
+                best_delta = delta
+                best_sum = current
+
+        if best_sum is None:
+            return best_delta, None
+
+        chosen: set[int] = set()
+        current: int = best_sum
+        while current:
+            current, index = reachable[current]
+            chosen.add(index)
+        return best_delta, ([piece for index, piece in enumerate(pieces) if index in chosen],
+                            [piece for index, piece in enumerate(pieces) if index not in chosen])
@@ -1,14 +1,64 @@
 from business.cutting import Cutting
 from business.cut_scheme import CutScheme
 from business.business_exceptions import NoRemnantsError
+from business.pattern_scoring import PatternScorer
+from business.remnant_inventory import RemnantInventory
+from business.product_multiset import ProductMultiset
 
-from copy import deepcopy
 from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Копия объекта расчета в процессе-исполнителе (задается при запуске процесса)
+_worker_cutting: Optional[Cutting] = None
+
+
+def _init_worker(cutting: Cutting) -> None:
+    """
+    Функция запускается в каждом процессе-исполнителе и сохраняет копию объекта расчета
+    :param cutting: Объект расчета
+    :type cutting: Cutting
+    :return: None
+    """
+    global _worker_cutting
+    _worker_cutting = cutting
+    _worker_cutting.reset_search()
+
+
+def _evaluate_remnant(remnant: float, products: ProductMultiset) -> tuple[list[float], bool]:
+    """
+    Функция ищет оптимальный распил остатка в процессе-исполнителе
+    :param remnant: Длина остатка
+    :type remnant: float
+    :param products: Оставшиеся изделия
+    :type products: ProductMultiset
+    :return: Распил и признак доказанной оптимальности
+    :rtype: tuple[list[float], bool]
+    """
+    cutting: list[float] = _worker_cutting.calculate_min_waste(remnant, products)
+    return cutting, _worker_cutting.last_pattern_proven
 
 
 class MiddleCutting(Cutting):
+    """
+    Класс для расчета распила: на каждом шаге выбирается остаток с наименьшим отходом
+
+    Args:
+        workers (int) - Количество процессов для параллельного поиска распилов разных остатков.
+        Если меньше 2 - расчет идет в одном процессе. Результат от количества процессов не зависит
+        Остальные аргументы - как у Cutting
+    """
     __name__ = 'MiddleCutting'
 
+    def __init__(self, *, workers: int = 0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.__workers: int = workers
+
+    @property
+    def workers(self) -> int:
+        """Геттер для self.__workers"""
+        return self.__workers
+
     def __str__(self) -> str:
         return ('Данный метод сначала ищет остаток, для которого распил будет оптимальным,'
                 ' и так по очереди рассчитывает распил для всех изделий')
@@ -22,54 +72,117 @@ class MiddleCutting(Cutting):
         второй - количество остатков данной длины. Значения словаря - список списков изделий для одного такого остатка
         :rtype: dict[tuple[float, int], list[list[float]]]
         """
+        self.reset_search()  # Кэш распилов общий только в пределах одного расчета
+
+        if self.__workers < 2:
+            return self.__cut(executor=None)
+
+        with ProcessPoolExecutor(max_workers=self.__workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            return self.__cut(executor=executor)
+
+    def __cut(self, executor: Optional[ProcessPoolExecutor]) -> CutScheme:
+        """
+        Метод выполняет расчет распила для MiddleCutting.cut()
+        :param executor: Пул процессов для поиска распилов или None, если расчет идет в одном процессе
+        :type executor: Optional[ProcessPoolExecutor]
+        :raise NoRemnantError: Если остатков и целых профилей не хватит на изделия
+        :return: Схема распила
+        :rtype: CutScheme
+        """
         cutting_scheme: dict[tuple[float, int], list[list[float]]] = dict()
-        current_remnants: set[tuple[float, int]] = self.generate_keys(self.remnants, min(self.products))
-        current_products: list[float] = deepcopy(self.products)
+        proven_scheme: dict[tuple[float, int], list[bool]] = dict()  # Доказана ли оптимальность каждого распила
+        current_remnants: RemnantInventory = RemnantInventory.from_counts(self.remnant_counts, self.min_product)
+        current_products: ProductMultiset = ProductMultiset.from_counts(self.product_counts)
+        # Лучшие распилы для каждой длины остатка с прошлых итераций и доказана ли их оптимальность
+        patterns: dict[float, tuple[list[float], bool]] = dict()
 
-        # Если есть цельные профиля, добавим в список один для поиска наименьшего остатка
-        if self.number_whole_profiles > 0:
-            current_remnants.add((self.whole_profile_length, self.number_whole_profiles))
+        # Добавим все виды цельных профилей в список остатков
+        for length, number, cost in self.whole_profiles:
+            current_remnants.add(length, number, length * cost)
 
         while current_products:
             # Если нет остатков и нет цельных профилей, то выбросим исключение
             if not current_remnants:
                 beautiful_scheme: CutScheme = CutScheme(
                     cut_scheme=cutting_scheme, min_remnant=self.min_rest_length, cut_width=self.cutting_width,
-                    products=self.products, remnants=self.remnants)
+                    products=self.product_counts, remnants=self.remnant_counts, proven=proven_scheme,
+                    resolution=self.resolution)
                 beautiful_scheme.restore_order()
                 raise NoRemnantsError(title='Не хватает остатков и цельных профилей', cut_scheme=beautiful_scheme)
 
-            # Найдем остаток, для которого распил будет самым оптимальным
-            min_waste: float = self.whole_profile_length
+            # Найдем остаток, для которого распил будет самым оптимальным.
+            # При равном отходе (с точностью до разрешения) берется более дешевый профиль
+            min_score: Optional[tuple[int, float]] = None
             best_remnant: Optional[tuple[float, int]] = None
             best_cutting: list[float] = list()
+            best_proven: bool = True
+
+            # Распил остатка пересчитывается, только если прошлый распил задел уже использованные изделия
+            candidates: list[tuple[float, int]] = list(current_remnants)
+            stale: list[float] = [
+                remnant[0] for remnant in candidates
+                if remnant[0] not in patterns or not current_products.contains(patterns[remnant[0]][0])]
+            patterns.update(zip(stale, self.__evaluate(stale, current_products, executor)))
 
-            for remnant in current_remnants:
-                current_cutting: list[float] = self.calculate_min_waste(remnant[0], current_products)
-                waste = remnant[0] - sum(current_cutting) - len(current_cutting) * self.cutting_width
-                if waste < min_waste:
-                    min_waste = waste
+            # Отходы всех кандидатов считаются одной пакетной операцией
+            wastes: list[float] = PatternScorer.leftovers(
+                [remnant[0] for remnant in candidates],
+                [patterns[remnant[0]][0] for remnant in candidates],
+                self.cutting_width)
+
+            for remnant, waste in zip(candidates, wastes):
+                current_cutting, current_proven = patterns[remnant[0]]
+                score: tuple[int, float] = (self.to_units(waste), current_remnants.cost(remnant))
+                if min_score is None or score < min_score:
+                    min_score = score
                     best_remnant = remnant
                     best_cutting = current_cutting
+                    best_proven = current_proven
 
             # Добавим его в итоговый словарь
             if best_remnant in cutting_scheme:
                 cutting_scheme[best_remnant].append(best_cutting)
+                proven_scheme[best_remnant].append(best_proven)
             else:
                 cutting_scheme[best_remnant] = [best_cutting]
+                proven_scheme[best_remnant] = [best_proven]
 
             # Уберем использованный остаток и полученные изделия для следующих итераций
-            if len(cutting_scheme[best_remnant]) == best_remnant[1]:
-                current_remnants.remove(best_remnant)
-            current_products = self.remove_list_from_array(current_products, best_cutting)
+            current_remnants.decrement(best_remnant)
+            current_products.remove(best_cutting)
             # Некоторые остатки могут быть меньше всех оставшихся изделий - их тоже уберем
             if len(current_products) >= 1:
-                current_remnants = {remnant for remnant in current_remnants if remnant[0] >= min(current_products)}
+                current_remnants.prune_below(current_products.minimum)
 
         # В словарь добавляются ключи, в которых указываются количества имеющихся остатков
         # Но при этом в схеме могут использоваться не все остатки одной длины. Эту ситуацию необходимо поправить
         beautiful_scheme: CutScheme = CutScheme(
             cut_scheme=cutting_scheme, min_remnant=self.min_rest_length, cut_width=self.cutting_width,
-            products=self.products, remnants=self.remnants)
+            products=self.product_counts, remnants=self.remnant_counts, proven=proven_scheme,
+            resolution=self.resolution)
         beautiful_scheme.restore_order()  # Избавляемся от неиспользованных остатков
         return beautiful_scheme
+
+    def __evaluate(self, remnants: list[float], products: ProductMultiset,
+                   executor: Optional[ProcessPoolExecutor]) -> list[tuple[list[float], bool]]:
+        """
+        Метод ищет оптимальные распилы нескольких остатков - последовательно или в пуле процессов.
+        Порядок результатов совпадает с порядком остатков, поэтому выбор лучшего остатка не зависит от режима
+        :param remnants: Длины остатков
+        :type remnants: list[float]
+        :param products: Оставшиеся изделия
+        :type products: ProductMultiset
+        :param executor: Пул процессов или None
+        :type executor: Optional[ProcessPoolExecutor]
+        :return: Для каждого остатка - распил и признак доказанной оптимальности
+        :rtype: list[tuple[list[float], bool]]
+        """
+        if executor is None or len(remnants) < 2:
+            result: list[tuple[list[float], bool]] = list()
+            for remnant in remnants:
+                result.append((self.calculate_min_waste(remnant, products), self.last_pattern_proven))
+            return result
+
+        chunk_size: int = max(1, len(remnants) // self.__workers)
+        return list(executor.map(_evaluate_remnant, remnants, repeat(products, len(remnants)), chunksize=chunk_size))
@@ -0,0 +1,157 @@
+"""Модуль для расчета распила наряда, в котором есть профили нескольких видов"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Type, Union
+
+from business.cutting import Cutting
+from business.cut_scheme import CutScheme
+from business.middle_cutting import MiddleCutting
+from business.local_search import LocalSearch
+from business.business_exceptions import NoRemnantsError
+
+
+def _solve_profile(algorithm: Type[Cutting], products: Union[list[float], dict[float, int]],
+                   remnants: Union[list[float], dict[float, int]], params: dict,
+                   post_optimizer: Optional[LocalSearch] = None) -> tuple[CutScheme, Optional[str]]:
+    """
+    Функция рассчитывает распил профилей одного вида (выполняется в процессе-исполнителе)
+    :param algorithm: Класс с алгоритмом
+    :type algorithm: Type[Cutting]
+    :param products: Список изделий или словарь {длина: количество}
+    :type products: Union[list[float], dict[float, int]]
+    :param remnants: Список остатков или словарь {длина: количество}
+    :type remnants: Union[list[float], dict[float, int]]
+    :param params: Остальные аргументы алгоритма
+    :type params: dict
+    :param post_optimizer: Локальный поиск для улучшения полученной схемы или None
+    :type post_optimizer: Optional[LocalSearch]
+    :return: Схема распила и текст ошибки (None, если ошибки нет). Если остатков не хватило - схема неполная
+    :rtype: tuple[CutScheme, Optional[str]]
+    """
+    try:
+        cut_scheme: CutScheme = algorithm(in_products=products, remnants=remnants, **params).cut()
+    except NoRemnantsError as exc:
+        # Исключение с аргументами конструктора не передается между процессами - вернем его текст
+        return exc.cut_scheme, exc.title
+
+    if post_optimizer is not None:
+        cut_scheme = post_optimizer.improve(cut_scheme)
+    return cut_scheme, None
+
+
+class OrderReport:
+    """
+    Класс хранит результат расчета наряда: схемы распила по видам профилей и суммарный отход
+
+    Args:
+        schemes (dict[str, CutScheme]) - Схемы распила по видам профилей
+        errors (dict[str, str]) - Ошибки расчета по видам профилей (для видов, где не хватило остатков)
+    """
+    def __init__(self, schemes: dict[str, CutScheme], errors: dict[str, str]) -> None:
+        self.__schemes: dict[str, CutScheme] = schemes
+        self.__errors: dict[str, str] = errors
+
+    @property
+    def schemes(self) -> dict[str, CutScheme]:
+        """Геттер для self.__schemes"""
+        return self.__schemes
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """Геттер для self.__errors"""
+        return self.__errors
+
+    def waste(self) -> tuple[float, float]:
+        """
+        Метод считает суммарный отход по всем видам профилей
+        :return: Абсолютный и относительный отходы
+        :rtype: tuple[float, float]
+        """
+        total_waste: float = 0.0
+        total_remnant: float = 0.0
+
+        for cut_scheme in self.__schemes.values():
+            if not cut_scheme.patterns:
+                continue
+            total_waste += cut_scheme.waste()[0]
+            total_remnant += sum(remnant[0] * remnant[1] for remnant in cut_scheme.patterns)
+
+        waste_percent: float = round(total_waste * 100 / total_remnant, 3) if total_remnant else 0.0
+        return round(total_waste, 3), waste_percent
+
+    def __str__(self) -> str:
+        """
+        Функция преобразует результат расчета наряда в удобно читаемый текст
+        :return: Строковое представление результата
+        :rtype: str
+        """
+        result_string: str = ''
+
+        for profile, cut_scheme in self.__schemes.items():
+            result_string += f'Профиль {profile}:\n{cut_scheme}'
+            if profile in self.__errors:
+                result_string += f'Ошибка: {self.__errors[profile]}\n'
+            if cut_scheme.patterns:
+                total_waste, percent_waste = cut_scheme.waste()
+                result_string += f'Отход: {total_waste} м ({percent_waste} %)\n'
+            result_string += '\n'
+
+        total_waste, percent_waste = self.waste()
+        result_string += f'Суммарный отход: {total_waste} м ({percent_waste} %)\n'
+        return result_string
+
+
+class Order:
+    """
+    Класс рассчитывает распил наряда, в котором есть профили нескольких видов (сечений, цветов).
+    Для каждого вида свои изделия, остатки и параметры, поэтому задачи независимы и считаются параллельно
+    в пуле процессов
+
+    Args:
+        profiles (dict[str, tuple[Union[list, dict], Union[list, dict], dict]]) - Для каждого вида профиля:
+        изделия и остатки (списком или словарем {длина: количество}) и остальные аргументы алгоритма
+        (correction, whole_profiles, cutting_width и т.д.)
+        algorithm (Type[Cutting]) - Класс с алгоритмом расчета
+        workers (Optional[int]) - Количество процессов. Если None - по числу ядер, если меньше 2 - расчет
+        идет в одном процессе
+        post_optimizer (Optional[LocalSearch]) - Локальный поиск, которым улучшается схема каждого вида профиля
+    """
+    def __init__(self, profiles: dict[str, tuple[Union[list, dict], Union[list, dict], dict]],
+                 algorithm: Type[Cutting] = MiddleCutting, workers: Optional[int] = None,
+                 post_optimizer: Optional[LocalSearch] = None) -> None:
+        self.__profiles: dict[str, tuple[Union[list, dict], Union[list, dict], dict]] = profiles
+        self.__algorithm: Type[Cutting] = algorithm
+        self.__workers: Optional[int] = workers
+        self.__post_optimizer: Optional[LocalSearch] = post_optimizer
+
+    @property
+    def profiles(self) -> dict[str, tuple[Union[list, dict], Union[list, dict], dict]]:
+        """Геттер для self.__profiles"""
+        return self.__profiles
+
+    @property
+    def algorithm(self) -> Type[Cutting]:
+        """Геттер для self.__algorithm"""
+        return self.__algorithm
+
+    def cut(self) -> OrderReport:
+        """
+        Метод рассчитывает распил всех видов профилей
+        :return: Результат расчета наряда. Порядок видов профилей совпадает с порядком в profiles
+        :rtype: OrderReport
+        """
+        names: list[str] = list(self.__profiles)
+        results: list[tuple[CutScheme, Optional[str]]]
+
+        if (self.__workers is not None and self.__workers < 2) or len(names) < 2:
+            results = [_solve_profile(self.__algorithm, *self.__profiles[name], self.__post_optimizer)
+                       for name in names]
+        else:
+            with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+                futures = [executor.submit(_solve_profile, self.__algorithm, *self.__profiles[name],
+                                           self.__post_optimizer)
+                           for name in names]
+                results = [future.result() for future in futures]
+
+        schemes: dict[str, CutScheme] = {name: cut_scheme for name, (cut_scheme, _) in zip(names, results)}
+        errors: dict[str, str] = {name: error for name, (_, error) in zip(names, results) if error is not None}
+        return OrderReport(schemes, errors)
@@ -0,0 +1,85 @@
+"""Модуль с кэшем результатов поиска оптимального распила одного остатка"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class PatternCache:
+    """
+    Класс для кэширования найденных распилов (LRU-кэш ограниченного размера).
+    Ключ - состояние поиска (вместимость остатка в единицах разрешения, оставшаяся часть вектора спроса -
+    кортеж пар (вес изделия, количество), начиная с текущей позиции поиска),
+    значение - неизменяемый результат поиска для этого состояния (суммарный вес заполнения,
+    кортеж пар (вес изделия, взятое количество))
+
+    Args:
+        max_size (int) - Максимальное количество хранимых распилов. Если 0 - кэш отключен
+    """
+    def __init__(self, max_size: int = 100_000) -> None:
+        self.__max_size: int = max_size
+        self.__patterns: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """Геттер для self.__max_size"""
+        return self.__max_size
+
+    @property
+    def hits(self) -> int:
+        """Геттер для self.__hits"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Геттер для self.__misses"""
+        return self.__misses
+
+    def __len__(self) -> int:
+        return len(self.__patterns)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Метод возвращает сохраненный результат и помечает его как недавно использованный
+        :param key: Каноническое состояние поиска
+        :type key: Hashable
+        :return: Сохраненный результат или None, если его нет в кэше
+        :rtype: Optional[Any]
+        """
+        pattern: Optional[Any] = self.__patterns.get(key)
+
+        if pattern is None:
+            self.__misses += 1
+            return None
+
+        self.__hits += 1
+        self.__patterns.move_to_end(key)
+        return pattern
+
+    def put(self, key: Hashable, pattern: Any) -> None:
+        """
+        Метод сохраняет результат. Если кэш переполнен - удаляется самый давно использованный.
+        Результат должен быть неизменяемым, так как он возвращается без копирования
+        :param key: Каноническое состояние поиска
+        :type key: Hashable
+        :param pattern: Результат поиска
+        :type pattern: Any
+        :return: None
+        """
+        if self.__max_size <= 0:
+            return
+
+        self.__patterns[key] = pattern
+        self.__patterns.move_to_end(key)
+
+        if len(self.__patterns) > self.__max_size:
+            self.__patterns.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Метод очищает кэш и статистику попаданий
+        :return: None
+        """
+        self.__patterns.clear()
+        self.__hits = 0
+        self.__misses = 0
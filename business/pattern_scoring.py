@@ -0,0 +1,109 @@
+"""Модуль с пакетным расчетом остатков и отходов для многих распилов сразу (через NumPy, если он установлен)"""
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+
+class PatternScorer:
+    """
+    Класс считает остаток после распила сразу для списка распилов. Распилы хранятся как пара
+    "все длины подряд + номер распила для каждой длины" (аналог CSR), поэтому суммы считаются одной операцией.
+    Суммирование внутри каждого распила идет в том же порядке, что и sum(), поэтому результат совпадает
+    с поэлементным расчетом. Без NumPy или для маленьких списков используется обычный Python
+    """
+    MIN_BATCH: int = 32  # Меньше этого количества распилов накладные расходы NumPy больше выигрыша
+
+    @classmethod
+    def numpy_available(cls) -> bool:
+        """
+        Метод проверяет, установлен ли NumPy
+        :return: True, если NumPy доступен
+        :rtype: bool
+        """
+        return np is not None
+
+    @classmethod
+    def leftovers(cls, bars: list[float], patterns: Sequence[Sequence[float]], cut_width: float) -> list[float]:
+        """
+        Метод считает остаток каждого профиля после распила: длина - сумма изделий - ширина резов
+        :param bars: Длины профилей (остатков)
+        :type bars: list[float]
+        :param patterns: Распилы, по одному на каждый профиль
+        :type patterns: list[list[float]]
+        :param cut_width: Ширина реза
+        :type cut_width: float
+        :return: Остатки после распила
+        :rtype: list[float]
+        """
+        if np is None or len(patterns) < cls.MIN_BATCH:
+            return [bar - sum(pattern) - len(pattern) * cut_width for bar, pattern in zip(bars, patterns)]
+
+        return cls.__leftovers_array(bars, patterns, cut_width).tolist()
+
+    @classmethod
+    def scheme_waste(cls, bars: list[float], patterns: Sequence[Sequence[float]], cut_width: float,
+                     min_remnant: float, repeats: Optional[list[int]] = None,
+                     resolution: Optional[float] = None) -> tuple[float, float]:
+        """
+        Метод считает суммарный отход схемы: стружку от всех резов и остатки короче минимальной длины.
+        Если задано разрешение, то остаток сравнивается с минимальной длиной в целых единицах разрешения,
+        как при расчете распила: иначе остаток ровно минимальной длины из-за погрешности float может
+        оказаться чуть короче нее
+        :param bars: Длины профилей (остатков), по одному на каждый распил
+        :type bars: list[float]
+        :param patterns: Распилы
+        :type patterns: list[list[float]]
+        :param cut_width: Ширина реза
+        :type cut_width: float
+        :param min_remnant: Минимальная длина остатка
+        :type min_remnant: float
+        :param repeats: Сколько раз повторяется каждый распил. Если None - каждый распил встречается один раз
+        :type repeats: Optional[list[int]]
+        :param resolution: Разрешение длин (м). Если None - остатки сравниваются как float
+        :type resolution: Optional[float]
+        :return: Суммарная стружка и суммарная длина остатков, ушедших в отход
+        :rtype: tuple[float, float]
+        """
+        if repeats is None:
+            repeats = [1] * len(patterns)
+        scale: Optional[int] = None if resolution is None else round(1 / resolution)
+        min_units: Optional[int] = None if scale is None else round(min_remnant * scale)
+
+        if np is None or len(patterns) < cls.MIN_BATCH:
+            shavings: float = 0.0
+            short_leftovers: float = 0.0
+            for bar, pattern, repeat in zip(bars, patterns, repeats):
+                shavings += cut_width * len(pattern) * repeat
+                leftover: float = bar - sum(pattern) - cut_width * len(pattern)
+                if leftover < min_remnant if scale is None else round(leftover * scale) < min_units:
+                    short_leftovers += leftover * repeat
+            return shavings, short_leftovers
+
+        leftovers = cls.__leftovers_array(bars, patterns, cut_width)
+        counts = np.fromiter((len(pattern) for pattern in patterns), dtype=np.int64, count=len(patterns))
+        weights = np.asarray(repeats, dtype=np.int64)
+        short = leftovers < min_remnant if scale is None else np.rint(leftovers * scale) < min_units
+        return float(cut_width * (counts * weights).sum()), float((leftovers[short] * weights[short]).sum())
+
+    @classmethod
+    def __leftovers_array(cls, bars: list[float], patterns: Sequence[Sequence[float]], cut_width: float):
+        """
+        Метод считает остатки через NumPy
+        :param bars: Длины профилей
+        :type bars: list[float]
+        :param patterns: Распилы
+        :type patterns: list[list[float]]
+        :param cut_width: Ширина реза
+        :type cut_width: float
+        :return: Массив остатков
+        :rtype: np.ndarray
+        """
+        counts = np.fromiter((len(pattern) for pattern in patterns), dtype=np.int64, count=len(patterns))
+        lengths = np.fromiter((length for pattern in patterns for length in pattern), dtype=np.float64,
+                              count=int(counts.sum()))
+        owners = np.repeat(np.arange(len(patterns)), counts)  # Номер распила для каждой длины
+        sums = np.bincount(owners, weights=lengths, minlength=len(patterns))
+        return np.asarray(bars, dtype=np.float64) - sums - counts * cut_width
@@ -0,0 +1,161 @@
+"""Модуль с таблицей максимальных распилов цельного профиля"""
+import time
+from typing import Optional
+
+
+class PatternTable:
+    """
+    Класс хранит все максимальные распилы профиля одной длины для изделий наряда. Распил максимален, если в него
+    нельзя добавить ни одного изделия наряда. Для любого остатка изделий лучший распил получается из какого-то
+    максимального распила, если убрать из него изделия, которых уже нет. Поэтому лучший распил для текущих изделий
+    находится просмотром таблицы, а не новым поиском. Распилы отсортированы по убыванию заполнения, и просмотр
+    останавливается, как только заполнение распила не больше уже найденного
+
+    Args:
+        capacity (int) - Вместимость профиля (длина плюс ширина одного реза) в единицах разрешения
+        demand (tuple[tuple[int, int], ...]) - Изделия всего наряда: пары (вес, количество) по убыванию веса
+        max_patterns (int) - Максимальное количество распилов в таблице. Если распилов больше - таблица не строится
+        deadline (Optional[float]) - Момент time.perf_counter(), после которого таблица не строится
+    """
+    TIME_CHECK: int = 4096  # Время проверяется раз в столько узлов перебора
+
+    def __init__(self, capacity: int, demand: tuple[tuple[int, int], ...], max_patterns: int = 20_000,
+                 deadline: Optional[float] = None) -> None:
+        self.__capacity: int = capacity
+        self.__weights: list[int] = [weight for weight, _ in demand]
+        self.__bounds: list[int] = [min(number, capacity // weight) for weight, number in demand]
+        self.__positions: dict[int, int] = {weight: position for position, weight in enumerate(self.__weights)}
+        self.__fills: list[int] = list()
+        self.__patterns: list[tuple[tuple[int, int], ...]] = list()  # Пары (номер веса, количество)
+        # Изделия и лучший распил прошлого запроса: если изделий стало меньше, а распил еще доступен целиком,
+        # то он остается лучшим, и таблицу можно не просматривать
+        self.__last_demand: list[int] = list()
+        self.__last_pattern: Optional[tuple[tuple[int, int], ...]] = None
+        self.__complete: bool = self.__enumerate(max_patterns, deadline)
+
+        if self.__complete:
+            order: list[int] = sorted(range(len(self.__fills)), key=lambda number: -self.__fills[number])
+            self.__fills = [self.__fills[number] for number in order]
+            self.__patterns = [self.__patterns[number] for number in order]
+        else:
+            self.__fills, self.__patterns = list(), list()
+
+    @property
+    def capacity(self) -> int:
+        """Геттер для self.__capacity"""
+        return self.__capacity
+
+    @property
+    def complete(self) -> bool:
+        """True, если перебраны все максимальные распилы и таблицей можно пользоваться"""
+        return self.__complete
+
+    def __len__(self) -> int:
+        return len(self.__patterns)
+
+    def __enumerate(self, max_patterns: int, deadline: Optional[float]) -> bool:
+        """
+        Метод перебирает максимальные распилы обходом в глубину с явным стеком. Для каждого веса количество
+        перебирается от наибольшего к нулю. Если количество меньше возможного, то все следующие изделия вместе
+        должны занять столько, чтобы это изделие больше не помещалось - иначе ветвь отсекается
+        :param max_patterns: Максимальное количество распилов
+        :type max_patterns: int
+        :param deadline: Момент time.perf_counter(), после которого перебор прекращается
+        :type deadline: Optional[float]
+        :return: True, если перебор завершен
+        :rtype: bool
+        """
+        number_weights: int = len(self.__weights)
+        if number_weights == 0:
+            return True
+
+        # Наибольший суммарный вес изделий, начиная с каждого веса
+        suffix_fills: list[int] = [0] * (number_weights + 1)
+        for position in range(number_weights - 1, -1, -1):
+            suffix_fills[position] = suffix_fills[position + 1] + self.__weights[position] * self.__bounds[position]
+
+        quantities: list[int] = [0] * number_weights
+        # Узел стека: [номер веса, перебираемое количество, свободное место до него, наименьший недобранный вес]
+        no_limit: int = self.__capacity + 1
+        stack: list[list[int]] = [[0, min(self.__bounds[0], self.__capacity // self.__weights[0]),
+                                   self.__capacity, no_limit]]
+        nodes: int = 0
+
+        while stack:
+            node: list[int] = stack[-1]
+            position, number, free, missing = node
+            if number < 0:
+                stack.pop()
+                continue
+            node[1] -= 1
+
+            nodes += 1
+            if deadline is not None and nodes % self.TIME_CHECK == 0 and time.perf_counter() > deadline:
+                return False
+
+            weight: int = self.__weights[position]
+            quantities[position] = number
+            rest: int = free - number * weight
+            if number < self.__bounds[position]:
+                missing = min(missing, weight)
+
+            # Даже если следующие изделия займут все, что могут, недобранное изделие все равно поместится
+            if rest - min(rest, suffix_fills[position + 1]) >= missing:
+                continue
+
+            if position + 1 == number_weights:
+                if rest < missing:
+                    self.__fills.append(self.__capacity - rest)
+                    self.__patterns.append(tuple(
+                        (index, count) for index, count in enumerate(quantities) if count > 0))
+                    if len(self.__patterns) > max_patterns:
+                        return False
+                continue
+
+            next_weight: int = self.__weights[position + 1]
+            stack.append([position + 1, min(self.__bounds[position + 1], rest // next_weight), rest, missing])
+
+        return True
+
+    def best_fill(self, demand: tuple[tuple[int, int], ...]) -> Optional[tuple[int, tuple[tuple[int, int], ...]]]:
+        """
+        Метод ищет лучший распил для текущих изделий: каждый распил таблицы ограничивается текущими количествами
+        :param demand: Текущие изделия: пары (вес, количество) по убыванию веса
+        :type demand: tuple[tuple[int, int], ...]
+        :return: Заполнение и количества изделий каждого веса (пары (вес, количество)) или None, если таблица
+        не построена или текущих изделий какого-то веса больше, чем в наряде
+        :rtype: Optional[tuple[int, tuple[tuple[int, int], ...]]]
+        """
+        if not self.__complete:
+            return None
+
+        current: list[int] = [0] * len(self.__weights)
+        for weight, number in demand:
+            position: Optional[int] = self.__positions.get(weight)
+            if position is None or min(number, self.__capacity // weight) > self.__bounds[position]:
+                return None
+            current[position] = number
+
+        if (self.__last_pattern is not None
+                and all(count <= current[position] for position, count in self.__last_pattern)
+                and all(number <= last for number, last in zip(current, self.__last_demand))):
+            return (sum(self.__weights[position] * count for position, count in self.__last_pattern),
+                    tuple((self.__weights[position], count) for position, count in self.__last_pattern))
+
+        best_fill: int = 0
+        best_pattern: tuple[tuple[int, int], ...] = tuple()
+        for fill, pattern in zip(self.__fills, self.__patterns):
+            # Распилы идут по убыванию заполнения, а ограничение количеств заполнение только уменьшает
+            if fill <= best_fill:
+                break
+            clipped: int = sum(self.__weights[position] * min(count, current[position])
+                               for position, count in pattern)
+            if clipped > best_fill:
+                best_fill = clipped
+                best_pattern = pattern
+
+        clipped_pattern: tuple[tuple[int, int], ...] = tuple(
+            (position, min(count, current[position])) for position, count in best_pattern if current[position] > 0)
+        self.__last_demand = current
+        self.__last_pattern = clipped_pattern
+        return best_fill, tuple((self.__weights[position], count) for position, count in clipped_pattern)
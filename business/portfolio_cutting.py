@@ -0,0 +1,298 @@
+"""Модуль, отвечающий за одновременный запуск всех алгоритмов расчета распила (портфель алгоритмов)"""
+import multiprocessing
+import queue
+import time
+from typing import Optional, Type
+
+from business.cutting import Cutting
+from business.business_exceptions import NoRemnantsError
+from business.cut_scheme import CutScheme
+from business.pattern_scoring import PatternScorer
+
+
+def _run_algorithm(algorithm: Type[Cutting], params: dict, results: multiprocessing.Queue) -> None:
+    """
+    Функция рассчитывает распил одним алгоритмом и кладет результат в очередь (выполняется в отдельном процессе)
+    :param algorithm: Класс с алгоритмом
+    :type algorithm: Type[Cutting]
+    :param params: Аргументы алгоритма
+    :type params: dict
+    :param results: Очередь результатов: (имя алгоритма, схема распила, текст ошибки, время расчета)
+    :type results: multiprocessing.Queue
+    :return: None
+    """
+    start_time: float = time.perf_counter()
+    cut_scheme: Optional[CutScheme] = None
+    error: Optional[str] = None
+    try:
+        cut_scheme = algorithm(**params).cut()
+    except NoRemnantsError as exc:
+        # Исключение с аргументами конструктора не передается между процессами - передадим его текст
+        cut_scheme, error = exc.cut_scheme, exc.title
+    except Exception as exc:  # Ошибка одного алгоритма не должна останавливать остальные
+        error = repr(exc)
+    results.put((algorithm.__name__, cut_scheme, error, time.perf_counter() - start_time))
+
+
+class PortfolioEntry:
+    """
+    Класс хранит результат одного алгоритма из портфеля
+
+    Args:
+        name (str) - Имя алгоритма
+        latency (float) - Время расчета в секундах (для остановленного алгоритма - время до остановки)
+        waste (Optional[tuple[float, float]]) - Абсолютный и относительный отходы или None, если схемы нет
+        error (Optional[str]) - Текст ошибки, если алгоритм не рассчитал полный распил
+    """
+    __slots__ = ('__name', '__latency', '__waste', '__error')
+
+    def __init__(self, name: str, latency: float, waste: Optional[tuple[float, float]] = None,
+                 error: Optional[str] = None) -> None:
+        self.__name: str = name
+        self.__latency: float = latency
+        self.__waste: Optional[tuple[float, float]] = waste
+        self.__error: Optional[str] = error
+
+    @property
+    def name(self) -> str:
+        """Геттер для self.__name"""
+        return self.__name
+
+    @property
+    def latency(self) -> float:
+        """Геттер для self.__latency"""
+        return self.__latency
+
+    @property
+    def waste(self) -> Optional[tuple[float, float]]:
+        """Геттер для self.__waste"""
+        return self.__waste
+
+    @property
+    def error(self) -> Optional[str]:
+        """Геттер для self.__error"""
+        return self.__error
+
+    def __str__(self) -> str:
+        result: str = f'{self.__name}: {round(self.__latency, 3)} с'
+        if self.__waste is not None:
+            result += f', отход {self.__waste[0]} м ({self.__waste[1]} %)'
+        if self.__error is not None:
+            result += f', {self.__error}'
+        return result
+
+
+class PortfolioCutting(Cutting, register=False):
+    """
+    Класс запускает все зарегистрированные алгоритмы (Cutting.algorithms()) на одних и тех же данных,
+    каждый в своем процессе, и возвращает схему с наименьшим отходом. Как только какой-то алгоритм вернет схему,
+    где отход равен стружке от резов (меньше быть не может), остальные алгоритмы останавливаются.
+    Когда истекает deadline, незавершенные алгоритмы тоже останавливаются, но если к этому времени нет ни одной
+    полной схемы, ожидается первая, пока работает хотя бы один алгоритм. Алгоритм, чей процесс завершился
+    без результата, записывается в results с ошибкой. Результаты всех алгоритмов доступны в results
+
+    Args:
+        algorithms (Optional[list[Type[Cutting]]]) - Алгоритмы портфеля. Если None - все зарегистрированные
+        deadline (float) - Время на расчет всего портфеля в секундах
+        Остальные аргументы - как у Cutting, они передаются каждому алгоритму
+    """
+    __name__ = 'PortfolioCutting'
+    CANCELLED: str = 'Расчет остановлен'
+    CRASHED: str = 'Процесс алгоритма завершился без результата'
+    POLL_INTERVAL: float = 0.1  # Как часто проверяется, что процессы алгоритмов еще работают (секунды)
+
+    def __init__(self, *, algorithms: Optional[list[Type[Cutting]]] = None, deadline: float = 10.0,
+                 **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.__params: dict = kwargs
+        self.__algorithms: list[Type[Cutting]] = (list(Cutting.algorithms().values()) if algorithms is None
+                                                  else algorithms)
+        self.__deadline: float = deadline
+        self.__results: dict[str, PortfolioEntry] = dict()
+        self.__winner: Optional[str] = None
+
+    @property
+    def algorithms(self) -> list[Type[Cutting]]:
+        """Геттер для self.__algorithms"""
+        return self.__algorithms
+
+    @property
+    def results(self) -> dict[str, PortfolioEntry]:
+        """Результаты алгоритмов в последнем расчете: имя алгоритма -> время, отход и ошибка"""
+        return self.__results
+
+    @property
+    def winner(self) -> Optional[str]:
+        """Имя алгоритма, чья схема выбрана в последнем расчете"""
+        return self.__winner
+
+    def __str__(self) -> str:
+        return ('Данный метод одновременно запускает все алгоритмы и выбирает распил с наименьшим отходом: '
+                + ', '.join(algorithm.__name__ for algorithm in self.__algorithms))
+
+    def input_params(self) -> dict:
+        """
+        Метод возвращает входные данные расчета, включая состав портфеля и время на расчет
+        :return: Словарь с входными данными
+        :rtype: dict
+        """
+        params: dict = super().input_params()
+        params.update(algorithms=[algorithm.__name__ for algorithm in self.__algorithms], deadline=self.__deadline)
+        return params
+
+    @classmethod
+    def is_minimal(cls, cut_scheme: CutScheme) -> bool:
+        """
+        Метод проверяет, что отход схемы равен стружке от резов, то есть ни один остаток не ушел в отход.
+        Стружка зависит только от количества изделий, поэтому отход такой схемы меньше быть не может
+        :param cut_scheme: Схема распила
+        :type cut_scheme: CutScheme
+        :return: True, если отход схемы доказанно минимален
+        :rtype: bool
+        """
+        bars: list[float] = list()
+        patterns: list = list()
+        repeats: list[int] = list()
+        for remnant, remnant_patterns in cut_scheme.patterns.items():
+            for pattern in remnant_patterns:
+                bars.append(remnant[0])
+                patterns.append(pattern.lengths)
+                repeats.append(pattern.count)
+
+        _, short_leftovers = PatternScorer.scheme_waste(
+            bars, patterns, cut_scheme.cut_width, cut_scheme.min_remnant, repeats, cut_scheme.resolution)
+        return abs(short_leftovers) < 1e-9
+
+    def __record(self, message: tuple, schemes: dict[str, CutScheme],
+                 partial_schemes: dict[str, CutScheme]) -> bool:
+        """
+        Метод сохраняет результат одного алгоритма
+        :param message: Результат из очереди: (имя алгоритма, схема распила, текст ошибки, время расчета)
+        :type message: tuple
+        :param schemes: Полные схемы распила по алгоритмам
+        :type schemes: dict[str, CutScheme]
+        :param partial_schemes: Неполные схемы распила (остатков не хватило) по алгоритмам
+        :type partial_schemes: dict[str, CutScheme]
+        :return: True, если схема полная и ее отход доказанно минимален
+        :rtype: bool
+        """
+        name, cut_scheme, error, latency = message
+        waste: Optional[tuple[float, float]] = None
+        if cut_scheme is not None and cut_scheme.patterns:
+            waste = cut_scheme.waste()
+        self.__results[name] = PortfolioEntry(name, latency, waste, error)
+
+        if cut_scheme is None:
+            return False
+        if error is not None:
+            partial_schemes[name] = cut_scheme
+            return False
+        schemes[name] = cut_scheme
+        return self.is_minimal(cut_scheme)
+
+    def __record_crashed(self, processes: dict[str, multiprocessing.Process], results: multiprocessing.Queue,
+                         schemes: dict[str, CutScheme], partial_schemes: dict[str, CutScheme],
+                         start_time: float) -> None:
+        """
+        Метод сохраняет как ошибку результат алгоритмов, чей процесс завершился, не положив результат в очередь
+        (например, был убит системой из-за нехватки памяти)
+        :param processes: Процессы по алгоритмам
+        :type processes: dict[str, multiprocessing.Process]
+        :param results: Очередь результатов
+        :type results: multiprocessing.Queue
+        :param schemes: Полные схемы распила по алгоритмам
+        :type schemes: dict[str, CutScheme]
+        :param partial_schemes: Неполные схемы распила по алгоритмам
+        :type partial_schemes: dict[str, CutScheme]
+        :param start_time: Время начала расчета (time.perf_counter())
+        :type start_time: float
+        :return: None
+        """
+        finished: list[str] = [name for name, process in processes.items()
+                               if name not in self.__results and not process.is_alive()]
+        if not finished:
+            return
+
+        # Процесс мог положить результат в очередь сразу после того, как истекло время ожидания
+        while True:
+            try:
+                self.__record(results.get_nowait(), schemes, partial_schemes)
+            except queue.Empty:
+                break
+
+        for name in finished:
+            if name not in self.__results:
+                self.__results[name] = PortfolioEntry(
+                    name, time.perf_counter() - start_time,
+                    error=f'{self.CRASHED} (код завершения {processes[name].exitcode})')
+
+    def cut(self) -> CutScheme:
+        """
+        Метод для расчета распила всеми алгоритмами портфеля одновременно
+        :raise NoRemnantError: Если ни один алгоритм не рассчитал полный распил
+        :return: Распил с наименьшим отходом (при равном отходе - алгоритма, который раньше в списке)
+        :rtype: CutScheme
+        """
+        self.reset_search()
+        self.__results = dict()
+        self.__winner = None
+        start_time: float = time.perf_counter()
+        deadline: float = start_time + self.__deadline
+
+        results: multiprocessing.Queue = multiprocessing.Queue()
+        processes: dict[str, multiprocessing.Process] = {
+            algorithm.__name__: multiprocessing.Process(
+                target=_run_algorithm, args=(algorithm, self.__params, results), daemon=True)
+            for algorithm in self.__algorithms}
+        for process in processes.values():
+            process.start()
+
+        schemes: dict[str, CutScheme] = dict()
+        partial_schemes: dict[str, CutScheme] = dict()
+        try:
+            while len(self.__results) < len(processes):
+                # После deadline ждем, только пока нет ни одной полной схемы
+                remaining: float = deadline - time.perf_counter()
+                if schemes and remaining <= 0:
+                    break
+                try:
+                    message: tuple = results.get(
+                        timeout=self.POLL_INTERVAL if not schemes else min(self.POLL_INTERVAL, remaining))
+                except queue.Empty:
+                    self.__record_crashed(processes, results, schemes, partial_schemes, start_time)
+                    continue
+
+                # Доказанно лучший распил найден - остальные алгоритмы не нужны
+                if self.__record(message, schemes, partial_schemes):
+                    break
+
+            # Результаты алгоритмов, которые успели закончить расчет, тоже сохраним
+            while True:
+                try:
+                    self.__record(results.get_nowait(), schemes, partial_schemes)
+                except queue.Empty:
+                    break
+        finally:
+            for name, process in processes.items():
+                if process.is_alive():
+                    process.terminate()
+                    if name not in self.__results:
+                        self.__results[name] = PortfolioEntry(
+                            name, time.perf_counter() - start_time, error=self.CANCELLED)
+                process.join()
+
+        # Порядок результатов - как в списке алгоритмов
+        self.__results = {algorithm.__name__: self.__results[algorithm.__name__]
+                          for algorithm in self.__algorithms if algorithm.__name__ in self.__results}
+
+        if not schemes:
+            name: str = next(iter(partial_schemes), '')
+            raise NoRemnantsError(title='Не хватает остатков и цельных профилей',
+                                  cut_scheme=partial_schemes[name] if name else CutScheme(
+                                      products=self.product_counts, remnants=self.remnant_counts, cut_scheme=dict(),
+                                      min_remnant=self.min_rest_length, cut_width=self.cutting_width,
+                                      resolution=self.resolution))
+
+        self.__winner = min((name for name in self.__results if name in schemes),
+                            key=lambda name: self.__results[name].waste or (0.0, 0.0))
+        return schemes[self.__winner]
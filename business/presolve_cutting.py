@@ -0,0 +1,370 @@
+"""Модуль с предварительным упрощением задачи распила перед запуском алгоритма"""
+from typing import Any, Optional, Type
+
+from business.cutting import Cutting
+from business.business_exceptions import NoRemnantsError
+from business.cut_scheme import CutScheme
+from business.middle_cutting import MiddleCutting
+
+
+class PresolveCutting(Cutting, register=False):
+    """
+    Класс перед запуском алгоритма распределяет изделия, для которых профиль можно выбрать без перебора,
+    и передает алгоритму только оставшуюся задачу. Правила применяются по очереди:
+    1) Изделие совпадает с остатком с точностью до ширины реза - остаток распиливается на одно это изделие.
+    2) Изделие не помещается ни в один профиль вместе с другим изделием - оно распиливается из самого короткого
+    подходящего профиля, если этот профиль не подходит более длинному изделию и после изделия не остается
+    короткого остатка (иначе выбор профиля остается алгоритму).
+    3) Изделие длиннее всех остатков, помещается в цельные профили только одного вида, и рядом с ним в таком
+    профиле не поместится ни одно изделие - профиль распиливается на одно это изделие.
+    Распилы, найденные правилами, и схема алгоритма объединяются в одну схему распила
+
+    Args:
+        algorithm (Type[Cutting]) - Класс с алгоритмом, который считает оставшуюся задачу
+        algorithm_params (Optional[dict]) - Аргументы, которые есть только у этого алгоритма
+        (например, deadline у PortfolioCutting)
+        Остальные аргументы - как у Cutting
+    """
+    __name__ = 'PresolveCutting'
+    EXACT_FIT: str = 'совпадают с остатком'
+    SINGLE: str = 'распиливаются по одному'
+    LONG: str = 'длиннее всех остатков'
+
+    def __init__(self, *, algorithm: Type[Cutting] = MiddleCutting, algorithm_params: Optional[dict] = None,
+                 **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.__params: dict = kwargs
+        self.__algorithm: Type[Cutting] = algorithm
+        self.__algorithm_params: dict = dict() if algorithm_params is None else algorithm_params
+        self.__solver: Optional[Cutting] = None
+        self.__reductions: dict[str, int] = {self.EXACT_FIT: 0, self.SINGLE: 0, self.LONG: 0}
+        self.__residual_products: int = 0
+
+    @property
+    def algorithm(self) -> Type[Cutting]:
+        """Геттер для self.__algorithm"""
+        return self.__algorithm
+
+    @property
+    def solver(self) -> Optional[Cutting]:
+        """Алгоритм, который считал оставшуюся задачу в последнем расчете (None, если задача решена правилами)"""
+        return self.__solver
+
+    @property
+    def reductions(self) -> dict[str, int]:
+        """Количество изделий, распределенных каждым правилом в последнем расчете"""
+        return self.__reductions
+
+    @property
+    def residual_products(self) -> int:
+        """Количество изделий, переданных алгоритму в последнем расчете"""
+        return self.__residual_products
+
+    def __str__(self) -> str:
+        return (f'Данный метод сначала распределяет изделия, для которых профиль выбирается без перебора, '
+                f'а остальные изделия распиливает алгоритмом {self.__algorithm.__name__}')
+
+    def input_params(self) -> dict:
+        """
+        Метод возвращает входные данные расчета - общие входные данные, имя выбранного алгоритма
+        и его собственные аргументы. Классы в аргументах (например, алгоритмы портфеля) заменяются именами
+        :return: Словарь с входными данными
+        :rtype: dict
+        """
+        params: dict = super().input_params()
+        params.update(algorithm=self.__algorithm.__name__,
+                      algorithm_params={name: self.__canonical(value)
+                                        for name, value in self.__algorithm_params.items()})
+        return params
+
+    @classmethod
+    def __canonical(cls, value: Any) -> Any:
+        """
+        Метод переводит аргумент алгоритма в вид, который можно записать в JSON: классы заменяются их именами
+        :param value: Аргумент алгоритма
+        :type value: Any
+        :return: Аргумент в каноническом виде
+        :rtype: Any
+        """
+        if isinstance(value, type):
+            return value.__name__
+        if isinstance(value, (list, tuple)):
+            return [cls.__canonical(item) for item in value]
+        if isinstance(value, dict):
+            return {str(key): cls.__canonical(item) for key, item in value.items()}
+        return value
+
+    def summary(self) -> str:
+        """
+        Метод описывает, насколько правила уменьшили задачу в последнем расчете
+        :return: Текст для журнала
+        :rtype: str
+        """
+        total: int = sum(self.product_counts.values())
+        details: str = ', '.join(f'{name}: {number}' for name, number in self.__reductions.items())
+        return (f'Без перебора распределено {total - self.__residual_products} из {total} изделий ({details}), '
+                f'алгоритму {self.__algorithm.__name__} передано {self.__residual_products} изделий')
+
+    def cut(self) -> CutScheme:
+        """
+        Метод упрощает задачу, рассчитывает оставшуюся задачу выбранным алгоритмом и объединяет результаты
+        :raise NoRemnantError: Если алгоритму не хватило остатков и цельных профилей
+        :return: Распил всех изделий
+        :rtype: CutScheme
+        """
+        self.reset_search()
+        self.__solver = None
+        self.__reductions = {self.EXACT_FIT: 0, self.SINGLE: 0, self.LONG: 0}
+
+        products: dict[int, int] = {self.to_units(product): number
+                                    for product, number in self.product_counts.items()}
+        remnants: dict[float, int] = dict(self.remnant_counts)
+        wholes: list[list] = [[length, number, cost] for length, number, cost in self.whole_profiles]
+        # Распилы, найденные правилами: (длина профиля, изделия) -> количество
+        fixed: dict[tuple[float, tuple[float, ...]], int] = dict()
+
+        self.__fit_exact(products, remnants, fixed)
+        self.__fit_single(products, remnants, wholes, fixed)
+        self.__fit_long(products, remnants, wholes, fixed)
+
+        residual_products: dict[float, int] = {self.from_units(units): number
+                                               for units, number in products.items() if number > 0}
+        self.__residual_products = sum(residual_products.values())
+
+        cut_scheme: Optional[CutScheme] = None
+        error: Optional[str] = None
+        if residual_products:
+            # Аргументы алгоритма заменяют общие аргументы с тем же именем
+            params: dict = dict(self.__params)
+            params.update(self.__algorithm_params)
+            params.update(in_products=residual_products, remnants=remnants, correction=0,
+                          whole_profiles=[tuple(profile) for profile in wholes])
+            self.__solver = self.__algorithm(**params)
+            try:
+                cut_scheme = self.__solver.cut()
+            except NoRemnantsError as exc:
+                cut_scheme, error = exc.cut_scheme, exc.title
+
+        result: CutScheme = self.__merge(cut_scheme, fixed)
+        if error is not None:
+            raise NoRemnantsError(title=error, cut_scheme=result)
+        return result
+
+    def __fit_exact(self, products: dict[int, int], remnants: dict[float, int],
+                    fixed: dict[tuple[float, tuple[float, ...]], int]) -> None:
+        """
+        Метод распиливает остатки, которые совпадают с изделием с точностью до ширины реза. Для каждого остатка
+        берется самое длинное подходящее изделие, поэтому в остаток больше ничего не могло бы поместиться
+        :param products: Количества изделий по длинам в единицах разрешения (изменяется)
+        :type products: dict[int, int]
+        :param remnants: Количества остатков по длинам (изменяется)
+        :type remnants: dict[float, int]
+        :param fixed: Найденные распилы (изменяется)
+        :type fixed: dict[tuple[float, tuple[float, ...]], int]
+        :return: None
+        """
+        for remnant in sorted(remnants):
+            units: int = self.to_units(remnant)
+            for product in sorted(products, reverse=True):
+                if remnant not in remnants or units - product > self.int_cutting_width:
+                    break
+                if product > units or not products.get(product):
+                    continue
+                number: int = min(products[product], remnants[remnant])
+                self.__fix(remnant, product, number, products, fixed, self.EXACT_FIT)
+                self.__take(remnants, remnant, number)
+
+    def __fit_single(self, products: dict[int, int], remnants: dict[float, int], wholes: list[list],
+                     fixed: dict[tuple[float, tuple[float, ...]], int]) -> None:
+        """
+        Метод распиливает изделия, которые даже в самом длинном профиле не помещаются вместе с самым коротким
+        другим изделием. Такое изделие берется из самого короткого подходящего профиля, если в этот профиль
+        не помещается ни одно более длинное изделие и после изделия не остается короткого остатка. После каждого
+        распила самый длинный профиль и самое короткое изделие могут измениться, поэтому проверка повторяется
+        :param products: Количества изделий по длинам в единицах разрешения (изменяется)
+        :type products: dict[int, int]
+        :param remnants: Количества остатков по длинам (изменяется)
+        :type remnants: dict[float, int]
+        :param wholes: Виды цельных профилей [длина, количество, цена] по возрастанию длины (изменяется)
+        :type wholes: list[list]
+        :param fixed: Найденные распилы (изменяется)
+        :type fixed: dict[tuple[float, tuple[float, ...]], int]
+        :return: None
+        """
+        changed: bool = True
+        while changed:
+            changed = False
+            # Профили (длина в единицах разрешения, цельный ли профиль, длина), короткие и остатки - раньше
+            bars: list[tuple[int, bool, float]] = sorted(
+                [(self.to_units(length), False, length) for length in remnants]
+                + [(self.to_units(length), True, length) for length, number, _ in wholes if number > 0])
+            lengths: list[int] = sorted(product for product, number in products.items() if number > 0)
+            if not bars or not lengths:
+                return
+
+            for position in range(len(lengths) - 1, -1, -1):
+                product: int = lengths[position]
+                shortest: Optional[int] = lengths[0] if lengths[0] != product or products[product] > 1 else (
+                    lengths[1] if len(lengths) > 1 else None)
+                if shortest is not None and product + shortest + self.int_cutting_width <= bars[-1][0]:
+                    break  # Более короткие изделия тем более помещаются вместе с другими
+
+                bar: Optional[tuple[int, bool, float]] = next((bar for bar in bars if bar[0] >= product), None)
+                if bar is None:
+                    continue
+                # Профиль нужен более длинному изделию или после изделия останется короткий остаток -
+                # тогда профиль выбирает алгоритм
+                leftover: int = bar[0] - product - self.int_cutting_width
+                if (position + 1 < len(lengths) and lengths[position + 1] <= bar[0]
+                        or 0 < leftover < self.int_min_rest_length):
+                    continue
+
+                units, is_whole, length = bar
+                if is_whole:
+                    profile: list = next(profile for profile in wholes if profile[0] == length and profile[1] > 0)
+                    number: int = min(products[product], profile[1])
+                    profile[1] -= number
+                else:
+                    number = min(products[product], remnants[length])
+                    self.__take(remnants, length, number)
+                self.__fix(length, product, number, products, fixed, self.SINGLE)
+                changed = True
+                break
+
+    def __fit_long(self, products: dict[int, int], remnants: dict[float, int], wholes: list[list],
+                   fixed: dict[tuple[float, tuple[float, ...]], int]) -> None:
+        """
+        Метод распиливает цельные профили на одно длинное изделие. Изделие, которое длиннее всех остатков
+        и помещается в цельные профили только одного вида, в любом распиле займет цельный профиль этого вида.
+        Если рядом с ним не поместится ни одно изделие, то распил профиля известен. Место после изделий, оставленных
+        алгоритму, тоже учитывается: изделие длиннее него не может быть распилено из того же профиля
+        :param products: Количества изделий по длинам в единицах разрешения (изменяется)
+        :type products: dict[int, int]
+        :param remnants: Количества остатков по длинам
+        :type remnants: dict[float, int]
+        :param wholes: Виды цельных профилей [длина, количество, цена] по возрастанию длины (изменяется)
+        :type wholes: list[list]
+        :param fixed: Найденные распилы (изменяется)
+        :type fixed: dict[tuple[float, tuple[float, ...]], int]
+        :return: None
+        """
+        longest: int = max((self.to_units(length) for length in remnants), default=0)
+        reserved: list[list] = list()  # Цельные профили под длинные изделия, которые остались алгоритму
+
+        for product in sorted(products, reverse=True):
+            if product <= longest:
+                break
+            for _ in range(products[product]):
+                suitable: list[list] = [profile for profile in wholes
+                                        if profile[1] > 0 and self.to_units(profile[0]) >= product]
+                # Если изделие помещается в цельные профили нескольких видов, то вид выбирает алгоритм.
+                # Если ни в один - об этом сообщит алгоритм
+                if len(suitable) != 1:
+                    break
+                profile: list = suitable[0]
+                profile[1] -= 1
+
+                rest: int = self.to_units(profile[0]) - product - self.int_cutting_width
+                if rest < min(products):
+                    self.__fix(profile[0], product, 1, products, fixed, self.LONG)
+                else:
+                    reserved.append(profile)
+
+                longest = max(longest, rest)
+                if product <= longest:
+                    break
+
+        for profile in reserved:
+            profile[1] += 1
+
+    def __fix(self, length: float, product: int, number: int, products: dict[int, int],
+              fixed: dict[tuple[float, tuple[float, ...]], int], rule: str) -> None:
+        """
+        Метод записывает распил профиля на одно изделие и убирает изделия из задачи
+        :param length: Длина профиля
+        :type length: float
+        :param product: Длина изделия в единицах разрешения
+        :type product: int
+        :param number: Количество таких распилов
+        :type number: int
+        :param products: Количества изделий по длинам в единицах разрешения (изменяется)
+        :type products: dict[int, int]
+        :param fixed: Найденные распилы (изменяется)
+        :type fixed: dict[tuple[float, tuple[float, ...]], int]
+        :param rule: Правило, которым найден распил
+        :type rule: str
+        :return: None
+        """
+        key: tuple[float, tuple[float, ...]] = (length, (self.from_units(product),))
+        fixed[key] = fixed.get(key, 0) + number
+        self.__take(products, product, number)
+        self.__reductions[rule] += number
+
+    def __merge(self, cut_scheme: Optional[CutScheme],
+                fixed: dict[tuple[float, tuple[float, ...]], int]) -> CutScheme:
+        """
+        Метод объединяет распилы, найденные правилами, со схемой алгоритма
+        :param cut_scheme: Схема алгоритма или None, если алгоритм не запускался
+        :type cut_scheme: Optional[CutScheme]
+        :param fixed: Распилы, найденные правилами
+        :type fixed: dict[tuple[float, tuple[float, ...]], int]
+        :return: Схема распила всех изделий
+        :rtype: CutScheme
+        """
+        # Длина профиля -> (изделия, доказана ли оптимальность) -> количество распилов
+        patterns: dict[float, dict[tuple[tuple[float, ...], bool], int]] = dict()
+        for (length, lengths), number in fixed.items():
+            self.__put(patterns, length, lengths, True, number)
+        if cut_scheme is not None:
+            for (length, _), remnant_patterns in cut_scheme.patterns.items():
+                for pattern in remnant_patterns:
+                    self.__put(patterns, length, tuple(pattern.lengths), pattern.proven, pattern.count)
+
+        # Ключ профиля - (длина, количество имеющихся профилей), лишнее количество убирает restore_order
+        totals: dict[float, int] = dict(self.remnant_counts)
+        for length, number, _ in self.whole_profiles:
+            totals[length] = totals.get(length, 0) + number
+
+        result: CutScheme = CutScheme(
+            cut_scheme=dict(), min_remnant=self.min_rest_length, cut_width=self.cutting_width,
+            products=self.product_counts, remnants=self.remnant_counts, resolution=self.resolution)
+        for length in sorted(patterns):
+            for (lengths, proven), number in patterns[length].items():
+                result.add((length, totals.get(length, 0)), lengths, proven, number)
+        result.restore_order()
+        return result
+
+    @classmethod
+    def __put(cls, patterns: dict[float, dict[tuple[tuple[float, ...], bool], int]], length: float,
+              lengths: tuple[float, ...], proven: bool, number: int) -> None:
+        """
+        Метод добавляет распилы профиля в объединяемую схему
+        :param patterns: Объединяемая схема: длина профиля -> (изделия, оптимальность) -> количество (изменяется)
+        :type patterns: dict[float, dict[tuple[tuple[float, ...], bool], int]]
+        :param length: Длина профиля
+        :type length: float
+        :param lengths: Изделия распила
+        :type lengths: tuple[float, ...]
+        :param proven: True, если распил доказанно оптимален
+        :type proven: bool
+        :param number: Количество распилов
+        :type number: int
+        :return: None
+        """
+        length_patterns: dict[tuple[tuple[float, ...], bool], int] = patterns.setdefault(length, dict())
+        length_patterns[(lengths, proven)] = length_patterns.get((lengths, proven), 0) + number
+
+    @classmethod
+    def __take(cls, counts: dict, key, number: int) -> None:
+        """
+        Метод уменьшает количество и убирает ключ, если количество стало нулевым
+        :param counts: Словарь количеств (изменяется)
+        :type counts: dict
+        :param key: Ключ
+        :param number: На сколько уменьшить количество
+        :type number: int
+        :return: None
+        """
+        counts[key] -= number
+        if counts[key] <= 0:
+            counts.pop(key)
@@ -0,0 +1,134 @@
+"""Модуль с мультимножеством изделий, которые осталось распилить"""
+from typing import Iterable, Iterator, Optional
+
+
+class ProductMultiset:
+    """
+    Класс хранит изделия как количества по длинам. Наименьшая длина и суммарная длина изделий хранятся
+    и обновляются при удалении, поэтому их не нужно пересчитывать по всему списку. Удаление распила из k изделий
+    выполняется за O(k) без копирования
+
+    Args:
+        products (Iterable[float]) - Список изделий
+    """
+    def __init__(self, products: Iterable[float] = ()) -> None:
+        self.__counts: dict[float, int] = dict()
+        self.__size: int = 0
+        self.__total: float = 0.0
+        self.__minimum: Optional[float] = None
+
+        for product in products:
+            self.__counts[product] = self.__counts.get(product, 0) + 1
+            self.__size += 1
+            self.__total += product
+        if self.__counts:
+            self.__minimum = min(self.__counts)
+
+    @classmethod
+    def from_counts(cls, counts: dict[float, int]) -> 'ProductMultiset':
+        """
+        Метод создает мультимножество из словаря количеств, не разворачивая его в список
+        :param counts: Словарь {длина: количество}
+        :type counts: dict[float, int]
+        :return: Мультимножество изделий
+        :rtype: ProductMultiset
+        """
+        result: ProductMultiset = cls()
+        result.__counts = {length: number for length, number in counts.items() if number > 0}
+        result.__size = sum(result.__counts.values())
+        result.__total = sum(length * number for length, number in result.__counts.items())
+        result.__minimum = min(result.__counts) if result.__counts else None
+        return result
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __getitem__(self, length: float) -> int:
+        """Количество изделий данной длины"""
+        return self.__counts.get(length, 0)
+
+    def __iter__(self) -> Iterator[float]:
+        """Все изделия по одному (одинаковые подряд)"""
+        for length, number in self.__counts.items():
+            for _ in range(number):
+                yield length
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Длина самого короткого изделия или None, если изделий нет"""
+        return self.__minimum
+
+    @property
+    def total(self) -> float:
+        """Суммарная длина изделий"""
+        return self.__total
+
+    def items(self) -> Iterable[tuple[float, int]]:
+        """
+        Метод возвращает различные длины изделий и их количества
+        :return: Пары (длина, количество)
+        :rtype: Iterable[tuple[float, int]]
+        """
+        return self.__counts.items()
+
+    def contains(self, pattern: Iterable[float]) -> bool:
+        """
+        Метод проверяет, что все изделия распила есть в мультимножестве
+        :param pattern: Распил
+        :type pattern: Iterable[float]
+        :return: True, если распил можно выполнить из этих изделий
+        :rtype: bool
+        """
+        needed: dict[float, int] = dict()
+        for product in pattern:
+            needed[product] = needed.get(product, 0) + 1
+        return all(self.__counts.get(product, 0) >= number for product, number in needed.items())
+
+    def remove(self, pattern: Iterable[float]) -> None:
+        """
+        Метод удаляет изделия распила
+        :param pattern: Распил
+        :type pattern: Iterable[float]
+        :raise ValueError: Если какого-то изделия распила нет
+        :return: None
+        """
+        minimum_removed: bool = False
+
+        for product in pattern:
+            number: int = self.__counts.get(product, 0)
+            if number == 0:
+                raise ValueError(f'Изделия {product} нет в списке')
+            if number == 1:
+                del self.__counts[product]
+                minimum_removed = minimum_removed or product == self.__minimum
+            else:
+                self.__counts[product] = number - 1
+            self.__size -= 1
+            self.__total -= product
+
+        # Наименьшая длина пересчитывается только если закончились самые короткие изделия
+        if minimum_removed:
+            self.__minimum = min(self.__counts) if self.__counts else None
+        if not self.__counts:
+            self.__total = 0.0
+
+    def copy(self) -> 'ProductMultiset':
+        """
+        Метод создает независимую копию
+        :return: Копия мультимножества
+        :rtype: ProductMultiset
+        """
+        result: ProductMultiset = ProductMultiset()
+        result.__counts = dict(self.__counts)
+        result.__size = self.__size
+        result.__total = self.__total
+        result.__minimum = self.__minimum
+        return result
+
+    def to_list(self) -> list[float]:
+        """
+        Метод возвращает изделия списком
+        :return: Список изделий
+        :rtype: list[float]
+        """
+        return list(self)
@@ -0,0 +1,181 @@
+"""Модуль с упорядоченным складом остатков"""
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterator, Optional
+
+
+class RemnantInventory:
+    """
+    Класс хранит остатки как отсортированный по длине список пар (длина, количество).
+    Ключ остатка - кортеж (длина, исходное количество), как в схеме распила. Поиск наименьшего подходящего остатка,
+    уменьшение количества и удаление коротких остатков выполняются двоичным поиском, поэтому склад с тысячами
+    остатков не пересобирается на каждом шаге расчета.
+    Остатки одной длины объединяются в один ключ. Для каждой длины хранится цена одного профиля:
+    у остатков она нулевая, у цельных профилей - длина, умноженная на цену за метр
+    """
+    def __init__(self) -> None:
+        self.__lengths: list[float] = list()  # Длины по возрастанию - для двоичного поиска
+        self.__keys: list[tuple[float, int]] = list()
+        self.__numbers: list[int] = list()  # Сколько остатков каждой длины еще не использовано
+        self.__costs: list[float] = list()
+
+    @classmethod
+    def from_list(cls, array: list[float], min_value: float) -> 'RemnantInventory':
+        """
+        Метод создает склад из списка длин остатков
+        :param array: Список длин остатков
+        :type array: list[float]
+        :param min_value: Минимальная длина, остатки короче нее на склад не попадут
+        :type min_value: float
+        :return: Склад остатков
+        :rtype: RemnantInventory
+        """
+        return cls.from_counts(Counter(array), min_value)
+
+    @classmethod
+    def from_counts(cls, counts: dict[float, int], min_value: Optional[float]) -> 'RemnantInventory':
+        """
+        Метод создает склад из словаря количеств остатков
+        :param counts: Словарь {длина: количество}
+        :type counts: dict[float, int]
+        :param min_value: Минимальная длина, остатки короче нее на склад не попадут. Если None (изделий нет),
+        то остатки не нужны, и склад пуст
+        :type min_value: Optional[float]
+        :return: Склад остатков
+        :rtype: RemnantInventory
+        """
+        inventory: RemnantInventory = cls()
+        if min_value is None:
+            return inventory
+
+        for length, number in sorted(counts.items()):
+            if length >= min_value and number > 0:
+                inventory.__lengths.append(length)
+                inventory.__keys.append((length, number))
+                inventory.__numbers.append(number)
+                inventory.__costs.append(0.0)
+        return inventory
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __iter__(self) -> Iterator[tuple[float, int]]:
+        """Ключи остатков по возрастанию длины"""
+        return iter(list(self.__keys))
+
+    def __contains__(self, key: tuple[float, int]) -> bool:
+        return self.__find(key[0]) is not None
+
+    def __find(self, length: float) -> Optional[int]:
+        """
+        Метод ищет позицию остатка данной длины
+        :param length: Длина остатка
+        :type length: float
+        :return: Позиция в списке или None, если такого остатка нет
+        :rtype: Optional[int]
+        """
+        index: int = bisect_left(self.__lengths, length)
+        if index < len(self.__lengths) and self.__lengths[index] == length:
+            return index
+        return None
+
+    def add(self, length: float, number: int, cost: float = 0.0) -> None:
+        """
+        Метод добавляет остатки на склад. Если остатки такой длины уже есть - количество в ключе увеличивается,
+        а цена берется наименьшая
+        :param length: Длина остатка
+        :type length: float
+        :param number: Количество остатков
+        :type number: int
+        :param cost: Цена одного профиля
+        :type cost: float
+        :return: None
+        """
+        if number <= 0:
+            return
+
+        index: Optional[int] = self.__find(length)
+        if index is None:
+            index = bisect_left(self.__lengths, length)
+            self.__lengths.insert(index, length)
+            self.__keys.insert(index, (length, number))
+            self.__numbers.insert(index, number)
+            self.__costs.insert(index, cost)
+        else:
+            self.__keys[index] = (length, self.__keys[index][1] + number)
+            self.__numbers[index] += number
+            self.__costs[index] = min(self.__costs[index], cost)
+
+    def number(self, key: tuple[float, int]) -> int:
+        """
+        Метод возвращает количество еще не использованных остатков данной длины
+        :param key: Ключ остатка
+        :type key: tuple[float, int]
+        :return: Количество остатков
+        :rtype: int
+        """
+        index: Optional[int] = self.__find(key[0])
+        return 0 if index is None else self.__numbers[index]
+
+    def cost(self, key: tuple[float, int]) -> float:
+        """
+        Метод возвращает цену одного профиля данной длины
+        :param key: Ключ остатка
+        :type key: tuple[float, int]
+        :return: Цена профиля или 0, если такого остатка нет
+        :rtype: float
+        """
+        index: Optional[int] = self.__find(key[0])
+        return 0.0 if index is None else self.__costs[index]
+
+    def smallest(self) -> Optional[tuple[float, int]]:
+        """
+        Метод возвращает ключ самого короткого остатка
+        :return: Ключ остатка или None, если склад пуст
+        :rtype: Optional[tuple[float, int]]
+        """
+        return self.__keys[0] if self.__keys else None
+
+    def smallest_fit(self, length: float) -> Optional[tuple[float, int]]:
+        """
+        Метод возвращает ключ самого короткого остатка, длина которого не меньше заданной
+        :param length: Необходимая длина
+        :type length: float
+        :return: Ключ остатка или None, если подходящего остатка нет
+        :rtype: Optional[tuple[float, int]]
+        """
+        index: int = bisect_left(self.__lengths, length)
+        return self.__keys[index] if index < len(self.__keys) else None
+
+    def decrement(self, key: tuple[float, int]) -> None:
+        """
+        Метод забирает со склада один остаток. Если остатков этой длины больше нет - ключ удаляется
+        :param key: Ключ остатка
+        :type key: tuple[float, int]
+        :raise KeyError: Если такого остатка на складе нет
+        :return: None
+        """
+        index: Optional[int] = self.__find(key[0])
+        if index is None:
+            raise KeyError(key)
+
+        self.__numbers[index] -= 1
+        if self.__numbers[index] == 0:
+            del self.__lengths[index]
+            del self.__keys[index]
+            del self.__numbers[index]
+            del self.__costs[index]
+
+    def prune_below(self, min_value: float) -> None:
+        """
+        Метод убирает со склада все остатки короче заданной длины
+        :param min_value: Минимальная длина остатка
+        :type min_value: float
+        :return: None
+        """
+        index: int = bisect_left(self.__lengths, min_value)
+        if index > 0:
+            del self.__lengths[:index]
+            del self.__keys[:index]
+            del self.__numbers[:index]
+            del self.__costs[:index]
@@ -0,0 +1,109 @@
+"""Модуль с постоянным (на диске) кэшем рассчитанных схем распила"""
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from typing import Optional
+
+from business.cutting import Cutting
+from business.cut_scheme import CutScheme
+
+
+class ResultCache:
+    """
+    Класс хранит рассчитанные схемы распила в файле SQLite. Ключ - хэш входных данных расчета и имени алгоритма,
+    поэтому повторный расчет того же наряда возвращается сразу. Сохраняются только схемы, где оптимальность
+    каждого распила доказана: если поиск остановился по времени, повторный расчет может найти распил лучше.
+    Если суммарный размер сохраненных схем превышает max_size, удаляются схемы, которые дольше всего
+    не запрашивались
+
+    Args:
+        path (str) - Путь к файлу базы данных
+        max_size (int) - Максимальный суммарный размер сохраненных схем (байт)
+    """
+    def __init__(self, path: str = 'results_cache.sqlite', max_size: int = 50 * 1024 * 1024) -> None:
+        self.__path: str = path
+        self.__max_size: int = max_size
+
+        with closing(sqlite3.connect(self.__path)) as connection, connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                               'key TEXT PRIMARY KEY, algorithm TEXT, scheme TEXT, size INTEGER, last_used REAL)')
+
+    @property
+    def path(self) -> str:
+        """Геттер для self.__path"""
+        return self.__path
+
+    @classmethod
+    def make_key(cls, cutting: Cutting) -> str:
+        """
+        Метод строит ключ кэша по входным данным расчета и имени алгоритма
+        :param cutting: Объект расчета распила
+        :type cutting: Cutting
+        :return: Хэш входных данных
+        :rtype: str
+        """
+        params: dict = cutting.input_params()
+        # Имя класса хранится отдельно: у обертки (например, PresolveCutting) ключ 'algorithm' - имя
+        # алгоритма внутри нее, и его нельзя перезаписывать
+        params['cutting_class'] = type(cutting).__name__
+        canonical: str = json.dumps(params, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, cutting: Cutting) -> Optional[CutScheme]:
+        """
+        Метод возвращает сохраненную схему распила для данного расчета
+        :param cutting: Объект расчета распила
+        :type cutting: Cutting
+        :return: Схема распила или None, если такой расчет еще не проводился
+        :rtype: Optional[CutScheme]
+        """
+        key: str = self.make_key(cutting)
+
+        with closing(sqlite3.connect(self.__path)) as connection, connection:
+            row: Optional[tuple[str]] = connection.execute(
+                'SELECT scheme FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), key))
+
+        return CutScheme.from_dict(json.loads(row[0]), products=cutting.product_counts,
+                                   remnants=cutting.remnant_counts)
+
+    def put(self, cutting: Cutting, cut_scheme: CutScheme) -> None:
+        """
+        Метод сохраняет схему распила и при необходимости удаляет давно не используемые схемы.
+        Схема, в которой оптимальность хотя бы одного распила не доказана, не сохраняется
+        :param cutting: Объект расчета распила
+        :type cutting: Cutting
+        :param cut_scheme: Рассчитанная схема распила
+        :type cut_scheme: CutScheme
+        :return: None
+        """
+        if not cut_scheme.all_proven:
+            return
+
+        scheme: str = json.dumps(cut_scheme.to_dict(), ensure_ascii=False)
+
+        with closing(sqlite3.connect(self.__path)) as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                               (self.make_key(cutting), type(cutting).__name__, scheme, len(scheme), time.time()))
+
+            # Удалим самые давно используемые схемы, пока суммарный размер не станет допустимым
+            total_size: int = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+            if total_size > self.__max_size:
+                for key, size in connection.execute(
+                        'SELECT key, size FROM results ORDER BY last_used').fetchall():
+                    if total_size <= self.__max_size:
+                        break
+                    connection.execute('DELETE FROM results WHERE key = ?', (key,))
+                    total_size -= size
+
+    def clear(self) -> None:
+        """
+        Метод удаляет все сохраненные схемы
+        :return: None
+        """
+        with closing(sqlite3.connect(self.__path)) as connection, connection:
+            connection.execute('DELETE FROM results')
@@ -0,0 +1,171 @@
+"""Модуль с симплекс-методом для задач линейного программирования, к которым добавляются новые столбцы"""
+
+
+class Simplex:
+    """
+    Класс решает задачу минимизации c*x при ограничениях A*x >= b или A*x <= b, x >= 0 табличным
+    симплекс-методом с искусственными переменными (метод больших штрафов). Столбцы можно добавлять
+    после решения - следующее решение продолжается с текущего базиса, что нужно для генерации столбцов
+
+    Args:
+        senses (list[str]) - Знаки ограничений: '>=' или '<='
+        rhs (list[float]) - Правые части ограничений (неотрицательные)
+        big_m (float) - Штраф за искусственные переменные
+    """
+    EPS: float = 1e-9
+    MAX_ITERATIONS: int = 100_000
+
+    def __init__(self, senses: list[str], rhs: list[float], big_m: float = 1e7) -> None:
+        self.__rows: list[list[float]] = [list() for _ in rhs]
+        self.__rhs: list[float] = list(rhs)
+        self.__costs: list[float] = list()
+        self.__reduced: list[float] = list()
+        self.__basis: list[int] = [0 for _ in rhs]
+        # Для каждой строки: столбец начального базиса и столбец, по которому считается двойственная оценка
+        self.__initial_columns: list[int] = [0 for _ in rhs]
+        self.__dual_columns: list[tuple[int, float]] = list()
+        self.__artificial: list[int] = list()
+        self.__variables: list[int] = list()
+
+        for row, sense in enumerate(senses):
+            unit: list[float] = [1.0 if index == row else 0.0 for index in range(len(rhs))]
+            if sense == '<=':
+                slack: int = self.__append_column(0.0, unit)
+                self.__basis[row] = slack
+                self.__initial_columns[row] = slack
+                self.__dual_columns.append((slack, -1.0))
+            else:
+                surplus: int = self.__append_column(0.0, [-value for value in unit])
+                artificial: int = self.__append_column(big_m, unit)
+                self.__basis[row] = artificial
+                self.__initial_columns[row] = artificial
+                self.__dual_columns.append((surplus, 1.0))
+                self.__artificial.append(artificial)
+
+        # Оценки начальных столбцов считаем, когда базис уже известен
+        duals: list[float] = [self.__costs[column] for column in self.__basis]
+        self.__reduced = [cost - sum(dual * row[column] for dual, row in zip(duals, self.__rows))
+                          for column, cost in enumerate(self.__costs)]
+
+    @property
+    def objective(self) -> float:
+        """Значение целевой функции в текущем базисе"""
+        return sum(self.__costs[column] * value for column, value in zip(self.__basis, self.__rhs))
+
+    @property
+    def feasible(self) -> bool:
+        """True, если в текущем решении все искусственные переменные равны нулю"""
+        artificial: set[int] = set(self.__artificial)
+        return all(value <= 1e-7 for column, value in zip(self.__basis, self.__rhs) if column in artificial)
+
+    def __append_column(self, cost: float, column: list[float]) -> int:
+        """
+        Метод добавляет столбец в таблицу как есть, без пересчета через текущий базис
+        :param cost: Стоимость переменной
+        :type cost: float
+        :param column: Коэффициенты столбца в текущей таблице
+        :type column: list[float]
+        :return: Номер столбца
+        :rtype: int
+        """
+        for row, value in zip(self.__rows, column):
+            row.append(value)
+        self.__costs.append(cost)
+        self.__reduced.append(cost)
+        return len(self.__costs) - 1
+
+    def add_column(self, cost: float, column: list[float]) -> int:
+        """
+        Метод добавляет переменную задачи. Коэффициенты пересчитываются через обратную матрицу текущего базиса,
+        которая хранится в столбцах начального базиса
+        :param cost: Стоимость переменной
+        :type cost: float
+        :param column: Коэффициенты переменной в исходных ограничениях
+        :type column: list[float]
+        :return: Номер переменной (порядковый номер среди добавленных через add_column)
+        :rtype: int
+        """
+        tableau_column: list[float] = [
+            sum(row[initial] * value for initial, value in zip(self.__initial_columns, column) if value != 0)
+            for row in self.__rows]
+        index: int = self.__append_column(cost, tableau_column)
+        self.__reduced[index] = cost - sum(dual * value for dual, value in zip(self.duals(), column))
+        self.__variables.append(index)
+        return len(self.__variables) - 1
+
+    def duals(self) -> list[float]:
+        """
+        Метод возвращает двойственные оценки ограничений в текущем базисе
+        :return: Двойственные оценки (для '>=' - неотрицательные, для '<=' - неположительные)
+        :rtype: list[float]
+        """
+        return [sign * self.__reduced[column] for column, sign in self.__dual_columns]
+
+    def values(self) -> list[float]:
+        """
+        Метод возвращает значения переменных, добавленных через add_column
+        :return: Значения переменных
+        :rtype: list[float]
+        """
+        result: dict[int, float] = {column: value for column, value in zip(self.__basis, self.__rhs)}
+        return [result.get(column, 0.0) for column in self.__variables]
+
+    def solve(self) -> None:
+        """
+        Метод доводит таблицу до оптимального базиса. Входящий столбец выбирается по наименьшей оценке,
+        а после серии вырожденных шагов - по правилу Бленда, чтобы избежать зацикливания
+        :return: None
+        """
+        degenerate_steps: int = 0
+
+        for _ in range(self.MAX_ITERATIONS):
+            if degenerate_steps > 50:
+                entering: int = next((column for column, value in enumerate(self.__reduced)
+                                      if value < -self.EPS), -1)
+            else:
+                entering = min(range(len(self.__reduced)), key=self.__reduced.__getitem__, default=-1)
+                if entering != -1 and self.__reduced[entering] >= -self.EPS:
+                    entering = -1
+            if entering == -1:
+                return
+
+            # Тест отношений: выходит строка с наименьшим отношением правой части к коэффициенту
+            leaving: int = -1
+            best_ratio: float = 0.0
+            for row_index, row in enumerate(self.__rows):
+                if row[entering] > self.EPS:
+                    ratio: float = max(self.__rhs[row_index], 0.0) / row[entering]
+                    if (leaving == -1 or ratio < best_ratio - self.EPS or
+                            (ratio <= best_ratio + self.EPS and self.__basis[row_index] < self.__basis[leaving])):
+                        leaving = row_index
+                        best_ratio = ratio
+            if leaving == -1:
+                return  # Задача не ограничена - при неотрицательных стоимостях не встречается
+
+            degenerate_steps = degenerate_steps + 1 if best_ratio <= self.EPS else 0
+            self.__pivot(leaving, entering)
+
+    def __pivot(self, leaving: int, entering: int) -> None:
+        """
+        Метод делает шаг симплекс-метода: переменная entering входит в базис вместо базисной переменной строки leaving
+        :param leaving: Номер строки
+        :type leaving: int
+        :param entering: Номер столбца
+        :type entering: int
+        :return: None
+        """
+        pivot_row: list[float] = self.__rows[leaving]
+        pivot: float = pivot_row[entering]
+        pivot_row[:] = [value / pivot for value in pivot_row]
+        self.__rhs[leaving] /= pivot
+        pivot_rhs: float = self.__rhs[leaving]
+
+        for row_index, row in enumerate(self.__rows):
+            factor: float = row[entering]
+            if row_index != leaving and factor != 0:
+                row[:] = [value - factor * pivot_value for value, pivot_value in zip(row, pivot_row)]
+                self.__rhs[row_index] -= factor * pivot_rhs
+
+        factor = self.__reduced[entering]
+        self.__reduced = [value - factor * pivot_value for value, pivot_value in zip(self.__reduced, pivot_row)]
+        self.__basis[leaving] = entering
@@ -0,0 +1,66 @@
+"""Модуль с поиском оптимального распила остатка как ограниченной задачи о сумме подмножеств"""
+import time
+from typing import Optional
+
+from business.business_exceptions import SearchTimeoutError
+
+
+class SubsetSumEngine:
+    """
+    Класс ищет наилучшее заполнение остатка изделиями. Все длины - целые числа в единицах разрешения
+    (по умолчанию миллиметры), поэтому достижимые суммы можно хранить в битах одного большого целого числа.
+    Время работы пропорционально длине остатка, умноженной на количество различных длин изделий
+    """
+    @classmethod
+    def best_fill(cls, capacity: int, items: list[tuple[int, int]],
+                  deadline: Optional[float] = None) -> tuple[int, list[int]]:
+        """
+        Метод находит набор изделий с максимальной суммой весов, не превышающей вместимость.
+        Изделия одной длины разбиваются на группы 1, 2, 4, ... штук, чтобы учесть их количество
+        :param capacity: Вместимость (длина остатка плюс ширина одного реза)
+        :type capacity: int
+        :param items: Список кортежей, где первый элемент - вес изделия (длина плюс ширина реза),
+        второй - количество изделий с таким весом
+        :type items: list[tuple[int, int]]
+        :param deadline: Момент time.perf_counter(), после которого поиск прекращается
+        :type deadline: Optional[float]
+        :return: Максимальная сумма весов и количество изделий каждого вида в лучшем наборе
+        :rtype: tuple[int, list[int]]
+        :raise SearchTimeoutError: Если истекло время на расчет
+        """
+        counts: list[int] = [0 for _ in items]
+        if capacity < 0:
+            return 0, counts
+
+        mask: int = (1 << (capacity + 1)) - 1
+        reachable: int = 1  # Бит номер s установлен, если сумма s достижима
+        # Для восстановления набора храним достижимые суммы до добавления каждой группы
+        stages: list[tuple[int, int, int]] = list()
+
+        for index, (weight, count) in enumerate(items):
+            if weight <= 0:
+                counts[index] = count
+                continue
+
+            count = min(count, capacity // weight)
+            chunk: int = 1
+            while count > 0:
+                # Сдвиг занимает время, пропорциональное вместимости, поэтому время проверяется перед каждой группой
+                if deadline is not None and time.perf_counter() > deadline:
+                    raise SearchTimeoutError()
+                take: int = min(chunk, count)
+                stages.append((index, take, reachable))
+                reachable = (reachable | (reachable << (weight * take))) & mask
+                count -= take
+                chunk <<= 1
+
+        best_sum: int = reachable.bit_length() - 1
+
+        # Восстановим набор: если сумма была достижима до группы - группа не использовалась
+        current_sum: int = best_sum
+        for index, take, before in reversed(stages):
+            if not (before >> current_sum) & 1:
+                counts[index] += take
+                current_sum -= items[index][0] * take
+
+        return best_sum, counts
@@ -0,0 +1,233 @@
+"""
+Модуль для параллельного сравнения алгоритмов расчета распила на воспроизводимых случайных выборках
+"""
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Type
+
+from business.cutting import Cutting
+from business.cut_scheme import CutScheme
+
+
+class StreamingStats:
+    """
+    Класс накапливает значения по мере поступления. Среднее и дисперсия считаются методом Уэлфорда,
+    а для процентилей хранится случайная выборка (reservoir sampling) не больше reservoir_size значений,
+    поэтому память не зависит от количества значений. Пока значений не больше reservoir_size,
+    процентили точные
+
+    Args:
+        reservoir_size (int) - Максимальное количество значений, хранимых для процентилей
+        seed (int) - Зерно генератора, который выбирает значения в выборку
+    """
+    def __init__(self, reservoir_size: int = 10_000, seed: int = 0) -> None:
+        self.__reservoir_size: int = reservoir_size
+        self.__generator: random.Random = random.Random(seed)
+        self.__reservoir: list[float] = list()
+        self.__count: int = 0
+        self.__mean: float = 0.0
+        self.__squares: float = 0.0  # Сумма квадратов отклонений от среднего
+
+    @property
+    def count(self) -> int:
+        """Количество накопленных значений"""
+        return self.__count
+
+    @property
+    def mean(self) -> float:
+        """Среднее арифметическое накопленных значений"""
+        return self.__mean
+
+    @property
+    def variance(self) -> float:
+        """Выборочная дисперсия накопленных значений"""
+        return self.__squares / (self.__count - 1) if self.__count > 1 else 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Метод добавляет значение
+        :param value: Значение
+        :type value: float
+        :return: None
+        """
+        self.__count += 1
+        delta: float = value - self.__mean
+        self.__mean += delta / self.__count
+        self.__squares += delta * (value - self.__mean)
+
+        if len(self.__reservoir) < self.__reservoir_size:
+            self.__reservoir.append(value)
+        else:
+            # Каждое из уже поступивших значений остается в выборке с равной вероятностью
+            index: int = self.__generator.randrange(self.__count)
+            if index < self.__reservoir_size:
+                self.__reservoir[index] = value
+
+    def percentile(self, percent: float) -> float:
+        """
+        Метод возвращает процентиль накопленных значений (метод ближайшего ранга по выборке)
+        :param percent: Процент от 0 до 100
+        :type percent: float
+        :return: Значение процентиля
+        :rtype: float
+        """
+        if not self.__reservoir:
+            return 0.0
+        values: list[float] = sorted(self.__reservoir)
+        rank: int = max(1, math.ceil(percent / 100 * len(values)))
+        return values[rank - 1]
+
+
+def _run_instance(algorithms: list[Type[Cutting]], products: list[float], remnants: list[float],
+                  number_whole_profiles: int, whole_profile_length: float,
+                  min_rest_length: float, print_cut: bool = False) -> list[tuple[str, float, float]]:
+    """
+    Функция считает распил одной выборки всеми алгоритмами (выполняется в процессе-исполнителе)
+    :param algorithms: Классы с алгоритмами
+    :type algorithms: list[Type[Cutting]]
+    :param products: Список изделий
+    :type products: list[float]
+    :param remnants: Список остатков
+    :type remnants: list[float]
+    :param number_whole_profiles: Количество целых профилей
+    :type number_whole_profiles: int
+    :param whole_profile_length: Длина целого профиля
+    :type whole_profile_length: float
+    :param min_rest_length: Минимальная длина остатка
+    :type min_rest_length: float
+    :param print_cut: Если True - печатает распил каждого алгоритма
+    :type print_cut: bool
+    :return: Для каждого алгоритма - имя, процент отхода и время расчета (с)
+    :rtype: list[tuple[str, float, float]]
+    """
+    result: list[tuple[str, float, float]] = list()
+
+    for algorithm in algorithms:
+        start_time: float = time.perf_counter()
+        cut_scheme: CutScheme = algorithm(
+            remnants=remnants, in_products=products, number_whole_profiles=number_whole_profiles,
+            correction=0, whole_profile_length=whole_profile_length, min_rest_length=min_rest_length).cut()
+        latency: float = time.perf_counter() - start_time
+        result.append((algorithm.__name__, cut_scheme.waste()[1], latency))
+        if print_cut:
+            print(f'Распил {algorithm.__name__}:\n{cut_scheme}')
+
+    return result
+
+
+class BenchmarkRunner:
+    """
+    Класс запускает все алгоритмы на одинаковых случайных выборках в пуле процессов и накапливает
+    средний отход, процентили отхода и времени расчета для каждого алгоритма и количества изделий.
+    Выборки зависят только от seed, количества изделий и номера теста, поэтому результат воспроизводим
+
+    Args:
+        algorithms (list[Type[Cutting]]) - Список классов с алгоритмами для тестирования
+        sizes (list[int]) - Количества изделий, для которых проводится тестирование
+        number_tests (int) - Количество тестов на одно количество изделий
+        num_rests (int) - Количество случайных остатков в каждой выборке
+        seed (int) - Зерно генератора случайных выборок
+        workers (Optional[int]) - Количество процессов. Если None - по числу ядер
+        whole_profile_length (float) - Длина целого профиля
+        min_rest_length (float) - Минимальная длина остатка
+    """
+    PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+    def __init__(self, *, algorithms: list[Type[Cutting]], sizes: list[int], number_tests: int = 200,
+                 num_rests: int = 10, seed: int = 0, workers: Optional[int] = None,
+                 whole_profile_length: float = 6, min_rest_length: float = 1) -> None:
+        self.__algorithms: list[Type[Cutting]] = algorithms
+        self.__sizes: list[int] = sizes
+        self.__number_tests: int = number_tests
+        self.__num_rests: int = num_rests
+        self.__seed: int = seed
+        self.__workers: Optional[int] = workers
+        self.__whole_profile_length: float = whole_profile_length
+        self.__min_rest_length: float = min_rest_length
+
+    def generate_instance(self, number_products: int, test: int) -> tuple[list[float], list[float]]:
+        """
+        Метод генерирует выборку изделий и остатков. Одинаковые аргументы всегда дают одинаковую выборку
+        :param number_products: Количество изделий
+        :type number_products: int
+        :param test: Номер теста
+        :type test: int
+        :return: Список изделий и список остатков
+        :rtype: tuple[list[float], list[float]]
+        """
+        generator: random.Random = random.Random(f'{self.__seed}:{number_products}:{test}')
+        products: list[float] = [round(generator.uniform(self.__min_rest_length, self.__whole_profile_length), 3)
+                                 for _ in range(number_products)]
+        remnants: list[float] = [round(generator.uniform(self.__min_rest_length, self.__whole_profile_length), 3)
+                                 for _ in range(self.__num_rests)]
+        return products, remnants
+
+    def run(self, output_file: Optional[str] = None, print_progress: bool = False, print_cut: bool = False) -> dict:
+        """
+        Метод проводит тестирование и, если нужно, сохраняет результат в JSON-файл
+        :param output_file: Имя файла для результата. Если None - результат не сохраняется
+        :type output_file: Optional[str]
+        :param print_progress: Если True - пишет прогресс выполнения
+        :type print_progress: bool
+        :param print_cut: Если True - печатает все распилы
+        :type print_cut: bool
+        :return: Словарь с параметрами тестирования и результатами: results[имя алгоритма][количество изделий] -
+        словарь со средним отходом, процентилями отхода и времени расчета
+        :rtype: dict
+        """
+        stats: dict[tuple[str, int], tuple[StreamingStats, StreamingStats]] = {
+            (algorithm.__name__, size): (StreamingStats(), StreamingStats())
+            for algorithm in self.__algorithms for size in self.__sizes}
+        total_tasks: int = len(self.__sizes) * self.__number_tests
+        done_tasks: int = 0
+
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = dict()
+            for size in self.__sizes:
+                for test in range(self.__number_tests):
+                    products, remnants = self.generate_instance(size, test)
+                    # Цельных профилей столько же, сколько изделий, чтобы хватило наверняка
+                    future = executor.submit(_run_instance, self.__algorithms, products, remnants, size,
+                                             self.__whole_profile_length, self.__min_rest_length, print_cut)
+                    futures[future] = size
+
+            # Результаты накапливаются по мере готовности, а не после окончания всех тестов
+            for future in as_completed(futures):
+                for name, waste, latency in future.result():
+                    waste_stats, latency_stats = stats[(name, futures[future])]
+                    waste_stats.add(waste)
+                    latency_stats.add(latency)
+
+                done_tasks += 1
+                if print_progress and done_tasks % self.__number_tests == 0:
+                    print(f'{done_tasks} / {total_tasks}')
+
+        result: dict = {
+            'params': {
+                'algorithms': [algorithm.__name__ for algorithm in self.__algorithms],
+                'sizes': self.__sizes,
+                'number_tests': self.__number_tests,
+                'num_rests': self.__num_rests,
+                'seed': self.__seed,
+                'whole_profile_length': self.__whole_profile_length,
+                'min_rest_length': self.__min_rest_length
+            },
+            'results': dict()
+        }
+        for (name, size), (waste_stats, latency_stats) in stats.items():
+            cell: dict[str, float] = {'count': waste_stats.count,
+                                      'mean_waste': round(waste_stats.mean, 3),
+                                      'mean_latency': round(latency_stats.mean, 6)}
+            for percent in self.PERCENTILES:
+                cell[f'p{percent}_waste'] = round(waste_stats.percentile(percent), 3)
+                cell[f'p{percent}_latency'] = round(latency_stats.percentile(percent), 6)
+            result['results'].setdefault(name, dict())[str(size)] = cell
+
+        if output_file is not None:
+            with open(output_file, 'w', encoding='utf-8') as file:
+                json.dump(result, file, ensure_ascii=False, indent=2)
+
+        return result
@@ -0,0 +1,98 @@
+"""
+Модуль для сравнения AnnealingCutting и MiddleCutting: зависимость отхода от времени расчета
+"""
+import json
+import time
+
+import matplotlib.pyplot as plt
+
+from business.annealing_cutting import AnnealingCutting
+from business.middle_cutting import MiddleCutting
+from business.tests.benchmark import BenchmarkRunner
+
+
+def waste_time_curves(sizes: list[int], budgets: list[float], number_tests: int = 10, num_rests: int = 20,
+                      workers: int = 0) -> dict[str, dict[int, list[tuple[float, float]]]]:
+    """
+    Функция считает средний процент отхода и среднее время расчета на одинаковых выборках: для MiddleCutting -
+    одну точку, для AnnealingCutting - по точке на каждый бюджет времени. Тесты идут по очереди, чтобы
+    время расчета не искажалось соседними процессами
+    :param sizes: Количества изделий
+    :type sizes: list[int]
+    :param budgets: Бюджеты времени AnnealingCutting в секундах
+    :type budgets: list[float]
+    :param number_tests: Количество тестов на одно количество изделий
+    :type number_tests: int
+    :param num_rests: Количество случайных остатков в каждой выборке
+    :type num_rests: int
+    :param workers: Количество процессов для островов AnnealingCutting
+    :type workers: int
+    :return: Для каждого алгоритма и количества изделий - список точек (время, процент отхода)
+    :rtype: dict[str, dict[int, list[tuple[float, float]]]]
+    """
+    runner: BenchmarkRunner = BenchmarkRunner(algorithms=[], sizes=sizes, num_rests=num_rests)
+    curves: dict[str, dict[int, list[tuple[float, float]]]] = {'MiddleCutting': dict(), 'AnnealingCutting': dict()}
+
+    for size in sizes:
+        instances = [runner.generate_instance(size, test) for test in range(number_tests)]
+        # Изделия короче профиля в несколько раз, чтобы в одном профиле было несколько изделий
+        instances = [([round(product / 2.5, 3) for product in products], remnants)
+                     for products, remnants in instances]
+
+        points: dict[str, list[tuple[float, float]]] = {'MiddleCutting': list(), 'AnnealingCutting': list()}
+        for budget in [None] + budgets:
+            total_waste: float = 0.0
+            total_time: float = 0.0
+            for products, remnants in instances:
+                params: dict = dict(in_products=products, remnants=remnants, correction=0,
+                                    whole_profiles=[(6, size)])
+                start_time: float = time.perf_counter()
+                if budget is None:
+                    cut_scheme = MiddleCutting(**params).cut()
+                else:
+                    cut_scheme = AnnealingCutting(time_budget=budget, workers=workers, **params).cut()
+                total_time += time.perf_counter() - start_time
+                total_waste += cut_scheme.waste()[1]
+
+            name: str = 'MiddleCutting' if budget is None else 'AnnealingCutting'
+            points[name].append((round(total_time / number_tests, 3), round(total_waste / number_tests, 3)))
+            print(f'{name:>16} {size:>4} шт: время {points[name][-1][0]}с, отход {points[name][-1][1]}%')
+
+        for name, name_points in points.items():
+            curves[name][size] = name_points
+
+    return curves
+
+
+def draw_curves(curves: dict[str, dict[int, list[tuple[float, float]]]], file_name: str) -> None:
+    """
+    Функция рисует зависимости отхода от времени расчета для каждого количества изделий
+    :param curves: Результат waste_time_curves()
+    :type curves: dict[str, dict[int, list[tuple[float, float]]]]
+    :param file_name: Имя файла, в котором будет сохранено изображение
+    :type file_name: str
+    :return: None
+    """
+    colors: list[str] = ['red', 'green', 'blue', 'black']
+
+    for name, marker in zip(curves, ['o', 's']):
+        for (size, points), color in zip(curves[name].items(), colors):
+            plt.plot([point[0] for point in points], [point[1] for point in points], marker=marker,
+                     color=color, label=f'{name}, {size} шт')
+
+    plt.xscale('log')
+    plt.xlabel('Среднее время расчета, с')
+    plt.ylabel('Средний процент отхода, %')
+    plt.title('Зависимость отхода от времени расчета')
+    plt.legend()
+    plt.savefig(file_name)
+    plt.close()
+
+
+if __name__ == '__main__':
+    result: dict[str, dict[int, list[tuple[float, float]]]] = waste_time_curves(
+        sizes=[30, 60, 120], budgets=[0.25, 0.5, 1, 2, 4], number_tests=10, workers=4)
+
+    with open('annealing_middle_curves.json', 'w', encoding='utf-8') as file:
+        json.dump(result, file, ensure_ascii=False, indent=2)
+    draw_curves(result, 'annealing_middle_curves.png')
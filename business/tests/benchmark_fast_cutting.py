@@ -0,0 +1,37 @@
+"""
+Модуль для сравнения FastCutting и QuickCutting по отходу и времени расчета на больших нарядах
+"""
+from business.fast_cutting import FastCutting
+from business.quick_cutting import QuickCutting
+from business.tests.benchmark import BenchmarkRunner
+
+
+def print_results(benchmark: dict) -> None:
+    """
+    Функция печатает результаты тестирования таблицей
+    :param benchmark: Результат BenchmarkRunner.run()
+    :type benchmark: dict
+    :return: None
+    """
+    for name, cells in benchmark['results'].items():
+        for size, cell in cells.items():
+            print(f'{name:>12} {size:>6} шт: отход {cell["mean_waste"]:>7}% (p90 {cell["p90_waste"]}%), '
+                  f'время {cell["mean_latency"]:.4f}с (p90 {cell["p90_latency"]:.4f}с)')
+
+
+if __name__ == '__main__':
+    # На средних нарядах сравниваем оба алгоритма
+    print_results(BenchmarkRunner(
+        algorithms=[QuickCutting, FastCutting],
+        sizes=[50, 200, 1000],
+        number_tests=10,
+        num_rests=100
+    ).run(output_file='quick_fast_benchmark.json'))
+
+    # На нарядах из тысяч изделий перебор QuickCutting слишком долгий - считаем только FastCutting
+    print_results(BenchmarkRunner(
+        algorithms=[FastCutting],
+        sizes=[5000, 20000],
+        number_tests=5,
+        num_rests=1000
+    ).run(output_file='fast_benchmark.json'))
@@ -1,11 +1,14 @@
 import random
-from typing import Type
+from typing import Type, Optional
 import time
+import json
 import matplotlib.pyplot as plt
 
 from business.cutting import Cutting
+from business.cut_scheme import CutScheme
 from business.middle_cutting import MiddleCutting
 from business.quick_cutting import QuickCutting
+from business.tests.benchmark import BenchmarkRunner
 
 
 class TestAlgorithm:
@@ -42,7 +45,7 @@ class TestAlgorithm:
         return result_string
 
     def test_selection(self, products: list[float], rests: list[float],
-                       print_result: bool = False) -> dict[tuple[float, int], list[list[float]]]:
+                       print_result: bool = False) -> CutScheme:
         """
         Функция тестирует определенную выборку и выводит распил в терминал
         :param products: Список продуктов
@@ -50,28 +53,29 @@ class TestAlgorithm:
         :param rests: Список остатков
         :type rests: list[float]
         :return: Рассчитанный распил
-        :rtype: dict[tuple[float, int], list[list[float]]]
+        :rtype: CutScheme
         """
         # Сделаем расчет распила
         cutting_object: Cutting = self.__algorithm(
             remnants=rests,
-            products=products,
+            in_products=products,
+            correction=0,
             number_whole_profiles=len(products),
             min_rest_length=self.__min_rest_length,
             whole_profile_length=self.__whole_profile_length
         )
-        res_dict: dict[tuple[float, int], list[list[float]]] = cutting_object.cut()
+        cut_scheme: CutScheme = cutting_object.cut()
 
         if print_result:
-            print(self.beautiful_result(res_dict))
+            print(self.beautiful_result(cut_scheme.cut_scheme))
 
-        return res_dict
+        return cut_scheme
 
-    def calculate_waste(self, cutting_scheme: dict[tuple[float, int], list[list[float]]]) -> float:
+    def calculate_waste(self, cutting_scheme: CutScheme) -> float:
         """
         Метод рассчитывает процент отхода в распиле
         :param cutting_scheme: Схема распила
-        :type cutting_scheme: dict[tuple[float, int], list[list[float]]]
+        :type cutting_scheme: CutScheme
         :return: Процент отхода
         :rtype: float
         """
@@ -79,7 +83,7 @@ class TestAlgorithm:
         current_waste: float = 0.0
         used_leftovers: float = 0.0
 
-        for remnant, lists_products in cutting_scheme.items():
+        for remnant, lists_products in cutting_scheme.cut_scheme.items():
             for products in lists_products:
                 if len(products) != 0:
                     used_leftovers += remnant[0]
@@ -125,20 +129,21 @@ class TestAlgorithm:
             # Посчитаем распил
             middle_cutting: Cutting = self.__algorithm(
                 remnants=random_rests,
-                products=random_products,
+                in_products=random_products,
+                correction=0,
                 number_whole_profiles=num_products)
             if print_full_info:
                 print('Список изделий: {products}\nСписок остатков: {rests}\n'.format(
                     products=random_products,
                     rests=random_rests
                 ))
-            res_dict: dict[tuple[float, int], list[list[float]]] = middle_cutting.cut()
+            cut_scheme: CutScheme = middle_cutting.cut()
 
             # Если нужно, распечатаем распил
             if print_full_info:
-                print('Распил:\n{cutting_scheme}'.format(cutting_scheme=self.beautiful_result(res_dict)))
+                print('Распил:\n{cutting_scheme}'.format(cutting_scheme=cut_scheme))
 
-            percentage_waste: float = self.calculate_waste(res_dict)
+            percentage_waste: float = self.calculate_waste(cut_scheme)
 
             if print_progress:
                 print(f'Отход в данном тесте: {percentage_waste}%\n')
@@ -239,9 +244,7 @@ class TestAllAlgorithm:
 
             # Посчитаем распил
             start_time: float = time.time()
-            cutting_cheme: dict[tuple[float, int], list[list[float]]] = test.test_selection(products=products,
-                                                                                            rests=remnants,
-                                                                                            print_result=print_cut)
+            cutting_cheme: CutScheme = test.test_selection(products=products, rests=remnants, print_result=print_cut)
             # Сохраним результат
             waste: float = test.calculate_waste(cutting_cheme)
             algorithm_wastes.append((algorithm.__name__, waste))
@@ -254,10 +257,12 @@ class TestAllAlgorithm:
 
     def dependence_different_algorithms(self, whole_profile_length: float = 6,
                                         min_remnant_length: float = 1, num_rests: int = 10,
-                                        print_progress: bool = False, print_cut: bool = False
+                                        print_progress: bool = False, print_cut: bool = False, seed: int = 0,
+                                        workers: Optional[int] = None, output_file: Optional[str] = None
                                         ) -> dict[str, dict[int, float]]:
         """
-        Метод рассчитывает зависимости процента отхода от количества изделий в разных алгоритмах
+        Метод рассчитывает зависимости среднего процента отхода от количества изделий в разных алгоритмах.
+        Тесты выполняются параллельно с помощью BenchmarkRunner, а результаты всех тестов усредняются
         :param whole_profile_length: Длина целого профиля
         :type whole_profile_length: float
         :param min_remnant_length: Минимальная длина остатка
@@ -268,37 +273,30 @@ class TestAllAlgorithm:
         :type print_progress: bool
         :param print_cut: Если True, то будут расписываться все распилы
         :type print_cut: bool
+        :param seed: Зерно генератора случайных выборок
+        :type seed: int
+        :param workers: Количество процессов. Если None - по числу ядер
+        :type workers: Optional[int]
+        :param output_file: Имя JSON-файла для полного результата (с процентилями и временем расчета).
+        Если None - результат не сохраняется
+        :type output_file: Optional[str]
         :return: Зависимости в виде словаря словарей. Ключи во внешнем словаре - название класса с алгоритмом,
         значения - словари с зависимостями
         """
-        result_dependence: dict[str, dict[int, float]] = dict()
-
-        for algorithm in self.__algorithms:
-            result_dependence[algorithm.__name__] = dict()
+        runner: BenchmarkRunner = BenchmarkRunner(
+            algorithms=self.__algorithms,
+            sizes=list(range(1, self.__max_num_products + 1)),
+            number_tests=self.__number_tests,
+            num_rests=num_rests,
+            seed=seed,
+            workers=workers,
+            whole_profile_length=whole_profile_length,
+            min_rest_length=min_remnant_length
+        )
+        benchmark: dict = runner.run(output_file=output_file, print_progress=print_progress, print_cut=print_cut)
 
-        for number_products in range(1, self.__max_num_products + 1):
-            if print_progress:
-                print(f'{number_products} / {self.__max_num_products}')
-
-            for _ in range(self.__number_tests):
-                # Сгенерируем случайные продукты и остатки
-                products: list[float] = [round(random.uniform(min_remnant_length, whole_profile_length), 3)
-                                         for _ in range(number_products)]
-                remnants: list[float] = [round(random.uniform(min_remnant_length, whole_profile_length), 3)
-                                         for _ in range(num_rests)]
-                # Добавим в остатки целые профиля, чтобы точно все изделия были посчитаны
-                remnants.extend([whole_profile_length for _ in range(number_products)])
-
-                # Посчитаем для этих данных раскрои и проценты отхода
-                wastes: list[tuple[str, float]] = self.test_all_algorithms(products=products,
-                                                                           remnants=remnants,
-                                                                           print_cut=print_cut)
-                # Добавим их в итоговый словарь
-                for waste in wastes:
-                    # waste[0] - имя алгоритма, waste[1] - процент отхода
-                    result_dependence[waste[0]][number_products] = waste[1]
-
-        return result_dependence
+        return {name: {int(size): cell['mean_waste'] for size, cell in cells.items()}
+                for name, cells in benchmark['results'].items()}
 
     @classmethod
     def draw_graphs(cls, graphs: dict[str, dict[int, float]], file_name: str, show_pict: bool = False) -> None:
@@ -377,6 +375,29 @@ class TestAllAlgorithm:
         # Нарисуем графики
         self.draw_graphs(graphs, output_file, show_pict=show_pict)
 
+    def draw_graphs_from_json(self, input_file: str, output_file: str, metric: str = 'mean_waste',
+                              show_pict: bool = False) -> None:
+        """
+        Метод берет результат BenchmarkRunner из JSON-файла, рисует график и сохраняет рисунок в output_file
+        :param input_file: Имя JSON-файла с результатом тестирования
+        :type input_file: str
+        :param output_file: Имя файла, под которым будет сохранен нарисованный график
+        :type output_file: str
+        :param metric: Показатель для графика: mean_waste, p90_waste, mean_latency, p99_latency и т.д.
+        :type metric: str
+        :param show_pict: Если True, то картинка будет показана
+        :type show_pict: bool
+        :return: None
+        """
+        with open(input_file, 'r', encoding='utf-8') as in_file:
+            benchmark: dict = json.load(in_file)
+
+        graphs: dict[str, dict[int, float]] = {
+            name: {int(size): cell[metric] for size, cell in sorted(cells.items(), key=lambda item: int(item[0]))}
+            for name, cells in benchmark['results'].items()}
+
+        self.draw_graphs(graphs, output_file, show_pict=show_pict)
+
 
 if __name__ == '__main__':
     max_num_products: int = 60
@@ -390,26 +411,11 @@ if __name__ == '__main__':
     max_num_rests: int = 70
     step_num_rests: int = 10
     for num_rests in range(0, max_num_rests, step_num_rests):
-        difference_algorithms: dict[str, dict[int, float]] = test_all_algorithms.dependence_different_algorithms(
+        test_all_algorithms.dependence_different_algorithms(
             print_progress=True,
-            print_cut=False,
-            num_rests=num_rests
+            num_rests=num_rests,
+            output_file=f'quick_middle_dependence_{num_rests}.json'
         )
 
-        test_all_algorithms.draw_graphs(difference_algorithms, f'difference_between_algorithms_{num_rests}.jpg')
-
-        with open(f'quick_middle_dependence_{num_rests}.txt', 'w', encoding='utf-8') as file:
-            print(QuickCutting.__name__, '\t', MiddleCutting.__name__)
-            file.write(f'{QuickCutting.__name__}\t{MiddleCutting.__name__}\n')
-
-            for num in range(1, max_num_products + 1):
-                print('{num}: {quick_cut} | {middle_cut}'.format(
-                    num=num,
-                    quick_cut=difference_algorithms[QuickCutting.__name__][num],
-                    middle_cut=difference_algorithms[MiddleCutting.__name__][num]
-                ))
-                file.write('{num}: {quick_cut} | {middle_cut}\n'.format(
-                    num=num,
-                    quick_cut=difference_algorithms[QuickCutting.__name__][num],
-                    middle_cut=difference_algorithms[MiddleCutting.__name__][num]
-                ))
+        test_all_algorithms.draw_graphs_from_json(f'quick_middle_dependence_{num_rests}.json',
+                                                  f'difference_between_algorithms_{num_rests}.jpg')
@@ -0,0 +1 @@
+"""Модульные тесты пакета business. Запуск: python -m pytest business/tests/unit"""
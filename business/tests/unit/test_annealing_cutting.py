@@ -0,0 +1,20 @@
+"""
+Модуль для тестирования AnnealingCutting
+"""
+from business.annealing_cutting import AnnealingCutting
+from business.cut_scheme import CutScheme
+from business.result_cache import ResultCache
+
+
+def test_annealed_scheme_is_not_cached(tmp_path) -> None:
+    """Схема отжига не помечается как оптимальная и не сохраняется в кэш результатов"""
+    cutting: AnnealingCutting = AnnealingCutting(
+        in_products=[2.5, 2.0, 1.5, 1.0, 0.7], remnants=[3.0], number_whole_profiles=2, correction=0,
+        time_budget=0.1)
+    cut_scheme: CutScheme = cutting.cut()
+
+    assert not cut_scheme.all_proven
+
+    cache: ResultCache = ResultCache(str(tmp_path / 'cache.sqlite'))
+    cache.put(cutting, cut_scheme)
+    assert cache.get(cutting) is None
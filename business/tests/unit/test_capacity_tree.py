@@ -0,0 +1,36 @@
+"""
+Модуль для тестирования CapacityTree
+"""
+import random
+from typing import Optional
+
+from business.capacity_tree import CapacityTree
+
+
+def test_first_fit_returns_first_slot_with_enough_capacity() -> None:
+    """Изделие попадает в профиль с наименьшим номером, где хватает места"""
+    tree: CapacityTree = CapacityTree([3, 7, 5, 9, 2])
+
+    assert tree.first_fit(4) == 1
+    assert tree.first_fit(8) == 3
+    assert tree.first_fit(10) is None
+
+    tree.take(1, 4)
+    assert tree.capacity(1) == 3
+    assert tree.first_fit(4) == 2
+
+
+def test_first_fit_matches_linear_scan() -> None:
+    """Раскладка деревом совпадает с раскладкой простым просмотром профилей по порядку"""
+    generator: random.Random = random.Random(0)
+    capacities: list[int] = [generator.randint(1, 100) for _ in range(37)]
+    tree: CapacityTree = CapacityTree(capacities)
+    free: list[int] = list(capacities)
+
+    for _ in range(200):
+        weight: int = generator.randint(1, 60)
+        expected: Optional[int] = next((slot for slot, capacity in enumerate(free) if capacity >= weight), None)
+        assert tree.first_fit(weight) == expected
+        if expected is not None:
+            tree.take(expected, weight)
+            free[expected] -= weight
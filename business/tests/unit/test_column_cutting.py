@@ -0,0 +1,25 @@
+"""
+Модуль для тестирования ColumnCutting
+"""
+from business.column_cutting import ColumnCutting
+from business.cut_scheme import CutScheme
+
+
+def test_cheaper_longer_profile_wins() -> None:
+    """Более длинный, но более дешевый за метр профиль выгоднее короткого, если остаток после него не в отход"""
+    column: ColumnCutting = ColumnCutting(
+        in_products=[3.0, 3.0], remnants=[], correction=0, cutting_width=0.0, min_rest_length=1.0,
+        whole_profiles=[(6.0, 5, 1.0), (7.0, 5, 0.5)])
+    cut_scheme: CutScheme = column.cut()
+
+    assert cut_scheme.cut_scheme == {(7.0, 1): [[3.0, 3.0]]}
+    assert column.lower_bound == 3.5
+
+
+def test_equal_prices_minimize_length() -> None:
+    """При одинаковой цене за метр выбирается профиль, на который уходит меньше материала"""
+    cut_scheme: CutScheme = ColumnCutting(
+        in_products=[3.0, 3.0], remnants=[], correction=0, cutting_width=0.0, min_rest_length=1.0,
+        whole_profiles=[(6.0, 5, 1.0), (7.0, 5, 1.0)]).cut()
+
+    assert cut_scheme.cut_scheme == {(6.0, 1): [[3.0, 3.0]]}
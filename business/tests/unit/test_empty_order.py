@@ -0,0 +1,27 @@
+"""
+Модуль для тестирования расчета наряда без изделий
+"""
+from typing import Type
+
+import pytest
+
+from business.cut_scheme import CutScheme
+from business.cutting import Cutting
+from business.remnant_inventory import RemnantInventory
+
+
+@pytest.mark.parametrize('algorithm', list(Cutting.algorithms().values()), ids=lambda algorithm: algorithm.__name__)
+def test_empty_order_gives_empty_scheme(algorithm: Type[Cutting]) -> None:
+    """Если изделий нет, то min_product равен None, и любой алгоритм возвращает пустую схему"""
+    cutting: Cutting = algorithm(in_products=[], remnants=[2.0, 3.0], number_whole_profiles=2, correction=0,
+                                 time_budget=0.1)
+    cut_scheme: CutScheme = cutting.cut()
+
+    assert cutting.min_product is None
+    assert cut_scheme.cut_scheme == dict()
+    assert cut_scheme.waste() == (0.0, 0.0)
+
+
+def test_inventory_without_min_value_is_empty() -> None:
+    """Склад для наряда без изделий пуст"""
+    assert not RemnantInventory.from_counts({2.0: 1, 3.0: 2}, min_value=None)
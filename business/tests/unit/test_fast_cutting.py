@@ -0,0 +1,20 @@
+"""
+Модуль для тестирования FastCutting
+"""
+from business.cut_scheme import CutScheme
+from business.fast_cutting import FastCutting
+from business.result_cache import ResultCache
+
+
+def test_heuristic_scheme_is_not_proven(tmp_path) -> None:
+    """Распилы "первого подходящего" не помечаются как оптимальные и не попадают в кэш результатов"""
+    cutting: FastCutting = FastCutting(in_products=[2.5, 2.0, 1.5, 1.0], remnants=[3.0], number_whole_profiles=2,
+                                       correction=0)
+    cut_scheme: CutScheme = cutting.cut()
+
+    assert not cut_scheme.all_proven
+    assert '*' in str(cut_scheme)
+
+    cache: ResultCache = ResultCache(str(tmp_path / 'cache.sqlite'))
+    cache.put(cutting, cut_scheme)
+    assert cache.get(cutting) is None
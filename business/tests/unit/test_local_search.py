@@ -0,0 +1,68 @@
+"""
+Модуль для тестирования LocalSearch.improve()
+"""
+from business.cut_scheme import CutScheme
+from business.local_search import LocalSearch
+from business.quick_cutting import QuickCutting
+
+
+def test_improve_does_not_increase_waste() -> None:
+    """Остатки ровно минимальной длины не должны считаться отходом, и улучшенная схема не хуже исходной"""
+    products: list[float] = [0.31, 0.85, 3.42, 1.49, 2.56, 2.19, 1.57, 1.7, 2.1, 3.45, 2.01, 2.83, 1.27, 2.58, 2.23,
+                             2.68, 3.11, 0.56, 3.39, 2.25]
+    cut_scheme: CutScheme = QuickCutting(
+        in_products=products, remnants=[4.39, 2.13, 5.99, 3.0], number_whole_profiles=100, correction=0,
+        cutting_width=0.0, min_rest_length=1.0).cut()
+
+    improved: CutScheme = LocalSearch(seed=0).improve(cut_scheme)
+
+    assert improved.waste() <= cut_scheme.waste()
+    assert sorted(length for cuttings in improved.cut_scheme.values() for cutting in cuttings
+                  for length in cutting) == sorted(products)
+
+
+def test_improve_returns_input_without_improvement() -> None:
+    """Если улучшить схему нельзя, то возвращается исходная схема"""
+    cut_scheme: CutScheme = QuickCutting(
+        in_products=[2.0, 2.0, 2.0], remnants=[], number_whole_profiles=1, correction=0,
+        cutting_width=0.0, min_rest_length=1.0).cut()
+
+    local_search: LocalSearch = LocalSearch(seed=0)
+
+    assert local_search.improve(cut_scheme) is cut_scheme
+    assert local_search.moves == 0
+
+
+def test_improve_uses_scheme_resolution() -> None:
+    """Изделия сравниваются с профилем с разрешением схемы: на сетке в 1 мм два изделия поместились бы в один
+    профиль, хотя на самом деле они длиннее него"""
+    cut_scheme: CutScheme = QuickCutting(
+        in_products=[0.5004, 0.4998], remnants=[], whole_profiles=[(1.0, 2)], correction=0, cutting_width=0.0,
+        min_rest_length=0.1, resolution=0.0001).cut()
+    assert len(cut_scheme.cut_scheme[(1.0, 2)]) == 2
+
+    improved: CutScheme = LocalSearch(seed=0).improve(cut_scheme)
+
+    for (length, _), cuttings in improved.cut_scheme.items():
+        assert all(sum(cutting) <= length for cutting in cuttings)
+
+
+def test_changed_bars_are_not_proven() -> None:
+    """Распил, измененный локальным поиском, не помечается как доказанно оптимальный"""
+    products: list[float] = [0.31, 0.85, 3.42, 1.49, 2.56, 2.19, 1.57, 1.7, 2.1, 3.45, 2.01, 2.83, 1.27, 2.58, 2.23,
+                             2.68, 3.11, 0.56, 3.39, 2.25]
+    cut_scheme: CutScheme = QuickCutting(
+        in_products=products, remnants=[4.39, 2.13, 5.99, 3.0], number_whole_profiles=100, correction=0,
+        cutting_width=0.0, min_rest_length=1.0).cut()
+    original: dict[float, list[list[float]]] = dict()
+    for (length, _), cuttings in cut_scheme.cut_scheme.items():
+        original.setdefault(length, list()).extend(sorted(cutting) for cutting in cuttings)
+
+    improved: CutScheme = LocalSearch(seed=0).improve(cut_scheme)
+
+    assert improved is not cut_scheme
+    for (length, _), patterns in improved.patterns.items():
+        for pattern in patterns:
+            if pattern.proven:
+                assert sorted(pattern.lengths) in original[length]
+    assert not improved.all_proven
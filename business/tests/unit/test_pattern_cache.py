@@ -0,0 +1,33 @@
+"""
+Модуль для тестирования PatternCache
+"""
+from business.pattern_cache import PatternCache
+
+
+def test_evicts_least_recently_used() -> None:
+    """При переполнении удаляется самый давно использованный результат"""
+    cache: PatternCache = PatternCache(max_size=2)
+    cache.put('a', [1.0])
+    cache.put('b', [2.0])
+    assert cache.get('a') == [1.0]
+
+    cache.put('c', [3.0])
+    assert cache.get('b') is None
+    assert cache.get('a') == [1.0]
+    assert cache.get('c') == [3.0]
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_zero_size_and_clear() -> None:
+    """Кэш нулевого размера ничего не хранит, clear сбрасывает результаты и статистику"""
+    disabled: PatternCache = PatternCache(max_size=0)
+    disabled.put('a', [1.0])
+    assert disabled.get('a') is None
+
+    cache: PatternCache = PatternCache()
+    cache.put('a', [1.0])
+    cache.get('a')
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,46 @@
+"""
+Модуль для тестирования PatternTable
+"""
+import itertools
+import random
+
+from business.pattern_table import PatternTable
+
+
+def brute_force(capacity: int, demand: tuple[tuple[int, int], ...]) -> int:
+    """Максимальное заполнение профиля полным перебором количеств"""
+    return max(total for counts in itertools.product(*(range(number + 1) for _, number in demand))
+               if (total := sum(weight * count for (weight, _), count in zip(demand, counts))) <= capacity)
+
+
+def test_best_fill_matches_brute_force() -> None:
+    """Для любого остатка изделий наряда таблица дает оптимальное заполнение из имеющихся изделий"""
+    generator: random.Random = random.Random(2)
+    for _ in range(20):
+        weights: list[int] = sorted(generator.sample(range(5, 60), generator.randint(2, 4)), reverse=True)
+        order: tuple[tuple[int, int], ...] = tuple((weight, generator.randint(1, 3)) for weight in weights)
+        capacity: int = generator.randint(40, 150)
+        table: PatternTable = PatternTable(capacity, order)
+        assert table.complete
+
+        for _ in range(10):
+            demand: tuple[tuple[int, int], ...] = tuple(
+                (weight, generator.randint(0, number)) for weight, number in order)
+            demand = tuple((weight, number) for weight, number in demand if number > 0)
+            if not demand:
+                continue
+
+            result = table.best_fill(demand)
+            assert result is not None
+            fill, quantities = result
+            available: dict[int, int] = dict(demand)
+            assert fill == brute_force(capacity, demand)
+            assert sum(weight * number for weight, number in quantities) == fill
+            assert all(number <= available[weight] for weight, number in quantities)
+
+
+def test_incomplete_table() -> None:
+    """Если распилов больше max_patterns, то таблица не строится"""
+    table: PatternTable = PatternTable(100, ((7, 50), (5, 50), (3, 50)), max_patterns=10)
+
+    assert not table.complete
@@ -0,0 +1,64 @@
+"""
+Модуль для тестирования правил PresolveCutting
+"""
+from business.cut_scheme import CutScheme
+from business.presolve_cutting import PresolveCutting
+from business.quick_cutting import QuickCutting
+
+
+def scheme_products(cut_scheme: CutScheme) -> list[float]:
+    """Все изделия схемы распила по возрастанию"""
+    return sorted(length for cuttings in cut_scheme.cut_scheme.values() for cutting in cuttings
+                  for length in cutting)
+
+
+def test_exact_fit() -> None:
+    """Остаток, который совпадает с изделием с точностью до ширины реза, распиливается на это изделие"""
+    presolve: PresolveCutting = PresolveCutting(
+        algorithm=QuickCutting, in_products=[2.5, 1.0, 1.2], remnants=[2.502, 4.0], number_whole_profiles=1,
+        correction=0, cutting_width=0.003)
+    cut_scheme: CutScheme = presolve.cut()
+
+    assert presolve.reductions[PresolveCutting.EXACT_FIT] == 1
+    assert presolve.residual_products == 2
+    assert cut_scheme.cut_scheme[(2.502, 1)] == [[2.5]]
+    assert scheme_products(cut_scheme) == [1.0, 1.2, 2.5]
+
+
+def test_fit_single() -> None:
+    """Изделия, которые не помещаются в профиль вместе с другими, распиливаются по одному без алгоритма"""
+    presolve: PresolveCutting = PresolveCutting(
+        algorithm=QuickCutting, in_products=[4.0, 3.0], remnants=[4.5], number_whole_profiles=1, correction=0,
+        cutting_width=0.003, min_rest_length=0.3)
+    cut_scheme: CutScheme = presolve.cut()
+
+    assert presolve.reductions[PresolveCutting.SINGLE] == 2
+    assert presolve.solver is None
+    assert cut_scheme.cut_scheme == {(4.5, 1): [[4.0]], (6.0, 1): [[3.0]]}
+
+
+def test_fit_long() -> None:
+    """Изделие длиннее всех остатков, рядом с которым ничего не помещается, занимает цельный профиль"""
+    presolve: PresolveCutting = PresolveCutting(
+        algorithm=QuickCutting, in_products=[5.6, 0.5, 0.5, 0.5], remnants=[2.0], number_whole_profiles=2,
+        correction=0, cutting_width=0.003)
+    cut_scheme: CutScheme = presolve.cut()
+
+    assert presolve.reductions == {PresolveCutting.EXACT_FIT: 0, PresolveCutting.SINGLE: 0,
+                                   PresolveCutting.LONG: 1}
+    assert [5.6] in cut_scheme.cut_scheme[(6.0, 1)]
+    assert scheme_products(cut_scheme) == [0.5, 0.5, 0.5, 5.6]
+
+
+def test_algorithm_params_override_common_params() -> None:
+    """Аргумент алгоритма с тем же именем, что и общий аргумент, не вызывает ошибку и заменяет общий"""
+    presolve: PresolveCutting = PresolveCutting(
+        algorithm=QuickCutting, algorithm_params={'time_budget': 1.0}, in_products=[1.0, 1.5, 2.0],
+        remnants=[3.0], number_whole_profiles=1, correction=0, time_budget=2.0)
+
+    params: dict = presolve.input_params()
+    presolve.cut()
+
+    assert params['algorithm'] == 'QuickCutting'
+    assert params['algorithm_params'] == {'time_budget': 1.0}
+    assert presolve.solver.time_budget == 1.0
@@ -0,0 +1,44 @@
+"""
+Модуль для тестирования ProductMultiset
+"""
+import pytest
+
+from business.product_multiset import ProductMultiset
+
+
+def test_remove_updates_size_total_and_minimum() -> None:
+    """После удаления распила пересчитываются количество, суммарная длина и самое короткое изделие"""
+    products: ProductMultiset = ProductMultiset([1.0, 2.5, 1.0, 3.0])
+    assert len(products) == 4
+    assert products.minimum == 1.0
+
+    products.remove([1.0, 3.0])
+    assert len(products) == 2
+    assert products[1.0] == 1
+    assert products.total == pytest.approx(3.5)
+    assert products.minimum == 1.0
+
+    products.remove([1.0])
+    assert products.minimum == 2.5
+    assert products.to_list() == [2.5]
+
+
+def test_contains_and_missing_product() -> None:
+    """Распил, для которого не хватает изделий, не содержится в мультимножестве и не удаляется"""
+    products: ProductMultiset = ProductMultiset.from_counts({1.0: 2, 2.0: 1})
+
+    assert products.contains([1.0, 1.0, 2.0])
+    assert not products.contains([2.0, 2.0])
+    with pytest.raises(ValueError):
+        products.remove([3.0])
+
+
+def test_copy_is_independent() -> None:
+    """Изменение копии не меняет исходное мультимножество"""
+    products: ProductMultiset = ProductMultiset([1.0, 2.0])
+    copy: ProductMultiset = products.copy()
+    copy.remove([1.0, 2.0])
+
+    assert not copy
+    assert copy.minimum is None
+    assert sorted(products) == [1.0, 2.0]
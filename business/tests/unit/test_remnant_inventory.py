@@ -0,0 +1,60 @@
+"""
+Модуль для тестирования RemnantInventory
+"""
+import pytest
+
+from business.remnant_inventory import RemnantInventory
+
+
+def test_from_list_groups_and_drops_short_remnants() -> None:
+    """Одинаковые остатки группируются, остатки короче минимальной длины не попадают на склад"""
+    inventory: RemnantInventory = RemnantInventory.from_list([3.0, 1.0, 3.0, 0.2, 2.0], min_value=0.5)
+
+    assert list(inventory) == [(1.0, 1), (2.0, 1), (3.0, 2)]
+    assert (0.2, 1) not in inventory
+    assert inventory.smallest() == (1.0, 1)
+    assert inventory.smallest_fit(1.5) == (2.0, 1)
+    assert inventory.smallest_fit(3.5) is None
+
+
+def test_add_merges_same_length() -> None:
+    """Остатки одной длины, добавленные на склад, хранятся под одним ключом"""
+    inventory: RemnantInventory = RemnantInventory.from_list([6.0, 6.0, 4.0], min_value=0.5)
+    inventory.add(6.0, 3)
+    inventory.add(5.0, 1)
+
+    assert list(inventory) == [(4.0, 1), (5.0, 1), (6.0, 5)]
+    assert inventory.number((6.0, 5)) == 5
+
+
+def test_decrement_and_prune() -> None:
+    """Последний остаток длины удаляет ключ, prune_below убирает короткие остатки"""
+    inventory: RemnantInventory = RemnantInventory.from_list([1.0, 2.0, 2.0, 3.0], min_value=0.5)
+    inventory.decrement((1.0, 1))
+    inventory.decrement((2.0, 2))
+
+    assert list(inventory) == [(2.0, 2), (3.0, 1)]
+    assert inventory.number((2.0, 2)) == 1
+
+    inventory.prune_below(2.5)
+    assert list(inventory) == [(3.0, 1)]
+    with pytest.raises(KeyError):
+        inventory.decrement((2.0, 2))
+
+
+def test_add_keeps_lowest_cost() -> None:
+    """Цельные профили той же длины, что и остатки, берутся по наименьшей цене, то есть бесплатно"""
+    inventory: RemnantInventory = RemnantInventory.from_list([6.0], min_value=0.5)
+    inventory.add(6.0, 2, cost=6.0)
+    inventory.add(7.0, 1, cost=7.0)
+
+    assert inventory.cost((6.0, 3)) == 0.0
+    assert inventory.cost((7.0, 1)) == 7.0
+    assert inventory.cost((8.0, 1)) == 0.0
+
+
+def test_from_counts() -> None:
+    """Склад из словаря количеств совпадает со складом из списка длин"""
+    inventory: RemnantInventory = RemnantInventory.from_counts({3.0: 2, 1.0: 1, 0.2: 4, 2.0: 0}, min_value=0.5)
+
+    assert list(inventory) == list(RemnantInventory.from_list([3.0, 1.0, 3.0, 0.2], min_value=0.5))
@@ -0,0 +1,19 @@
+"""
+Модуль для тестирования ResultCache
+"""
+from business.middle_cutting import MiddleCutting
+from business.presolve_cutting import PresolveCutting
+from business.quick_cutting import QuickCutting
+from business.result_cache import ResultCache
+
+
+def test_make_key_depends_on_wrapped_algorithm() -> None:
+    """Один и тот же наряд, рассчитанный разными алгоритмами внутри PresolveCutting, имеет разные ключи"""
+    params: dict = dict(in_products=[1.0, 1.5, 2.0], remnants=[3.0], number_whole_profiles=1, correction=0)
+
+    quick_key: str = ResultCache.make_key(PresolveCutting(algorithm=QuickCutting, **params))
+    middle_key: str = ResultCache.make_key(PresolveCutting(algorithm=MiddleCutting, **params))
+
+    assert quick_key != middle_key
+    assert quick_key == ResultCache.make_key(PresolveCutting(algorithm=QuickCutting, **params))
+    assert ResultCache.make_key(QuickCutting(**params)) != ResultCache.make_key(MiddleCutting(**params))
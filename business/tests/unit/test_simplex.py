@@ -0,0 +1,41 @@
+"""
+Модуль для тестирования Simplex
+"""
+import pytest
+
+from business.simplex import Simplex
+
+
+def test_solves_known_problem() -> None:
+    """min x1 + x2 при x1 + 2*x2 >= 4, 3*x1 + x2 >= 6, x1 <= 10: оптимум x = (1.6, 1.2)"""
+    simplex: Simplex = Simplex(senses=['>=', '>=', '<='], rhs=[4.0, 6.0, 10.0])
+    simplex.add_column(1.0, [1.0, 3.0, 1.0])
+    simplex.add_column(1.0, [2.0, 1.0, 0.0])
+    simplex.solve()
+
+    assert simplex.feasible
+    assert simplex.objective == pytest.approx(2.8)
+    assert simplex.values() == pytest.approx([1.6, 1.2])
+    assert simplex.duals() == pytest.approx([0.4, 0.2, 0.0])
+
+
+def test_added_column_improves_solution() -> None:
+    """Столбец, добавленный после решения, используется при следующем решении"""
+    simplex: Simplex = Simplex(senses=['>='], rhs=[4.0])
+    simplex.add_column(3.0, [1.0])
+    simplex.solve()
+    assert simplex.objective == pytest.approx(12.0)
+
+    simplex.add_column(5.0, [2.0])
+    simplex.solve()
+    assert simplex.objective == pytest.approx(10.0)
+    assert simplex.values() == pytest.approx([0.0, 2.0])
+
+
+def test_infeasible_problem() -> None:
+    """Если ограничения несовместны, то в базисе остаются искусственные переменные"""
+    simplex: Simplex = Simplex(senses=['>=', '<='], rhs=[5.0, 2.0])
+    simplex.add_column(1.0, [1.0, 1.0])
+    simplex.solve()
+
+    assert not simplex.feasible
@@ -0,0 +1,38 @@
+"""
+Модуль для тестирования SubsetSumEngine
+"""
+import itertools
+import random
+import time
+
+import pytest
+
+from business.business_exceptions import SearchTimeoutError
+from business.subset_sum import SubsetSumEngine
+
+
+def brute_force(capacity: int, items: list[tuple[int, int]]) -> int:
+    """Максимальная сумма весов не больше вместимости полным перебором количеств"""
+    return max(total for counts in itertools.product(*(range(number + 1) for _, number in items))
+               if (total := sum(weight * count for (weight, _), count in zip(items, counts))) <= capacity)
+
+
+def test_best_fill_matches_brute_force() -> None:
+    """Найденная сумма оптимальна, а количества изделий не превышают имеющиеся и дают эту сумму"""
+    generator: random.Random = random.Random(1)
+    for _ in range(50):
+        items: list[tuple[int, int]] = [(generator.randint(3, 40), generator.randint(1, 4))
+                                        for _ in range(generator.randint(1, 4))]
+        capacity: int = generator.randint(0, 120)
+
+        best_sum, counts = SubsetSumEngine.best_fill(capacity, items)
+
+        assert best_sum == brute_force(capacity, items)
+        assert sum(weight * count for (weight, _), count in zip(items, counts)) == best_sum
+        assert all(0 <= count <= number for (_, number), count in zip(items, counts))
+
+
+def test_best_fill_raises_after_deadline() -> None:
+    """После deadline поиск прекращается исключением"""
+    with pytest.raises(SearchTimeoutError):
+        SubsetSumEngine.best_fill(1000, [(7, 10)], deadline=time.perf_counter() - 1)
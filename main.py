@@ -1,8 +1,11 @@
+from multiprocessing import freeze_support
+
 import view.main as main_window
 from loguru import logger
 
 
 if __name__ == '__main__':
+    freeze_support()  # Нужно для процессов расчета в приложении, собранном pyinstaller
     logger.add('logging.log', rotation='1 week', backtrace=True, diagnose=True,
                format="<level>{level}</level>| <magenta>{time:DD.MM.YYYY H:m:s}</magenta>| "
                "<level>{message}</level>")
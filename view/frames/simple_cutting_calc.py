@@ -11,14 +11,21 @@ from re import Match
 from loguru import logger
 
 from view.lexicon.lexicon_ru import LABELS, BUTTONS, ERROR_LABELS, TOOLTIPS
-from view.view_exceptions import InputListWidthException, InputIntExc, InputFloatExc
+from view.view_exceptions import InputListWidthException, InputIntExc, InputFloatExc, InputWholeProfilesException
 from view.frames.result_cut_window import window_with_cut_cheme
 from view.frames.tooltips import get_help_tooltip
 from business.cutting import Cutting
 from business.quick_cutting import QuickCutting
 from business.middle_cutting import MiddleCutting
+from business.portfolio_cutting import PortfolioCutting
+from business.presolve_cutting import PresolveCutting
 from business.cut_scheme import CutScheme, WrongSchemeError
 from business.business_exceptions import NoRemnantsError
+from business.result_cache import ResultCache
+
+CALC_TIME_BUDGET: float = 2.0  # Время на расчет распила (с), после него оставшиеся остатки распиливаются жадно
+PORTFOLIO_DEADLINE: float = 5.0  # Время на расчет всеми алгоритмами сразу (с), после него медленные останавливаются
+RESULT_CACHE_PATH: str = 'results_cache.sqlite'  # Файл с ранее рассчитанными схемами (рядом с logging.log)
 
 
 class SimpleCutCalc:
@@ -33,11 +40,11 @@ class SimpleCutCalc:
         self.__frame: Frame = Frame(notebook)
         self.__input_products_text: Optional[ScrolledText] = None
         self.__input_remnants_text: Optional[ScrolledText] = None
+        self.__input_whole_profiles_text: Optional[ScrolledText] = None
         self.__correction: StringVar = StringVar()
         self.__min_remnant: StringVar = StringVar()
-        self.__whole_profile_len: StringVar = StringVar()
-        self.__number_whole_profiles: StringVar = StringVar()
         self.__cutting_width: StringVar = StringVar()
+        self.__result_cache: ResultCache = ResultCache(RESULT_CACHE_PATH)
 
     def get_frame(self) -> Frame:
         # 1) Ввод ширин изделий из наряда
@@ -56,16 +63,26 @@ class SimpleCutCalc:
         self.__input_remnants_text = ScrolledText(
             self.__frame, width=50, height=5)
 
-        # 3) Добавим кнопки для расчета и и сброса введенных данных
+        # 3) Ввод видов цельных профилей
+        whole_profiles_frame: Frame = Frame(self.__frame)
+        input_whole_profiles_label: Label = Label(whole_profiles_frame, text=LABELS['input_whole_profiles'])
+        help_whole_profiles: Label = get_help_tooltip(whole_profiles_frame,
+                                                      tooltip_text=TOOLTIPS['input_whole_profiles'])
+
+        self.__input_whole_profiles_text = ScrolledText(
+            self.__frame, width=50, height=3)
+
+        # 4) Добавим кнопки для расчета и и сброса введенных данных
         frame_with_buttons: Frame = Frame(self.__frame)
 
         buttons: list[Button] = [
             Button(frame_with_buttons, text=BUTTONS['quick_calc'], command=self.__calc_cut(QuickCutting)),
             Button(frame_with_buttons, text=BUTTONS['middle_calc'], command=self.__calc_cut(MiddleCutting)),
+            Button(frame_with_buttons, text=BUTTONS['best_calc'], command=self.__calc_cut(PortfolioCutting)),
             Button(frame_with_buttons, text=BUTTONS['reset'], command=self.__reset_button),
         ]
 
-        # 4) Упакуем ввод изделий
+        # 5) Упакуем ввод изделий
         products_frame.pack(anchor='nw', padx=5, pady=5)
         input_products_label.grid(row=0, column=0, padx=5, pady=5)
         help_products.grid(row=0, column=1, padx=1, pady=5)
@@ -75,13 +92,16 @@ class SimpleCutCalc:
         input_remnants_label.grid(row=0, column=0, padx=5, pady=5)
         help_remnants.grid(row=0, column=1, padx=1, pady=5)
         self.__input_remnants_text.pack(anchor='nw', padx=5, pady=5)
+        # Упакуем ввод цельных профилей
+        whole_profiles_frame.pack(anchor='nw', padx=5, pady=5)
+        input_whole_profiles_label.grid(row=0, column=0, padx=5, pady=5)
+        help_whole_profiles.grid(row=0, column=1, padx=1, pady=5)
+        self.__input_whole_profiles_text.pack(anchor='nw', padx=5, pady=5)
 
-        # 5) Ввод основных параметров
+        # 6) Ввод основных параметров
         grid_data: list[tuple[str, StringVar]] = [
             ('input_correction', self.__correction),
             ('input_min_remnant', self.__min_remnant),
-            ('input_whole_profile', self.__whole_profile_len),
-            ('input_number_profiles', self.__number_whole_profiles),
             ('input_cutting_width', self.__cutting_width)
         ]
 
@@ -108,29 +128,35 @@ class SimpleCutCalc:
         return self.__frame
 
     @classmethod
-    def __check_format_list_width(cls, profiles: ScrolledText, title_error: str) -> list[float]:
+    def __check_format_list_width(cls, profiles: ScrolledText, title_error: str) -> dict[float, int]:
         """
         Метод проверяет корректность ввода ширин нескольких изделий или остатков.
-        Введенная строка должна представлять собой числа с плавающей точкой, разделенные пробелами
+        Введенная строка должна представлять собой числа с плавающей точкой, разделенные пробелами.
+        Несколько одинаковых ширин можно записать как ширина x количество, например 1.25x40
         :param profiles: Объект окна, в которое вводили список ширин
         :type profiles: ScrolledText
         :param title_error: Название окна, в котором будет отображаться ошибка
         :type title_error: str
         :raise InputListWidthException: Если ввод пустой или не корректен
-        :return: Список введенных ширин
-        :rtype: list[float]
+        :return: Введенные ширины и их количества
+        :rtype: dict[float, int]
         """
         profiles_str: str = profiles.get('1.0', 'end-1c')  # По этим индексам будет считан весь текст
         numbers_str: list[str] = profiles_str.split()
+        result: dict[float, int] = dict()
 
         for number in numbers_str:
-            match: Optional[Match[str]] = re.search(r'\d+\.?\d*', number)
+            # Латинская и русская "х", а также "*" и "×" обозначают количество
+            match: Optional[Match[str]] = re.fullmatch(r'(\d+\.?\d*)(?:[xXхХ*×](\d+))?', number)
 
             # Если хотя бы одно слово не является числом - выбрасываем ошибку
-            if not match or match.end() != len(number):
+            if not match:
                 raise InputListWidthException(profiles_str, number, title_error)
 
-        return [float(profile) for profile in numbers_str]
+            width: float = float(match.group(1))
+            result[width] = result.get(width, 0) + (int(match.group(2)) if match.group(2) is not None else 1)
+
+        return result
 
     @classmethod
     def __check_param(cls, param: StringVar, param_name: str) -> float:
@@ -154,21 +180,35 @@ class SimpleCutCalc:
 
         return float(param_str)
 
-    def __check_number_whole_profiles(self) -> int:
+    @classmethod
+    def __check_whole_profiles(cls, profiles: ScrolledText, title_error: str) -> list[tuple[float, int, float]]:
         """
-        Метод для проверки корректности введенного количества целых профилей
-        :raise InputIntExc: Если введенное значение не является вещественным числом
-        :return: Введенное количество целых профилей
-        :rtype: int
+        Метод проверяет корректность ввода видов цельных профилей. Каждая непустая строка должна содержать
+        длину профиля, количество профилей и, необязательно, цену за метр
+        :param profiles: Объект окна, в которое вводили виды цельных профилей
+        :type profiles: ScrolledText
+        :param title_error: Название окна, в котором будет отображаться ошибка
+        :type title_error: str
+        :raise InputWholeProfilesException: Если ввод не корректен
+        :return: Список видов цельных профилей: длина, количество и цена за метр
+        :rtype: list[tuple[float, int, float]]
         """
-        numer_whole_profiles: str = self.__number_whole_profiles.get()
+        profiles_str: str = profiles.get('1.0', 'end-1c')  # По этим индексам будет считан весь текст
+        result: list[tuple[float, int, float]] = list()
+
+        for line in profiles_str.splitlines():
+            if not line.strip():
+                continue
+            match: Optional[Match[str]] = re.fullmatch(r'\s*(\d+\.?\d*)\s+(\d+)(?:\s+(\d+\.?\d*))?\s*', line)
+
+            # Если строка не соответствует формату - выбрасываем ошибку
+            if not match:
+                raise InputWholeProfilesException(profiles_str, line, title_error)
 
-        if not numer_whole_profiles.isdigit():
-            raise InputIntExc(
-                title=ERROR_LABELS['number_whole_profiles'],
-                wrong_input=numer_whole_profiles)
+            result.append((float(match.group(1)), int(match.group(2)),
+                           float(match.group(3)) if match.group(3) is not None else 1.0))
 
-        return int(numer_whole_profiles)
+        return result
 
     def __calc_cut(self, algorithm: Type[Cutting]) -> Callable:
         """
@@ -180,27 +220,43 @@ class SimpleCutCalc:
         def __calc_cut_with_algorithm() -> None:
             # Проверим введенные данные
             try:
-                products: list[float] = self.__check_format_list_width(
+                products: dict[float, int] = self.__check_format_list_width(
                     self.__input_products_text, ERROR_LABELS['products'])
-                remnants: list[float] = self.__check_format_list_width(
+                remnants: dict[float, int] = self.__check_format_list_width(
                     self.__input_remnants_text, ERROR_LABELS['remnants'])
                 corr: float = self.__check_param(self.__correction, ERROR_LABELS['correction'])
 
                 if products is not None and remnants is not None:
-                    algorithm_cut: Cutting = algorithm(
+                    # Портфелю алгоритмов нужно общее время на расчет
+                    extra_params: dict = {'deadline': PORTFOLIO_DEADLINE} if algorithm is PortfolioCutting else dict()
+                    # Изделия, для которых профиль выбирается без перебора, распределяются до запуска алгоритма
+                    algorithm_cut: PresolveCutting = PresolveCutting(
+                        algorithm=algorithm,
+                        algorithm_params=extra_params,
                         remnants=remnants,
                         in_products=products,
                         correction=corr,
                         min_rest_length=self.__check_param(self.__min_remnant, ERROR_LABELS['min_remnant']),
-                        whole_profile_length=self.__check_param(
-                            self.__whole_profile_len, ERROR_LABELS['whole_profile']),
-                        number_whole_profiles=self.__check_number_whole_profiles(),
-                        cutting_width=self.__check_param(self.__cutting_width, ERROR_LABELS['cut_width'])
+                        whole_profiles=self.__check_whole_profiles(
+                            self.__input_whole_profiles_text, ERROR_LABELS['whole_profiles']),
+                        cutting_width=self.__check_param(self.__cutting_width, ERROR_LABELS['cut_width']),
+                        time_budget=CALC_TIME_BUDGET
                     )
                     logger.success('Данные введены верно!')
+                    # Если такой наряд уже считали - возьмем схему из кэша
+                    cut_scheme: Optional[CutScheme] = self.__result_cache.get(algorithm_cut)
+                    if cut_scheme is None:
+                        cut_scheme = algorithm_cut.cut()
+                        self.__result_cache.put(algorithm_cut, cut_scheme)
+                        logger.success('Схема распила рассчитана верно!')
+                        logger.info(algorithm_cut.summary())
+                        if isinstance(algorithm_cut.solver, PortfolioCutting):
+                            for entry in algorithm_cut.solver.results.values():
+                                logger.info(entry.__str__())
+                            logger.info(f'Выбран распил алгоритма {algorithm_cut.solver.winner}')
+                    else:
+                        logger.success('Схема распила взята из кэша')
                     # Распечатаем схему распила
-                    cut_scheme: CutScheme = algorithm_cut.cut()
-                    logger.success('Схема распила рассчитана верно!')
                     window_with_cut_cheme(cut_scheme, title=f'Схема распила: {algorithm.__name__}')
 
             except (InputFloatExc, InputIntExc) as exc:
@@ -210,7 +266,7 @@ class SimpleCutCalc:
                     title=ERROR_LABELS['error_input'] + exc.title,
                     message=exc.__str__()
                 )
-            except InputListWidthException as exc:
+            except (InputListWidthException, InputWholeProfilesException) as exc:
                 logger.warning(exc.__str__())
 
                 msg_box.showerror(
@@ -236,10 +292,10 @@ class SimpleCutCalc:
             self.__input_products_text.delete('1.0', 'end-1c')
         if self.__input_remnants_text is not None:
             self.__input_remnants_text.delete('1.0', 'end-1c')
+        if self.__input_whole_profiles_text is not None:
+            self.__input_whole_profiles_text.delete('1.0', 'end-1c')
         self.__correction.set('')
         self.__min_remnant.set('')
-        self.__whole_profile_len.set('')
-        self.__number_whole_profiles.set('')
         self.__cutting_width.set('')
 
 
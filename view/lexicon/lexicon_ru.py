@@ -7,6 +7,7 @@ BUTTONS: dict[str, str] = {
     'total_cutting': 'Раскрой и распил',
     'quick_calc': 'Быстрый расчет',
     'middle_calc': 'Точный расчет',
+    'best_calc': 'Лучший расчет',
     'reset': 'Сбросить',
     'save': 'Сохранить'
 }
@@ -20,8 +21,7 @@ LABELS: dict[str, str] = {
     'input_remnants': 'Введите ширины имеющихся остатков (м):',
     'input_correction': 'Введите поправку к ширине изделий (м):',
     'input_min_remnant': 'Введите минимальную длину остатка (м):',
-    'input_whole_profile': 'Введите длину целого профиля (м):',
-    'input_number_profiles': 'Введите количество целых профилей в наличии (шт):',
+    'input_whole_profiles': 'Введите целые профили в наличии: длина (м), количество (шт), цена за метр:',
     'input_cutting_width': 'Введите ширину реза (м):',
     'text_result': 'Схема распила:',
     'total_waste': 'Суммарный отход (м):',
@@ -32,8 +32,7 @@ ERROR_LABELS: dict[str, str] = {
     'error_input': 'Ошибка ввода параметра: ',
     'min_remnant': 'Минимальная длина остатка',
     'correction': 'Поправка к ширине изделия',
-    'whole_profile': 'Длина целого профиля',
-    'number_whole_profiles': 'Количество целых профилей должно быть целым числом!',
+    'whole_profiles': 'Ошибка ввода ЦЕЛЫХ ПРОФИЛЕЙ',
     'cut_width': 'Ширина реза',
     'float_error': 'Параметр должен быть вещественным числом (числом с плавающей точкой)!',
     'products': 'Ошибка ввода списка ширин ИЗДЕЛИЙ',
@@ -44,11 +43,13 @@ TOOLTIPS: dict[str, str] = {
     'input_products': 'Перечислите ширины изделий, как указано в наряде.\n'
                       'Размеры пишутся в метрах, дробная часть пишется через точку,\n'
                       'размеры перечисляются  через пробел или с новой строки.\n'
-                      'Пример:\n1.1 2.2 3.3\n4.4 5.5\n6.6',
+                      'Несколько одинаковых изделий можно записать как размер x количество.\n'
+                      'Пример:\n1.1 2.2 3.3\n4.4 5.5\n6.6 1.25x40',
     'input_remnants': 'Перечислите ширины имеющихся остатков.\n'
                       'Размеры пишутся в метрах, дробная часть пишется через точку,\n'
                       'размеры перечисляются через пробел или с новой строки.\n'
-                      'Пример:\n1.1 2.2 3.3\n4.4 5.5\n6.6',
+                      'Несколько одинаковых остатков можно записать как размер x количество.\n'
+                      'Пример:\n1.1 2.2 3.3\n4.4 5.5\n6.6 2.5x3',
     'input_correction': 'Поправка к ширине - это величина, на которую размер длинной\n'
                         'детали отличается от размера изделия в наряде.\n'
                         'Дробное число необходимо ввести через точку.'
@@ -59,9 +60,11 @@ TOOLTIPS: dict[str, str] = {
                          'Например, остатки профилей для вертикальных жалюзи,\n'
                          'короче 0.5 м идут в отход.\n'
                          '0.5 м в этом случае - минимальная длина остатка.',
-    'input_whole_profile': 'Длина целого профиля.\n'
-                           'Например, длина целого профиля для вертикальных жалюзи - 6 м',
-    'input_number_profiles': 'Количество имеющихся (без браков) целых профилей',
+    'input_whole_profiles': 'Виды имеющихся (без браков) целых профилей, по одному виду в строке.\n'
+                            'В строке через пробел пишутся длина профиля (м), количество профилей (шт)\n'
+                            'и, если нужно, цена за метр. Без цены все профили считаются одинаково дорогими.\n'
+                            'При равном отходе выбирается более дешевый профиль.\n'
+                            'Пример:\n6 10\n6.5 5 1.1\n7 3 1.2',
     'input_cutting_width': 'Ширина реза - ширина разреза пилы.\n'
                            'Например, ширина разреза циркулярной пилы примерно равна 0.003 м'
 }
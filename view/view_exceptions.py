@@ -24,11 +24,37 @@ class InputListWidthException(Exception):
 
     def __str__(self) -> str:
         return ('Неправильный формат ввода списка ширин. Введенная строка должна представлять '
-                'собой числа с плавающей точкой, разделенных пробелом.\n'
+                'собой числа с плавающей точкой, разделенных пробелом. Одинаковые ширины можно записать '
+                'как ширина x количество, например 1.25x40.\n'
                 f'Введенная строка: {self.__list_width_str}\n'
                 f'Место выброса ошибки: {self.__wrong_width}')
 
 
+class InputWholeProfilesException(Exception):
+    """
+    Класс - исключение. Выбрасывается при некорректном вводе видов цельных профилей
+
+    Args:
+        text_profiles (str) - Введенные данные
+        wrong_line (str) - Строка, в которой выбросилось исключение
+        title (str) - Название окна, в котором будет отображаться ошибка
+    """
+    def __init__(self, text_profiles: str, wrong_line: str, title: str):
+        self.__text_profiles: str = text_profiles
+        self.__wrong_line: str = wrong_line
+        self.__title: str = title
+
+    @property
+    def title(self) -> str:
+        return self.__title
+
+    def __str__(self) -> str:
+        return ('Неправильный формат ввода цельных профилей. Каждая строка должна содержать длину профиля, '
+                'количество профилей и, если нужно, цену за метр, разделенные пробелом.\n'
+                f'Введенная строка: {self.__text_profiles}\n'
+                f'Место выброса ошибки: {self.__wrong_line}')
+
+
 class InputException(Exception, ABC):
     """
     Класс - исключение. От него будут наследоваться исключения ошибки ввода целых и вещественных чисел